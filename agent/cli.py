@@ -275,7 +275,7 @@ def run_full_pipeline(task: str, repo_path: str = ".", dry_run: bool = False,
     from agent.planning.intent import IntentClassifier
     from agent.state import AgentState, validate_transition
     from agent.mechanisms.risk_budget import RiskBudget
-    from agent.security.preconditions import PreconditionChecker
+    from agent.security.preconditions import get_git_head
 
     config = AgentConfig()
     
@@ -343,7 +343,7 @@ def run_full_pipeline(task: str, repo_path: str = ".", dry_run: bool = False,
 
     # ── Step 3: Precondition Checks ──
     print("─── Step 3: Precondition Checks ───")
-    head = PreconditionChecker.get_git_head(repo_path)
+    head = get_git_head(repo_path)
     git_ok = head != "unknown_or_no_git"
     print(f"  Git consistency: {'✅' if git_ok else '⚠️  Not a git repo'}")
     exec_log.add("preconditions", "pass" if git_ok else "warn",
@@ -43,7 +43,7 @@ console = Console(theme=custom_theme)
 
 from agent.planning.agents_loader import inject_agents_md
 from agent.core.context_manager import trim_history, estimate_tokens, estimate_message_tokens
-from agent.core.session_store import save_message, save_session_meta, session_path
+from agent.core.session_store import save_message, save_session_meta, session_path, update_session_meta
 from agent.planning.session_state_manager import SessionStateManager
 from agent.core.logger import HumanReadableLogger
 
@@ -139,24 +139,49 @@ class ChatSession:
     remembers context — like Copilot or Windsurf.
     """
 
-    def __init__(self, provider, repo_path: str):
+    def __init__(self, provider, repo_path: str, session_id: Optional[str] = None):
         self._provider = provider
         self._repo_path = os.path.abspath(repo_path)
         self._messages: list[ChatMessage] = []
         self._turn_count = 0
-        self._session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # An existing id resumes that session (see resume); its meta file
+        # is already on disk
+        resuming = session_id is not None
+        self._session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
         self._repo_context = ""
+        self._file_count = 0         # Repo stats from the last _load_repo_context
+        self._stack = "Unknown"
         self._last_plan = None
         self._last_error = None
         self.last_action_success = True
         self.interactive_mode = False  # Toggle for Co-Pilot behavior
         
         # Save session metadata for resume listing
-        save_session_meta(self._session_id, self._repo_path, getattr(self._provider.config.llm, "model", "default"))
+        if not resuming:
+            save_session_meta(self._session_id, self._repo_path, getattr(self._provider.config.llm, "model", "default"))
 
         self.state_manager = SessionStateManager(self._repo_path, self._provider)
         self.readable_logger = HumanReadableLogger(self._repo_path)
 
+    @classmethod
+    def resume(cls, provider, meta: dict, history: list[dict]) -> "ChatSession":
+        """Rebuild a saved session from its meta file and message history."""
+        session = cls(provider, meta["repo_path"], session_id=meta["session_id"])
+        session._messages = [
+            ChatMessage(role=m["role"], content=m["content"])
+            for m in history
+        ]
+        session.interactive_mode = meta.get("interactive_mode", False)
+        return session
+
+    def set_interactive_mode(self, enabled: bool):
+        """Switch Co-Pilot mode and record it, so a resumed session keeps it."""
+        self.interactive_mode = enabled
+        try:
+            update_session_meta(self._session_id, interactive_mode=enabled)
+        except OSError as e:
+            logger.debug(f"Could not save session mode: {e}")
+
 
 
     # ── Repo Context ─────────────────────────────────────────
@@ -191,6 +216,8 @@ class ChatSession:
             logger.warning(f"Repo context load failed: {e}")
             file_tree = ["(Could not scan repo)"]
 
+        self._file_count = file_count
+        self._stack = stack
         self._repo_context = CONTEXT_TEMPLATE.format(
             repo_path=self._repo_path,
             file_count=file_count,
@@ -627,10 +654,10 @@ class ChatSession:
             if len(parts) > 1:
                 mode = parts[1].lower()
                 if mode in ("interactive", "i", "copilot"):
-                    self.interactive_mode = True
+                    self.set_interactive_mode(True)
                     return "🎛️  Switched to **Interactive Mode**. I will ask for approval before executing steps."
                 elif mode in ("auto", "a", "god"):
-                    self.interactive_mode = False
+                    self.set_interactive_mode(False)
                     return "🚀 Switched to **Auto Mode**. I will execute autonomously."
             return f"Current mode: **{'Interactive' if self.interactive_mode else 'Auto'}**"
 
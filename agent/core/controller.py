@@ -14,7 +14,7 @@ from typing import Optional, Any
 from agent.state import AgentState, TaskIntent, StateSnapshot, validate_transition, AgentContext
 from agent.mechanisms.risk_budget import RiskBudget
 from agent.mechanisms.decision_logger import DecisionLogger
-from agent.security.preconditions import PreconditionChecker
+from agent.security.preconditions import get_git_head, check_git_consistency, check_file_consistency
 
 
 class StateMachineController:
@@ -64,7 +64,8 @@ class StateMachineController:
         # A. Start of Task Logic (IDLE -> INTENT_ANALYSIS)
         if self.state == AgentState.IDLE and target_state == AgentState.INTENT_ANALYSIS:
             self.context.clear()
-            self.context.initial_git_head = PreconditionChecker.get_git_head()
+            get_git_head.cache_clear()
+            self.context.initial_git_head = get_git_head()
             self.logger.logger.info(f"Captured initial Git HEAD: {self.context.initial_git_head}")
 
         # B. Anti-Drift Gate (Any -> IMPLEMENTING)
@@ -109,13 +110,13 @@ class StateMachineController:
         
         # 1. Check Git Consistency
         if self.context.initial_git_head:
-            git_violation = PreconditionChecker.check_git_consistency(self.context.initial_git_head)
+            git_violation = check_git_consistency(self.context.initial_git_head)
             if git_violation:
                 violations.append(git_violation)
                 
         # 2. Check File Consistency (if we have planned files)
         if self.context.initial_file_checksums:
-            file_violations = PreconditionChecker.check_file_consistency(self.context.initial_file_checksums)
+            file_violations = check_file_consistency(self.context.initial_file_checksums)
             violations.extend(file_violations)
             
         if violations:
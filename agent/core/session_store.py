@@ -53,6 +53,28 @@ def save_session_meta(session_id: str, repo_path: str, model: str) -> None:
         json.dump(meta, f, indent=2)
 
 
+def update_session_meta(session_id: str, **fields) -> None:
+    """Merge fields (e.g. interactive_mode) into an existing .meta.json file."""
+    meta_path = _ensure_dir() / f"{session_id}.meta.json"
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return
+    meta.update(fields)
+    with open(meta_path, "w") as f:
+        json.dump(meta, f, indent=2)
+
+
+def load_session_meta(session_id: str) -> dict:
+    """Load the .meta.json sidebar file written by save_session_meta."""
+    meta_path = _ensure_dir() / f"{session_id}.meta.json"
+    if not meta_path.exists():
+        raise FileNotFoundError(f"Session not found: {session_id}")
+    with open(meta_path) as f:
+        return json.load(f)
+
+
 def load_session(session_id: str) -> list[dict]:
     """Load all messages from a session file."""
     path = session_path(session_id)
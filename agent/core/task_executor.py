@@ -26,6 +26,7 @@ from __future__ import annotations
 
 import os
 import json
+import asyncio
 import subprocess
 import signal
 import sys
@@ -232,11 +233,31 @@ class TaskExecutor:
 
     @property
     def visual_tool(self):
-        return self._plugin_loader.get_instance("visual")
+        tool = self._plugin_loader.get_instance("visual")
+        if tool is not None and tool.browser is None:
+            # Share the browser tester (and its warm browser) with the visual tool
+            tool.browser = self.browser_tester
+        return tool
 
     @property
     def security_advisor(self):
-        return self._plugin_loader.get_instance("security_advisor")
+        advisor = self._plugin_loader.get_instance("security_advisor")
+        if advisor is not None and advisor.provider is None:
+            advisor.provider = self._provider
+        return advisor
+
+    @staticmethod
+    def _advise_all(advisor, items: list[dict]) -> list:
+        """
+        Advisor verdicts for items, in order. All packages are consulted
+        concurrently, except on a thread already running an event loop
+        (asyncio.run can't nest there), where they are asked one by one.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(advisor.advise_many(items))
+        return [advisor.advise(**item) for item in items]
     
     def add_feedback(self, feedback: str):
         """Add additional user comments or tasks to the current context."""
@@ -1117,7 +1138,8 @@ class TaskExecutor:
         url = f"http://localhost:{port}"
         print(f"  👁️  Visual Verification on {url}...")
         
-        b64_img = self.browser_tester.take_screenshot_base64(url)
+        # Always a new capture: a cached one may predate the fix being verified
+        b64_img = self.browser_tester.take_screenshot_base64(url, fresh=True)
         if not b64_img:
              print("  ❌ Failed to capture screenshot")
              return False
@@ -1563,23 +1585,32 @@ class TaskExecutor:
             suspicious = [r for r in results if r.is_suspicious]
             
             if suspicious:
-                advisor = SecurityAdvisor(self._provider)
+                advisor = self.security_advisor
                 revalidated_suspicious = []
-                
-                for s in suspicious:
-                    advice = advisor.advise(
-                        package=s.name,
-                        heuristic_reason=s.reason,
-                        task=task,
-                        stack=plan.stack
-                    )
-                    
-                    if advice.decision == "SAFE":
-                        print(f"  🛡️  Advisor: '{s.name}' is SAFE ({advice.reasoning})")
-                    else:
-                        print(f"  ❌ {s.name}: {s.reason} — Advisor confirms: {advice.decision} ({advice.reasoning})")
-                        revalidated_suspicious.append(s)
-                
+
+                if advisor is None:
+                    # No second opinion available: the heuristic verdict stands
+                    revalidated_suspicious = list(suspicious)
+                    for s in suspicious:
+                        print(f"  ❌ {s.name}: {s.reason}")
+                else:
+                    advices = self._advise_all(advisor, [
+                        {
+                            "package": s.name,
+                            "heuristic_reason": s.reason,
+                            "task": task,
+                            "stack": plan.stack,
+                        }
+                        for s in suspicious
+                    ])
+
+                    for s, advice in zip(suspicious, advices):
+                        if advice.decision == "SAFE":
+                            print(f"  🛡️  Advisor: '{s.name}' is SAFE ({advice.reasoning})")
+                        else:
+                            print(f"  ❌ {s.name}: {s.reason} — Advisor confirms: {advice.decision} ({advice.reasoning})")
+                            revalidated_suspicious.append(s)
+
                 if revalidated_suspicious:
                     print(f"  ⚠️  {len(revalidated_suspicious)} suspicious dependencies found.")
                     self.last_run_success = False
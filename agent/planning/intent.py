@@ -14,6 +14,7 @@ Supports two modes:
 from __future__ import annotations
 
 import logging
+import re
 from dataclasses import dataclass, field
 from typing import Optional, List, TYPE_CHECKING
 
@@ -91,6 +92,48 @@ _INTENT_MAP: dict[str, TaskIntent] = {
 }
 
 
+# -- Heuristic Keywords --
+
+# Keyword groups in the order they are checked; the first group with any
+# keyword in the input decides the intent. Keywords are plain substrings.
+_HEURISTIC_GROUPS: dict[str, tuple[str, ...]] = {
+    "fix": ("fix", "error", "bug", "broken", "correct"),
+    "develop": (
+        "add", "feature", "refactor", "optimize", "ui", "framework", "migrate",
+        "implement", "update", "build", "change", "run", "make", "start",
+        "install", "deploy", "launch", "serve", "setup", "execute", "apply",
+        "enable", "configure", "restart", "verify", "debug", "monitor", "test",
+    ),
+    "generate": ("generate", "scaffold", "create", "write a script", "write code"),
+    "meta": (
+        "stop", "wait", "undo", "redo", "pause", "capabilities", "status",
+        "who are you", "are you done",
+    ),
+    "explain": (
+        "explain", "read", "describe", "analyze", "what is", "about", "show",
+        "what does", "how does",
+    ),
+    "vague": ("check", "look"),
+}
+
+_HEURISTIC_RESULTS: dict[str, tuple[TaskIntent, float, str]] = {
+    "fix": (TaskIntent.FIX, 0.95, "Explicit error-related keywords present."),
+    "develop": (TaskIntent.DEVELOP, 0.90, "Active development or structural keywords present."),
+    "generate": (TaskIntent.GENERATE, 0.95, "Request to generate new files/projects."),
+    "meta": (TaskIntent.META, 0.95, "Meta-command or capability query detected."),
+    "explain": (TaskIntent.EXPLAIN, 0.85, "Read-only inquiry keywords present."),
+    "vague": (TaskIntent.EXPLAIN, 0.60, "Vague request. Defaulting to EXPLAIN (read-only)."),
+}
+
+_HEURISTIC_ORDER = tuple(_HEURISTIC_GROUPS)
+_HEURISTIC_KEYWORDS = {k: group for group, words in _HEURISTIC_GROUPS.items() for k in words}
+
+# The lookahead tries each position without consuming, so overlapping
+# keywords ("bug" inside "debug") are all seen. Alternatives follow group
+# order, so where two keywords start at one position the higher-ranked wins.
+_HEURISTIC_RE = re.compile("(?=(" + "|".join(map(re.escape, _HEURISTIC_KEYWORDS)) + "))")
+
+
 class IntentClassifier:
     """
     Classifies natural language requests into structured intents.
@@ -185,55 +228,12 @@ class IntentClassifier:
         Keyword-based fallback classifier.
         Maps to broad directional goals.
         """
-        lower_input = user_input.lower()
-
-        # High Confidence FIX
-        if any(w in lower_input for w in ["fix", "error", "bug", "broken", "correct"]):
-            return IntentResult(
-                intent=TaskIntent.FIX,
-                confidence=0.95,
-                reasoning="Explicit error-related keywords present.",
-            )
-
-        # High Confidence DEVELOP (Consolidated)
-        if any(w in lower_input for w in ["add", "feature", "refactor", "optimize", "ui", "framework", "migrate", "implement", "update", "build", "change", "run", "make", "start", "install", "deploy", "launch", "serve", "setup", "execute", "apply", "enable", "configure", "restart", "verify", "debug", "monitor", "test"]):
-            return IntentResult(
-                intent=TaskIntent.DEVELOP,
-                confidence=0.90,
-                reasoning="Active development or structural keywords present.",
-            )
-
-        # High Confidence GENERATE
-        if any(w in lower_input for w in ["generate", "scaffold", "create", "write a script", "write code"]):
-            return IntentResult(
-                intent=TaskIntent.GENERATE,
-                confidence=0.95,
-                reasoning="Request to generate new files/projects.",
-            )
-
-        # High Confidence META
-        if any(w in lower_input for w in ["stop", "wait", "undo", "redo", "pause", "capabilities", "status", "who are you", "are you done"]):
-            return IntentResult(
-                intent=TaskIntent.META,
-                confidence=0.95,
-                reasoning="Meta-command or capability query detected.",
-            )
-
-        # High Confidence EXPLAIN (Read-Only)
-        if any(w in lower_input for w in ["explain", "read", "describe", "analyze", "what is", "about", "show", "what does", "how does"]):
-            return IntentResult(
-                intent=TaskIntent.EXPLAIN,
-                confidence=0.85,
-                reasoning="Read-only inquiry keywords present.",
-            )
-
-        # Low Confidence / Ambiguous
-        if "check" in lower_input or "look" in lower_input:
-            return IntentResult(
-                intent=TaskIntent.EXPLAIN,
-                confidence=0.60,
-                reasoning="Vague request. Defaulting to EXPLAIN (read-only).",
-            )
+        # One scan finds every keyword; the first-ranked group present wins
+        found = {_HEURISTIC_KEYWORDS[k] for k in _HEURISTIC_RE.findall(user_input.lower())}
+        for group in _HEURISTIC_ORDER:
+            if group in found:
+                intent, confidence, reasoning = _HEURISTIC_RESULTS[group]
+                return IntentResult(intent=intent, confidence=confidence, reasoning=reasoning)
 
         # Default
         return IntentResult(
@@ -5,4 +5,10 @@ from .sandbox import SandboxedRunner
 from .network_policy import NetworkPolicy
 from .command_safety import classify_command, CommandPolicy, CommandTier, is_command_allowed
 from .rbac import UserRole, Permission, RBACPolicy, check_access
-from .preconditions import PreconditionChecker
+from .preconditions import (
+    PreconditionChecker,
+    get_git_head,
+    get_file_checksum,
+    check_git_consistency,
+    check_file_consistency,
+)
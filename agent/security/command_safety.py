@@ -7,7 +7,6 @@ Destructive and unknown commands require human approval.
 
 from __future__ import annotations
 
-import re
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from typing import Optional
@@ -43,29 +42,7 @@ TIER_POLICY: dict[CommandTier, CommandPolicy] = {
 
 
 # -- Pattern-based classification --
-# Order matters: first match wins. More specific patterns first.
-
-_PATTERNS: list[tuple[re.Pattern, CommandTier]] = [
-    # Git destructive (must check before generic git)
-    (re.compile(r"\bgit\s+(reset|push\s+.*--force|clean|rebase|filter-branch)"), CommandTier.GIT_REWRITE),
-
-    # File destructive
-    (re.compile(r"\b(rm\s|rmdir|shred|truncate|dd\s|mkfs)"), CommandTier.FILE_DESTRUCTIVE),
-    (re.compile(r"\bmv\s.*(?:\s|/)\.\./"), CommandTier.FILE_DESTRUCTIVE),  # mv to parent
-    (re.compile(r"\bchmod\s+0?0?0\b"), CommandTier.FILE_DESTRUCTIVE),      # chmod 000
-
-    # Network
-    (re.compile(r"\b(curl|wget|npm\s+install|pip\s+install|yarn\s+add|apt\s+install|brew\s+install)"), CommandTier.NETWORK),
-    (re.compile(r"\b(docker\s+pull|docker\s+push)"), CommandTier.NETWORK),
-]
-
-# Explicitly blocked patterns (even if they match a safe pattern somehow)
-_BLOCKED_PATTERNS: list[re.Pattern] = [
-    re.compile(r"\brm\s+-rf\s+(/|~|\$HOME|\.\.)"),   # rm -rf / or ~ or ..
-    re.compile(r"\b>\s*/dev/sd"),                      # writing to raw devices
-    re.compile(r"\bsudo\s+rm"),                        # sudo rm anything
-    re.compile(r":(){ :\|:& };:"),                     # fork bomb
-]
+# Patterns live in agent.security.rule_engine (single source of truth).
 
 
 @dataclass
@@ -10,7 +10,9 @@ Architecture §1 (terminal states):
 
 from __future__ import annotations
 
+import os
 import signal
+import subprocess
 import time
 import logging
 import threading
@@ -239,17 +241,27 @@ class KillSwitch:
             return AgentState.FAILED_BY_TIMEOUT
         return None
 
+    def snapshot(self, now: Optional[float] = None) -> dict[str, float]:
+        """
+        Elapsed and remaining time from a single clock read.
+
+        Callers that need both values (status lines, heartbeat checks)
+        should call this once instead of reading both properties.
+        """
+        if now is None:
+            now = time.time()
+        return {
+            "elapsed": 0.0 if self._start_time is None else now - self._start_time,
+            "remaining": 0.0 if self._deadline is None else max(0, self._deadline - now),
+        }
+
     @property
     def elapsed_seconds(self) -> float:
-        if self._start_time is None:
-            return 0.0
-        return time.time() - self._start_time
+        return self.snapshot()["elapsed"]
 
     @property
     def remaining_seconds(self) -> float:
-        if self._deadline is None:
-            return 0.0
-        return max(0, self._deadline - time.time())
+        return self.snapshot()["remaining"]
 
     @property
     def is_armed(self) -> bool:
@@ -285,8 +297,11 @@ class StaleDetector:
     Architecture §1: FAILED_BY_STALE — main moved during task → No Retry.
     """
 
-    def __init__(self):
+    ORIGIN_MAIN_REF = "refs/remotes/origin/main"
+
+    def __init__(self, repo_path: str = "."):
         self._base_sha: Optional[str] = None
+        self._git_dir = os.path.join(repo_path, ".git")
 
     def capture_base(self, sha: str):
         """Capture the base SHA at task start."""
@@ -302,19 +317,46 @@ class StaleDetector:
         if not self._base_sha:
             return False
 
-        import subprocess
+        current_sha = self._read_ref() or self._rev_parse()
+        if current_sha and current_sha != self._base_sha:
+            logger.critical(
+                f"STALE DETECTED: base={self._base_sha[:12]}, "
+                f"current={current_sha[:12]}"
+            )
+            return True
+        return False
+
+    def _read_ref(self) -> Optional[str]:
+        """
+        Resolve origin/main straight from the ref store (loose, then packed).
+
+        A plain file read instead of a git fork/exec — cheap enough for
+        heartbeat-frequency checks.
+        """
+        try:
+            with open(os.path.join(self._git_dir, *self.ORIGIN_MAIN_REF.split("/")), encoding="utf-8") as f:
+                return f.read().strip() or None
+        except OSError:
+            pass
+
+        suffix = " " + self.ORIGIN_MAIN_REF
+        try:
+            with open(os.path.join(self._git_dir, "packed-refs"), encoding="utf-8") as f:
+                for line in f:
+                    if line.rstrip().endswith(suffix):
+                        return line.split()[0]
+        except OSError:
+            pass
+        return None
+
+    def _rev_parse(self) -> Optional[str]:
+        """Fallback for layouts the direct read can't handle (worktrees, gitdir files)."""
         try:
             result = subprocess.run(
                 ["git", "rev-parse", "origin/main"],
+                cwd=os.path.dirname(self._git_dir) or ".",
                 capture_output=True, text=True, timeout=10,
             )
-            current_sha = result.stdout.strip()
-            if current_sha and current_sha != self._base_sha:
-                logger.critical(
-                    f"STALE DETECTED: base={self._base_sha[:12]}, "
-                    f"current={current_sha[:12]}"
-                )
-                return True
-            return False
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False  # Can't check → assume fresh
+            return result.stdout.strip() or None
+        except (subprocess.SubprocessError, FileNotFoundError):
+            return None  # Can't check → assume fresh
@@ -13,12 +13,26 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from agent.security.command_safety import classify_command, CommandTier
 
 logger = logging.getLogger(__name__)
 
+_URL_HOST_RE = re.compile(r"https?://([a-zA-Z0-9.-]+)")
+
+
+@lru_cache(maxsize=1024)
+def _classify_tier(command: str) -> CommandTier:
+    """
+    Memoized tier lookup for repeated commands (tests, builds, lints).
+
+    Only the tier is cached: it comes purely from the rule engine, whereas
+    the policy half of a classification depends on session approvals.
+    """
+    return classify_command(command).tier
+
 
 class NetworkPolicyViolation(Exception):
     """Raised when a command violates network policy."""
@@ -47,7 +61,7 @@ class NetworkPolicy:
     def _extract_domain(self, command: str) -> Optional[str]:
         """Attempt to extract a domain from a shell command."""
         # Simple regex for URLs
-        match = re.search(r"https?://([a-zA-Z0-9.-]+)", command)
+        match = _URL_HOST_RE.search(command)
         if match:
             return match.group(1)
         
@@ -61,21 +75,18 @@ class NetworkPolicy:
         stripped = command.strip()
         domain = self._extract_domain(stripped)
 
-        # If a domain is found, check against whitelist
+        # If a domain is found, the whitelist decides; no need to classify further
         if domain:
             is_whitelisted = any(domain == w or domain.endswith("." + w) for w in self.WHITELIST)
             if not is_whitelisted:
                 return f"Net-Zero Violation: Domain '{domain}' is not in the sandbox whitelist."
+            return None
 
-        # Fallback to TIER-based blocking for generic network tools without explicit URLs
-        from agent.security.command_safety import classify_command, CommandTier
-        classification = classify_command(stripped)
-        
-        if classification.tier == CommandTier.NETWORK:
-            # If it's a network command but we couldn't verify a whitelist domain, block it.
-            # This is "deny-by-default".
-            if not domain:
-                return f"Net-Zero Violation: Generic network command '{stripped}' blocked (no verified whitelisted target)."
+        # Fallback to TIER-based blocking for generic network tools without explicit URLs.
+        # If it's a network command but we couldn't verify a whitelist domain, block it.
+        # This is "deny-by-default".
+        if _classify_tier(stripped) == CommandTier.NETWORK:
+            return f"Net-Zero Violation: Generic network command '{stripped}' blocked (no verified whitelisted target)."
 
         return None
 
@@ -0,0 +1,75 @@
+"""
+Regex Backend — optional faster / safer engines behind the re API.
+
+    compile_pattern: PCRE2 (JIT) when installed. Used on large-content
+        scanning paths (secrets in diffs, logs, generated code), where JIT
+        matchers beat the re interpreter by an order of magnitude.
+    compile_linear: RE2 when installed. Used on the command classifier,
+        whose input is untrusted; RE2 guarantees linear-time matching, so
+        no command can trigger catastrophic backtracking.
+
+Both bindings mirror the re API (search / finditer / sub / lastgroup),
+so callers don't branch. Each falls back to stdlib re when the package
+is missing or rejects a pattern.
+
+Install with: pip install pcre2 google-re2
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pcre2
+except ImportError:
+    pcre2 = None
+    logger.debug("Regex backend: pcre2 not installed, using stdlib re")
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+    logger.debug("Regex backend: google-re2 not installed, using stdlib re")
+
+# re flag -> pcre2 flag (the numeric values differ between the two modules)
+_PCRE2_FLAGS = (
+    ((re.IGNORECASE, "IGNORECASE"), (re.MULTILINE, "MULTILINE"),
+     (re.DOTALL, "DOTALL"), (re.VERBOSE, "VERBOSE"))
+    if pcre2 is not None else ()
+)
+
+
+def compile_pattern(pattern: str, flags: int = 0):
+    """
+    Compile a pattern with PCRE2 JIT, falling back to re.compile.
+
+    flags are stdlib re flags. Patterns PCRE2 rejects also fall back to
+    re, so the result always behaves like a compiled re pattern.
+    """
+    if pcre2 is not None:
+        pcre2_flags = 0
+        for re_flag, name in _PCRE2_FLAGS:
+            if flags & re_flag:
+                pcre2_flags |= getattr(pcre2, name)
+        try:
+            return pcre2.compile(pattern, pcre2_flags, jit=True)
+        except pcre2.error as e:
+            logger.debug(f"Regex backend: pcre2 rejected {pattern!r} ({e}); using re")
+    return re.compile(pattern, flags)
+
+
+def compile_linear(pattern: str):
+    """
+    Compile a pattern with RE2 (linear-time matching), falling back to re.
+
+    Inline flags such as (?i) must be written into the pattern itself.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error as e:
+            logger.debug(f"Regex backend: re2 rejected {pattern!r} ({e}); using re")
+    return re.compile(pattern)
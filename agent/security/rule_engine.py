@@ -3,10 +3,14 @@ Rule Engine — Deterministic, sub-millisecond command safety.
 """
 
 import re
+import sys
 from enum import Enum, auto
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, List
 
+from agent.security.regex_backend import compile_linear
+
 class RuleTier(Enum):
     SAFE = auto()
     NETWORK = auto()
@@ -16,7 +20,7 @@ class RuleTier(Enum):
     BLOCKED = auto()
     UNKNOWN = auto()
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RuleResult:
     command: str
     tier: RuleTier
@@ -30,6 +34,15 @@ class RuleEngine:
     Runs locally and deterministically to prevent exfiltration and destruction.
     """
 
+    # Literals at least one of which every blocked/tier pattern needs to match.
+    # Plain substrings (no word boundaries) so the gate can only over-match.
+    # Keep in sync when adding patterns.
+    GATE_ANCHORS = (
+        "rm", "dd", "nc", "netcat", "curl", "wget", "bash", "pbcopy", "xclip",
+        "xsel", "mkfs", "truncate", "shred", "sudo", "chown", ":&",
+        "git", "npm", "pip", "yarn", "apt", "brew", "docker",
+    )
+
     def __init__(self):
         # Explicitly blocked patterns (Instant Kill)
         self._blocked_patterns = [
@@ -53,32 +66,68 @@ class RuleEngine:
             re.compile(r"\bchown\b"),
         ]
 
-        # Tiered patterns
+        # All blocked patterns fused into one alternation: a single C-level scan
+        # instead of a Python loop. Each alternative is a named group so the
+        # hit can be mapped back to the original pattern for reporting.
+        self._blocked_re = compile_linear("|".join(
+            f"(?P<b{i}>{p.pattern})" for i, p in enumerate(self._blocked_patterns)
+        ))
+        # group name -> (pattern, reason), built and interned once so every
+        # result for the same rule shares the same string objects
+        self._blocked_by_group = {
+            f"b{i}": (
+                sys.intern(p.pattern),
+                sys.intern(f"Globally blocked dangerous pattern: {p.pattern}"),
+            )
+            for i, p in enumerate(self._blocked_patterns)
+        }
+
+        # Tiered patterns (linear-time engine: commands are untrusted input)
         self._tiers = [
-            (re.compile(r"\bgit\s+(reset|push\s+.*--force|clean|rebase|filter-branch)"), RuleTier.GIT_REWRITE),
-            (re.compile(r"\b(rm\s|rmdir|shred|truncate|dd\s)"), RuleTier.DESTRUCTIVE),
-            (re.compile(r"\b(npm\s+install|pip\s+install|yarn\s+add|apt|brew|docker\s+(pull|push|run|up|down|start|stop|build|compose))\b"), RuleTier.NETWORK),
+            (compile_linear(r"\bgit\s+(reset|push\s+.*--force|clean|rebase|filter-branch)"), RuleTier.GIT_REWRITE),
+            (compile_linear(r"\b(rm\s|rmdir|shred|truncate|dd\s)"), RuleTier.DESTRUCTIVE),
+            (compile_linear(r"\b(npm\s+install|pip\s+install|yarn\s+add|apt|brew|docker\s+(pull|push|run|up|down|start|stop|build|compose))\b"), RuleTier.NETWORK),
         ]
 
+        self._tier_reasons = {
+            tier: sys.intern(f"Matched {tier.name} pattern") for _, tier in self._tiers
+        }
+
+        self._rm_re = compile_linear(r"\brm\s+")
+        self._gate_re = compile_linear("|".join(re.escape(a) for a in self.GATE_ANCHORS))
+
+        # Agents re-classify the same commands (git status, ls, pytest) many
+        # times per session. Results are frozen, so hits can be shared safely.
+        # Call self._check_cached.cache_clear() if patterns are ever reloaded.
+        self._check_cached = lru_cache(maxsize=4096)(self._classify)
+
     def check(self, command: str, repo_path: str = None) -> RuleResult:
         """
         Scan a command against deterministic safety rules.
         """
-        stripped = command.strip()
+        return self._check_cached(command.strip(), repo_path)
+
+    def _classify(self, stripped: str, repo_path: str = None) -> RuleResult:
+        """Uncached classification of an already-stripped command."""
+        # 0. Literal prefilter: most commands (ls, cat, echo) contain none of the
+        #    anchors the rules need, so one scan settles them.
+        if not self._gate_re.search(stripped):
+            return self._unrecognized(stripped)
 
         # 1. Check explicit blocks
-        for pattern in self._blocked_patterns:
-            if pattern.search(stripped):
-                return RuleResult(
-                    command=stripped,
-                    tier=RuleTier.BLOCKED,
-                    matched_pattern=pattern.pattern,
-                    reason=f"Globally blocked dangerous pattern: {pattern.pattern}",
-                    is_blocked=True
-                )
+        match = self._blocked_re.search(stripped)
+        if match:
+            matched_pattern, reason = self._blocked_by_group[match.lastgroup]
+            return RuleResult(
+                command=stripped,
+                tier=RuleTier.BLOCKED,
+                matched_pattern=matched_pattern,
+                reason=reason,
+                is_blocked=True
+            )
 
         # 2. State-Aware Guardrail: rm in /tmp is fine
-        if re.search(r"\brm\s+", stripped):
+        if self._rm_re.search(stripped):
             # If repo_path is provided, we can allow deletions inside /tmp or specific agent folders
             if repo_path and ("/tmp/" in stripped or ".agent_log" in stripped):
                 # We still classify as DESTRUCTIVE logically but maybe not blocked
@@ -91,10 +140,14 @@ class RuleEngine:
                     command=stripped,
                     tier=tier,
                     matched_pattern=pattern.pattern,
-                    reason=f"Matched {tier.name} pattern",
+                    reason=self._tier_reasons[tier],
                     is_blocked=(tier == RuleTier.BLOCKED)
                 )
 
+        return self._unrecognized(stripped)
+
+    @staticmethod
+    def _unrecognized(stripped: str) -> RuleResult:
         return RuleResult(
             command=stripped,
             tier=RuleTier.UNKNOWN,
@@ -31,7 +31,7 @@ class CommandTimeoutError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """Result of a sandboxed command execution."""
     command: str
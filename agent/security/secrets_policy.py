@@ -12,10 +12,14 @@ Prevents accidental leakage of API keys, passwords, tokens, etc.
 from __future__ import annotations
 
 import re
+import sys
+import bisect
 import logging
 from dataclasses import dataclass, field
 from typing import Optional
 
+from agent.security.regex_backend import compile_pattern
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +28,7 @@ class SecretLeakError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecretMatch:
     """A detected secret pattern match."""
     pattern_name: str
@@ -60,6 +64,83 @@ SECRET_PATTERNS = [
 
 REDACTION_PLACEHOLDER = "***REDACTED***"
 
+# Content above this size is scanned in newline-aligned chunks; secrets are
+# single-line, so chunking loses nothing and keeps each scan cache-sized.
+LARGE_CONTENT_THRESHOLD = 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+def _iter_chunks(content: str):
+    """
+    Yield (offset, chunk) pairs covering content, cut just after newlines.
+
+    Chunks are never cut mid-line: a window with no newline is extended to
+    the next one, so no secret can straddle a chunk boundary.
+    """
+    if len(content) <= LARGE_CONTENT_THRESHOLD:
+        yield 0, content
+        return
+    start, end_of_text = 0, len(content)
+    while start < end_of_text:
+        end = min(start + CHUNK_SIZE, end_of_text)
+        if end < end_of_text:
+            cut = content.rfind("\n", start, end)
+            if cut == -1:
+                cut = content.find("\n", end)
+            end = cut + 1 if cut != -1 else end_of_text
+        yield start, content[start:end]
+        start = end
+
+
+_GLOBAL_FLAGS_RE = re.compile(r"^\(\?[aiLmsux]+\)")
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+
+
+def _fuse_patterns(patterns: list) -> str:
+    """
+    Build a single alternation source from (name, pattern) pairs.
+
+    Global inline flags like (?i) are only legal at the start of a whole
+    expression, so each pattern's flags are re-applied as a scoped group.
+    """
+    branches = []
+    for _, pattern in patterns:
+        source = _GLOBAL_FLAGS_RE.sub("", pattern.pattern)
+        flags = "".join(c for flag, c in _SCOPED_FLAGS if pattern.flags & flag)
+        branches.append(f"(?{flags}:{source})" if flags else f"(?:{source})")
+    return "|".join(branches)
+
+
+def _newline_offsets(content: str) -> list[int]:
+    """Sorted offsets of every newline, for bisecting match positions to lines."""
+    offsets = []
+    pos = content.find("\n")
+    while pos != -1:
+        offsets.append(pos)
+        pos = content.find("\n", pos + 1)
+    return offsets
+
+
+class PreparedContent:
+    """
+    Content prepared once for several SecretsPolicy calls.
+
+    Newline offsets are computed on first use and then shared, so a
+    validate-then-redact flow walks the text once for line numbers.
+    """
+
+    __slots__ = ("text", "_nl_offsets")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._nl_offsets: Optional[list[int]] = None
+
+    @property
+    def nl_offsets(self) -> list[int]:
+        if self._nl_offsets is None:
+            self._nl_offsets = _newline_offsets(self.text)
+        return self._nl_offsets
+
 
 class SecretsPolicy:
     """
@@ -73,6 +154,11 @@ class SecretsPolicy:
         
         # Redact secrets
         clean_text = policy.redact("password = 'hunter2'")
+
+        # Scan and redact the same content without re-preparing it
+        prepared = policy.prepare(diff_text)
+        policy.assert_no_secrets(prepared)
+        clean_diff = policy.redact(prepared)
     """
 
     def __init__(
@@ -81,47 +167,78 @@ class SecretsPolicy:
         strict: bool = True,
     ):
         self._patterns = patterns or SECRET_PATTERNS
+        # Matching runs on the regex backend (PCRE2 JIT when installed)
+        # Names interned so every SecretMatch for a rule shares one string,
+        # including for caller-supplied patterns built at runtime
+        self._matchers = [
+            (sys.intern(name), compile_pattern(pattern.pattern, pattern.flags))
+            for name, pattern in self._patterns
+        ]
+        self._fused = compile_pattern(_fuse_patterns(self._patterns))
         self.strict = strict
 
-    def scan(self, content: str) -> list[SecretMatch]:
+    @staticmethod
+    def prepare(content: str) -> PreparedContent:
+        """Prepare content for repeated scan / redact / assert calls."""
+        return PreparedContent(content)
+
+    def scan(self, content: str | PreparedContent) -> list[SecretMatch]:
         """
         Scan content for potential secrets.
         
         Returns list of matches.
         """
-        matches = []
+        prepared = content if isinstance(content, PreparedContent) else PreparedContent(content)
+        content = prepared.text
 
-        for line_num, line in enumerate(content.split("\n"), 1):
-            for name, pattern in self._patterns:
-                for match in pattern.finditer(line):
-                    matched = match.group()
-                    redacted = self._redact_match(matched)
-                    matches.append(SecretMatch(
-                        pattern_name=name,
-                        matched_text=matched[:20] + "...",  # Truncate for safety
-                        redacted_text=redacted,
-                        line_number=line_num,
-                    ))
+        # One finditer per pattern over the whole content (or each chunk of
+        # very large content) instead of lines × patterns scans; line numbers
+        # are recovered afterwards from absolute offsets.
+        found = []
+        for offset, chunk in _iter_chunks(content):
+            for idx, (name, pattern) in enumerate(self._matchers):
+                for match in pattern.finditer(chunk):
+                    found.append((offset + match.start(), idx, name, match.group()))
+
+        matches = []
+        if found:
+            newlines = prepared.nl_offsets
+            located = sorted(
+                (bisect.bisect_left(newlines, start) + 1, idx, start, name, matched)
+                for start, idx, name, matched in found
+            )
+            # Report in line order, then pattern order, as the per-line scan did
+            for line_num, _, _, name, matched in located:
+                matches.append(SecretMatch(
+                    pattern_name=name,
+                    matched_text=matched[:20] + "...",  # Truncate for safety
+                    redacted_text=self._redact_match(matched),
+                    line_number=line_num,
+                ))
 
         if matches:
             logger.warning(f"Found {len(matches)} potential secrets!")
 
         return matches
 
-    def redact(self, content: str) -> str:
+    def redact(self, content: str | PreparedContent) -> str:
         """
         Redact all detected secrets from content.
         
         Returns content with secrets replaced by REDACTED placeholder.
         """
-        result = content
-
-        for name, pattern in self._patterns:
-            result = pattern.sub(REDACTION_PLACEHOLDER, result)
+        if isinstance(content, PreparedContent):
+            content = content.text
 
-        return result
+        # One pass over the content instead of a rewrite per pattern
+        if len(content) <= LARGE_CONTENT_THRESHOLD:
+            return self._fused.sub(REDACTION_PLACEHOLDER, content)
+        return "".join(
+            self._fused.sub(REDACTION_PLACEHOLDER, chunk)
+            for _, chunk in _iter_chunks(content)
+        )
 
-    def assert_no_secrets(self, content: str, context: str = ""):
+    def assert_no_secrets(self, content: str | PreparedContent, context: str = ""):
         """
         Assert that content contains no secrets.
         
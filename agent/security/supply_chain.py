@@ -11,7 +11,9 @@ from __future__ import annotations
 
 import re
 import logging
-from dataclasses import dataclass, field
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -22,7 +24,7 @@ class SupplyChainViolation(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DependencyCheck:
     """Result of checking a single dependency."""
     name: str
@@ -76,23 +78,49 @@ SUSPICIOUS_PATTERNS = [
     re.compile(r"^[a-z]{1,2}-"),  # a-requests
 ]
 
+# Any-of gate over SUSPICIOUS_PATTERNS: most names match none, so one
+# search settles them before the per-pattern cleanup runs
+_SUSPICIOUS_RE = re.compile("|".join(p.pattern for p in SUSPICIOUS_PATTERNS))
 
-def _edit_distance(a: str, b: str) -> int:
-    """Compute Levenshtein edit distance between two strings."""
+# Version specifier / extras / marker delimiters in requirements.txt lines
+_REQ_SPLIT = re.compile(r"[>=<!\[\];]")
+
+
+def _edit_distance(a: str, b: str, max_dist: Optional[int] = None) -> int:
+    """
+    Compute Levenshtein edit distance between two strings.
+
+    Two-row DP with the running cell kept in a local and inline comparisons
+    instead of min(): the per-cell builtin call dominated the old loop.
+    With max_dist, returns max_dist + 1 as soon as a whole row exceeds it
+    (row minima never decrease, so the answer can only be larger).
+    """
     if len(a) < len(b):
-        return _edit_distance(b, a)
+        a, b = b, a
     if len(b) == 0:
         return len(a)
 
     prev = list(range(len(b) + 1))
-    for i, ca in enumerate(a):
-        curr = [i + 1]
+    for i, ca in enumerate(a, 1):
+        curr = [i]
+        left = i
+        row_min = i
         for j, cb in enumerate(b):
-            cost = 0 if ca == cb else 1
-            curr.append(min(curr[j] + 1, prev[j + 1] + 1, prev[j] + cost))
+            diag = prev[j] if ca == cb else prev[j] + 1
+            up = prev[j + 1] + 1
+            left += 1
+            if up < left:
+                left = up
+            if diag < left:
+                left = diag
+            if left < row_min:
+                row_min = left
+            curr.append(left)
+        if max_dist is not None and row_min > max_dist:
+            return max_dist + 1
         prev = curr
 
-    return prev[len(b)]
+    return prev[-1]
 
 
 class SupplyChainChecker:
@@ -107,31 +135,58 @@ class SupplyChainChecker:
         known_packages: set[str] = None,
         max_edit_distance: int = 2,
     ):
-        self._known = known_packages or (KNOWN_PYTHON_PACKAGES | KNOWN_NPM_PACKAGES)
+        # Normalized once here so lookups compare like with like
+        self._known = {
+            name.lower().strip()
+            for name in (known_packages or (KNOWN_PYTHON_PACKAGES | KNOWN_NPM_PACKAGES))
+        }
         self._max_edit_distance = max_edit_distance
 
+        # Names whose lengths differ by more than max_edit_distance can never
+        # be within range, so candidates are looked up by length bucket.
+        self._known_by_len: dict[int, list[str]] = {}
+        for known in sorted(self._known):
+            self._known_by_len.setdefault(len(known), []).append(known)
+
+        # Character multisets for the whole known set, computed once. Their
+        # difference is a cheap lower bound on edit distance.
+        self._known_bags = {known: Counter(known) for known in self._known}
+
+        # Deps repeat across scans; verdicts depend only on the normalized
+        # name. Bound per instance so the cache dies with its known set.
+        self._check_normalized = lru_cache(maxsize=8192)(self._check_normalized)
+
     def check_dependency(self, dep_name: str) -> DependencyCheck:
         """
         Check a single dependency name for typosquatting.
         
         Returns DependencyCheck with is_suspicious flag.
         """
-        normalized = dep_name.lower().strip()
+        result = self._check_normalized(dep_name.lower().strip())
+        return result if result.name == dep_name else replace(result, name=dep_name)
 
+    def _check_normalized(self, normalized: str) -> DependencyCheck:
+        """Verdict for an already-normalized name; depends on nothing else."""
         # If it's a known package, it's fine
         if normalized in self._known:
-            return DependencyCheck(name=dep_name)
-
-        # Check edit distance against known packages
-        for known in self._known:
-            dist = _edit_distance(normalized, known)
+            return DependencyCheck(name=normalized)
+
+        # Check edit distance against length-compatible known packages,
+        # skipping the DP where the character-bag bound already rules it out
+        bag = Counter(normalized)
+        for known in self._length_candidates(len(normalized)):
+            known_bag = self._known_bags[known]
+            if max(sum((bag - known_bag).values()),
+                   sum((known_bag - bag).values())) > self._max_edit_distance:
+                continue
+            dist = _edit_distance(normalized, known, max_dist=self._max_edit_distance)
             if 0 < dist <= self._max_edit_distance:
                 logger.warning(
-                    f"Supply chain: '{dep_name}' is {dist} edits from '{known}' — "
+                    f"Supply chain: '{normalized}' is {dist} edits from '{known}' — "
                     f"potential typosquat!"
                 )
                 return DependencyCheck(
-                    name=dep_name,
+                    name=normalized,
                     is_suspicious=True,
                     reason=f"Typosquatting risk: similar to '{known}' (edit distance: {dist})",
                     similar_to=known,
@@ -139,19 +194,27 @@ class SupplyChainChecker:
                 )
 
         # Check suspicious patterns
+        if not _SUSPICIOUS_RE.search(normalized):
+            return DependencyCheck(name=normalized)
+
         for pattern in SUSPICIOUS_PATTERNS:
             if pattern.search(normalized):
                 # Check if removing the pattern matches a known package
                 cleaned = pattern.sub("", normalized)
                 if cleaned in self._known:
                     return DependencyCheck(
-                        name=dep_name,
+                        name=normalized,
                         is_suspicious=True,
                         reason=f"Suspicious pattern: might be targeting '{cleaned}'",
                         similar_to=cleaned,
                     )
 
-        return DependencyCheck(name=dep_name)
+        return DependencyCheck(name=normalized)
+
+    def _length_candidates(self, length: int):
+        """Yield known names within max_edit_distance characters of length."""
+        for n in range(length - self._max_edit_distance, length + self._max_edit_distance + 1):
+            yield from self._known_by_len.get(n, ())
 
     def check_dependencies(self, dep_names: list[str]) -> list[DependencyCheck]:
         """
@@ -185,7 +248,7 @@ class SupplyChainChecker:
             if not line or line.startswith("#") or line.startswith("-"):
                 continue
             # Extract package name (before version specifier)
-            name = re.split(r"[>=<!\[\];]", line)[0].strip()
+            name = _REQ_SPLIT.split(line, maxsplit=1)[0].strip()
             if name:
                 deps.append(name)
         return deps
@@ -4,38 +4,141 @@ FastAPI Backend for God Mode Agent.
 Exposes the ChatSession and TaskExecutor as a REST API.
 """
 
-from fastapi import FastAPI, HTTPException, Body
+from fastapi import FastAPI, HTTPException, Body, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import os
+import stat
 import sys
 from typing import Dict, Optional, List, Any
 import asyncio
-import queue
-import threading
+import hashlib
 import json
-from fastapi.responses import StreamingResponse
+import re
+import threading
+from json.encoder import encode_basestring_ascii
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import replace
+from fastapi.responses import StreamingResponse, FileResponse, JSONResponse, Response
+import anyio.to_thread
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Per-client log buffer. A ring: when a client falls behind (or no one reads
+# while a long task prints), the oldest lines are dropped, so memory stays
+# bounded however much a task logs.
+LOG_BUFFER_SIZE = int(os.getenv("AGENT_LOG_BUFFER", "4096"))
+
+# Final chat outcomes kept per session until fetched from /api/run (oldest
+# dropped first), for clients whose stream broke before the event arrived
+RUN_RESULT_BUFFER_SIZE = 32
+
+# Released stream buffers kept for reuse, so React's auto-reconnect churn
+# doesn't allocate a fresh buffer per connection
+_BUFFER_POOL: list = []
+_BUFFER_POOL_SIZE = 32
 
 class SessionLogger:
     def __init__(self):
+        # (event loop, deque, asyncio.Event) per connected SSE client
         self.queues = []
+        # Events published while no client was connected (last few only)
+        self.pending = deque(maxlen=8)
+        # run_id -> final event, until a client reads it via take_result
+        self.results: OrderedDict[str, dict] = OrderedDict()
+        # Guards queues/pending: writers iterate from worker threads while
+        # clients attach and detach on the event loop
+        self._lock = threading.Lock()
+    
+    def attach(self, loop) -> tuple:
+        """Register a stream client; returns its (loop, buffer, ready) entry."""
+        buffer = _BUFFER_POOL.pop() if _BUFFER_POOL else deque(maxlen=LOG_BUFFER_SIZE)
+        # Events bind to the loop they are awaited on, so they aren't pooled
+        ready = asyncio.Event()
+        entry = (loop, buffer, ready)
+        with self._lock:
+            self.queues.append(entry)
+            if self.pending:
+                buffer.extend(self.pending)
+                self.pending.clear()
+                ready.set()
+        return entry
+    
+    def detach(self, entry: tuple):
+        """Unregister a stream client and recycle its buffer."""
+        with self._lock:
+            if entry not in self.queues:
+                return
+            self.queues.remove(entry)
+        # No writer can reach the buffer once it's out of queues
+        buffer = entry[1]
+        buffer.clear()
+        if len(_BUFFER_POOL) < _BUFFER_POOL_SIZE:
+            _BUFFER_POOL.append(buffer)
     
     def write(self, msg):
-        for q in self.queues:
-            q.put(msg)
+        # Called from worker threads. deque.append is thread-safe; the event
+        # belongs to the client's loop, so waking it goes through that loop.
+        # Append before checking the event: a client clears it before
+        # draining, so a line is never left behind.
+        with self._lock:
+            for loop, buffer, ready in self.queues:
+                buffer.append(msg)
+                if not ready.is_set():
+                    loop.call_soon_threadsafe(ready.set)
+    
+    def publish(self, event: dict):
+        """
+        Send a structured event (e.g. a chat result) to the stream clients.
+
+        Unlike log lines it must not be lost, so it is held until a client
+        connects if none is listening yet. Events with a run_id are also
+        kept for take_result, as a stream can drop them after this point.
+        """
+        with self._lock:
+            run_id = event.get("run_id")
+            if run_id is not None:
+                self.results[run_id] = event
+                while len(self.results) > RUN_RESULT_BUFFER_SIZE:
+                    self.results.popitem(last=False)
+            if not self.queues:
+                self.pending.append(event)
+                return
+        self.write(event)
+
+    def take_result(self, run_id: str) -> Optional[dict]:
+        """The published outcome of run_id (once), or None if there is none yet."""
+        with self._lock:
+            return self.results.pop(run_id, None)
             
     def flush(self):
         pass
 
 session_loggers: Dict[str, SessionLogger] = {}
 
+# Logger for the request being handled. A context variable rather than a
+# thread-local: it follows the request through the threadpool and can't leak
+# into the next request a pooled worker thread picks up.
+_current_logger: ContextVar[Optional[SessionLogger]] = ContextVar("session_logger", default=None)
+
 class ThreadedStdout:
     def __init__(self, original_stdout):
         self.original = original_stdout
-        self.local = threading.local()
     
     def write(self, msg):
-        logger = getattr(self.local, 'logger', None)
+        logger = _current_logger.get()
         if logger is not None:
             logger.write(msg)
         self.original.write(msg)
@@ -52,8 +155,18 @@ sys.path.append(os.path.abspath(os.getcwd()))
 from agent.config import AgentConfig
 from agent.core.factory import create_provider
 from agent.core.chat import ChatSession
+from agent.core.session_store import load_session, load_session_meta
+
+# Blocking handlers each hold a threadpool worker for the length of an LLM
+# call; anyio's default of 40 workers freezes the server at 40 concurrent chats.
+THREADPOOL_SIZE = int(os.getenv("AGENT_THREADPOOL", "256"))
 
-app = FastAPI(title="God Mode Agent API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
+app = FastAPI(title="God Mode Agent API", version="1.0.0", lifespan=lifespan)
 
 # Enable CORS for React frontend
 app.add_middleware(
@@ -64,9 +177,99 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory session store
-# Key: session_id, Value: ChatSession instance
-sessions: Dict[str, ChatSession] = {}
+# Session ids as generated by ChatSession; anything else is never looked up on disk
+_SESSION_ID_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+# Sessions with a chat turn still running in the background
+_active_chats: set = set()
+
+class SessionStore:
+    """
+    Live ChatSession objects, capped LRU in memory.
+
+    The conversation itself is already persisted by agent.core.session_store
+    (~/.godmode/sessions), so a session missing from memory — evicted, lost
+    on restart, or created by another worker process — is rehydrated from
+    there on lookup, the same way `god-mode resume` does.
+    """
+
+    def __init__(self, capacity: int = 128):
+        self.capacity = capacity
+        self._sessions: OrderedDict[str, ChatSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def peek(self, session_id: str) -> Optional[ChatSession]:
+        """In-memory lookup only (never blocks on disk or the provider)."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def get(self, session_id: str) -> Optional[ChatSession]:
+        session = self.peek(session_id)
+        if session is None:
+            session = self._rehydrate(session_id)
+            if session is not None:
+                self.put(session_id, session)
+        return session
+
+    def put(self, session_id: str, session: ChatSession):
+        with self._lock:
+            self._sessions[session_id] = session
+            self._sessions.move_to_end(session_id)
+            excess = len(self._sessions) - self.capacity
+            if excess > 0:
+                # Never evict a session mid-turn: the next lookup would build a
+                # second ChatSession appending to the same history file.
+                # Running sessions stay over capacity until a later put.
+                idle = [
+                    sid for sid in self._sessions
+                    if sid not in _active_chats and sid != session_id
+                ]
+                for sid in idle[:excess]:
+                    del self._sessions[sid]
+
+    def _rehydrate(self, session_id: str) -> Optional[ChatSession]:
+        if not _SESSION_ID_RE.fullmatch(session_id):
+            return None
+        try:
+            meta = load_session_meta(session_id)
+            history = load_session(session_id)
+        except FileNotFoundError:
+            return None
+        try:
+            config = AgentConfig()
+            if not config.has_api_key:
+                return None
+            model = meta.get("model")
+            if model and model != "default" and model != config.llm.model:
+                # Continue on the model the session was started with
+                config = replace(config, llm=replace(config.llm, model=model))
+            session = ChatSession.resume(create_provider(config), meta, history)
+            session._load_repo_context()
+            return session
+        except Exception as e:
+            logger.warning(f"Could not restore session {session_id}: {e}")
+            return None
+
+sessions = SessionStore(capacity=int(os.getenv("AGENT_SESSION_CACHE", "128")))
+
+def _get_session(session_id: str) -> ChatSession:
+    """Session lookup for blocking (def) handlers; 404 when unknown."""
+    session = sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found.")
+    return session
+
+async def _aget_session(session_id: str) -> ChatSession:
+    """Session lookup for async handlers; a rehydrate runs off the event loop."""
+    session = sessions.peek(session_id)
+    if session is None:
+        session = await anyio.to_thread.run_sync(sessions.get, session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found.")
+    return session
 
 class ConnectRequest(BaseModel):
     repo_path: str = "."
@@ -79,14 +282,27 @@ class ModeRequest(BaseModel):
     session_id: str
     mode: str  # "auto" or "interactive"
 
+class HistoryMessage(BaseModel):
+    role: str
+    content: str
+    timestamp: str = ""
+    action_taken: Optional[str] = None
+
+class HistoryResponse(BaseModel):
+    messages: List[HistoryMessage]
+
 class ConnectResponse(BaseModel):
     session_id: str
     repo_path: str
     file_count: int
     stack: str
 
+# Handlers that block (LLM calls, filesystem walks, git) are plain `def`:
+# FastAPI already runs those in its threadpool, so no to_thread hop is needed.
+# Handlers that only touch in-memory state stay `async def`.
+
 @app.post("/api/connect", response_model=ConnectResponse)
-async def connect(request: ConnectRequest):
+def connect(request: ConnectRequest):
     """Initialize a new agent session."""
     try:
         repo_path = os.path.abspath(request.repo_path)
@@ -103,79 +319,96 @@ async def connect(request: ConnectRequest):
         # Load context
         session._load_repo_context()
         
-        # Extract stats from context string (hacky but works with current implementation)
-        file_count = 0
-        stack = "Unknown"
-        if session._repo_context:
-            for line in session._repo_context.split('\n'):
-                if line.startswith('Files: '):
-                    try:
-                        file_count = int(line.split(': ')[1])
-                    except: pass
-                if line.startswith('Stack: '):
-                    stack = line.split(': ')[1]
-
-        sessions[session._session_id] = session
+        sessions.put(session._session_id, session)
         
         return ConnectResponse(
             session_id=session._session_id,
             repo_path=repo_path,
-            file_count=file_count,
-            stack=stack
+            file_count=session._file_count,
+            stack=session._stack
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _run_chat(session_id: str, run_id: str, session: ChatSession, message: str):
+    """Run one agent turn in the background, streaming logs and the result over SSE."""
+    session_logger = session_loggers[session_id]
+    token = _current_logger.set(session_logger)
+    try:
+        # This call may trigger internal research/actions which will now be captured
+        response = session._send_agentic(message)
+        
+        result = {
+            "mode": response.mode,
+            "message": response.message,
+            "action": None
+        }
+
+        if response.mode == "ACTION" and response.action:
+             # Internal 'research' and standard actions are already fully handled and synthesized inside _send_agentic
+             result["action"] = {
+                 "type": response.action.type,
+                 "task": response.action.task
+             }
+             
+        session.save_session()
+        event = {"run_id": run_id, "result": result}
+
+    except Exception as e:
+        logger.exception("Error in chat task")
+        event = {"run_id": run_id, "error": str(e)}
+    finally:
+        _current_logger.reset(token)
+        # Actions run inside _send_agentic may have created or removed files
+        _invalidate_file_cache(session_id)
+        _active_chats.discard(session_id)
+    
+    if "result" in event:
+        session_logger.write("ST_STEP:COMPLETE")
+    session_logger.publish(event)
+
 @app.post("/api/chat")
-async def chat(request: ChatRequest):
-    """Send a message to the agent."""
+async def chat(request: ChatRequest, background: BackgroundTasks):
+    """
+    Send a message to the agent.
+
+    Returns a run_id as soon as the turn is scheduled; progress, then a
+    final {"run_id", "result"} or {"run_id", "error"} event, arrive on
+    /api/stream.
+    """
     session_id = request.session_id
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found.")
+    session = await _aget_session(session_id)
+    if session_id in _active_chats:
+        raise HTTPException(status_code=409, detail="A request is already running for this session.")
     
-    session = sessions[session_id]
-    
-    try:
-        def run_with_logs():
-            if session_id not in session_loggers:
-                session_loggers[session_id] = SessionLogger()
-            global_threaded_stdout.local.logger = session_loggers[session_id]
-            try:
-                # This call may trigger internal research/actions which will now be captured
-                response = session._send_agentic(request.message)
-                
-                result = {
-                    "mode": response.mode,
-                    "message": response.message,
-                    "action": None
-                }
-
-                if response.mode == "ACTION" and response.action:
-                     # Internal 'research' and standard actions are already fully handled and synthesized inside _send_agentic
-                     result["action"] = {
-                         "type": response.action.type,
-                         "task": response.action.task
-                     }
-                     
-                session.save_session()
-                return result
-            finally:
-                global_threaded_stdout.local.logger = None
-
-        final_result = await asyncio.to_thread(run_with_logs)
-        return final_result
+    if session_id not in session_loggers:
+        session_loggers[session_id] = SessionLogger()
+    run_id = uuid.uuid4().hex
+    _active_chats.add(session_id)
+    background.add_task(_run_chat, session_id, run_id, session, request.message)
+    return {"status": "executing", "run_id": run_id}
 
-    except Exception as e:
-        logger.exception("Error in chat handler")
-        raise HTTPException(status_code=500, detail=str(e))
+@app.get("/api/run/{session_id}/{run_id}")
+async def get_run_result(session_id: str, run_id: str):
+    """
+    The final {"run_id", "result"} or {"run_id", "error"} event of a chat
+    turn, for a client whose stream broke before it arrived. 202 while the
+    turn is still running; a result can be read once.
+    """
+    session_logger = session_loggers.get(session_id)
+    event = session_logger.take_result(run_id) if session_logger is not None else None
+    if event is not None:
+        return event
+    if session_id in _active_chats:
+        return JSONResponse({"run_id": run_id, "status": "running"}, status_code=202)
+    raise HTTPException(status_code=404, detail="Run not found.")
 
-@app.get("/api/history/{session_id}")
+# With a response model FastAPI serializes straight to JSON bytes in
+# pydantic-core, skipping the generic jsonable_encoder + json.dumps path
+@app.get("/api/history/{session_id}", response_model=HistoryResponse)
 async def get_history(session_id: str):
     """Get message history."""
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found.")
-    
-    session = sessions[session_id]
+    session = await _aget_session(session_id)
     return {
         "messages": [
             {
@@ -188,62 +421,85 @@ async def get_history(session_id: str):
         ]
     }
 
+# SSE frames are built from pre-encoded constant parts; only the payload
+# string goes through the JSON escaper (same output as json.dumps).
+_SSE_LOGS_PREFIX = b'data: {"logs": ['
+_SSE_LOGS_SUFFIX = b']}\n\n'
+_SSE_STATUS_PREFIX = b'data: {"status": '
+_SSE_SUFFIX = b'}\n\n'
+
+# Log lines that are already buffered go out together, up to this many per
+# frame, instead of one network write and one browser event per line.
+SSE_BATCH_SIZE = 32
+
+def _logs_frame(lines: list) -> bytes:
+    return _SSE_LOGS_PREFIX + ", ".join(map(encode_basestring_ascii, lines)).encode() + _SSE_LOGS_SUFFIX
+
 @app.get("/api/stream/{session_id}")
 async def stream_logs(session_id: str):
     """Stream execution logs via Server-Sent Events (SSE)."""
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found.")
+    await _aget_session(session_id)
     
     if session_id not in session_loggers:
         session_loggers[session_id] = SessionLogger()
     
     logger = session_loggers[session_id]
-    q = queue.Queue()
-    logger.queues.append(q)
+    entry = logger.attach(asyncio.get_running_loop())
+    _, buffer, ready = entry
     
     async def event_generator():
         try:
             while True:
-                try:
-                    # Non-blocking get with short sleep is async friendly
-                    msg = q.get(block=False)
+                await ready.wait()
+                ready.clear()
+                batch = []
+                while buffer:
+                    msg = buffer.popleft()
                     if msg is None:
-                        break
+                        if batch:
+                            yield _logs_frame(batch)
+                        return
                     
-                    if msg.startswith("ST_STEP:"):
+                    if isinstance(msg, dict):
+                        # Structured event (chat result / error)
+                        if batch:
+                            yield _logs_frame(batch)
+                            batch = []
+                        yield b"data: " + _dumps(msg) + b"\n\n"
+                    elif msg.startswith("ST_STEP:"):
+                        # Flush pending lines first so order is preserved
+                        if batch:
+                            yield _logs_frame(batch)
+                            batch = []
                         step_name = msg.replace("ST_STEP:", "").strip()
-                        yield f"data: {json.dumps({'status': step_name})}\n\n"
+                        yield _SSE_STATUS_PREFIX + encode_basestring_ascii(step_name).encode() + _SSE_SUFFIX
                     else:
-                        yield f"data: {json.dumps({'log': msg})}\n\n"
-                except queue.Empty:
-                    await asyncio.sleep(0.1)
+                        batch.append(msg)
+                        if len(batch) >= SSE_BATCH_SIZE:
+                            yield _logs_frame(batch)
+                            batch = []
+                if batch:
+                    yield _logs_frame(batch)
         finally:
-            if q in logger.queues:
-                logger.queues.remove(q)
+            logger.detach(entry)
             
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
 @app.post("/api/mode")
 async def set_mode(request: ModeRequest):
     """Toggle interactive mode."""
-    if request.session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found.")
-    
-    session = sessions[request.session_id]
-    if request.mode.lower() in ["interactive", "copilot"]:
-        session.interactive_mode = True
-    else:
-        session.interactive_mode = False
+    session = await _aget_session(request.session_id)
+    enabled = request.mode.lower() in ["interactive", "copilot"]
+    # Recorded in the session's meta file, so a rehydrated session keeps it
+    await anyio.to_thread.run_sync(session.set_interactive_mode, enabled)
         
     return {"interactive_mode": session.interactive_mode}
 
 @app.get("/api/status/{session_id}")
 async def get_status(session_id: str):
     """Get detailed session status."""
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found.")
+    session = await _aget_session(session_id)
     
-    session = sessions[session_id]
     provider = session._provider
     
     return {
@@ -256,64 +512,144 @@ async def get_status(session_id: str):
         }
     }
 
+# Directories never shown in the file tree (internal / generated / junk),
+# split on the leading dot so each name is checked against one small set.
+# Other dot-directories (.github, .vscode, ...) stay visible.
+IGNORE_DOT_DIRS = frozenset({'.git', '.agent_log', '.venv', '.mypy_cache', '.pytest_cache', '.ruff_cache', '.tox'})
+IGNORE_PLAIN_DIRS = frozenset({'__pycache__', 'node_modules', 'dist', 'build'})
+# Common junk files to ignore (very minimal now)
+IGNORE_FILES = frozenset({".DS_Store", "Thumbs.db"})
+
+# The UI polls the file tree every few seconds; a short-lived cache keeps that
+# from re-walking the repo each time. Writes made through the API invalidate it.
+FILE_CACHE_TTL = 2.0
+_file_cache: Dict[str, tuple] = {}  # session_id -> (timestamp, sorted file list, etag)
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """True when the client's If-None-Match already names this ETag."""
+    header = request.headers.get("if-none-match")
+    return bool(header) and etag in (tag.strip() for tag in header.split(","))
+
+def _etag_headers(etag: str) -> dict:
+    # no-cache: browsers keep the body but revalidate every time, so fetch()
+    # sends If-None-Match by itself and gets a 304 when nothing changed
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+def _invalidate_file_cache(session_id: str):
+    _file_cache.pop(session_id, None)
+
+def _walk_files(root: str):
+    """
+    Yield repo-relative paths of visible files under root.
+
+    An explicit os.scandir stack: DirEntry.is_dir uses the d_type readdir
+    already returned, so there is no extra stat per entry as with os.walk.
+    """
+    # Every entry path starts with root, so the relative path is a slice;
+    # os.path.relpath would re-normalize (and abspath) both sides per file.
+    base_len = len(root.rstrip(os.sep) + os.sep)
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip only extreme internal/junk directories
+                    name = entry.name
+                    if name[0] == '.':
+                        if name in IGNORE_DOT_DIRS:
+                            continue
+                    elif name in IGNORE_PLAIN_DIRS:
+                        continue
+                    stack.append(entry.path)
+                elif entry.is_dir():
+                    # Symlinked directory: not followed, and not a file either
+                    continue
+                # Hide only macos specific junk or hidden temp files
+                elif entry.name not in IGNORE_FILES and not entry.name.startswith('._'):
+                    yield entry.path[base_len:]
+
 @app.get("/api/files/{session_id}")
-async def get_files(session_id: str):
+def get_files(session_id: str, request: Request):
     """Get the list of files in the repository."""
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found.")
-    
-    session = sessions[session_id]
-    files = []
-    
-    # Common junk patterns to ignore (very minimal now)
-    ignore_files = {".DS_Store", "Thumbs.db"}
+    session = _get_session(session_id)
     
-    for root, dirs, file_list in os.walk(session._repo_path):
-        # Filter out only extreme internal/junk directories
-        dirs[:] = [d for d in dirs if d != '__pycache__' 
-                   and d != 'node_modules'
-                   and d != 'dist'
-                   and d != 'build'
-                   and d != '.git'
-                   and d != '.agent_log']
-        
-        for f in file_list:
-            # Hide only macos specific junk or hidden temp files
-            if f in ignore_files or f.startswith('._'):
-                continue
-                
-            full_path = os.path.join(root, f)
-            rel_path = os.path.relpath(full_path, session._repo_path)
-            files.append(rel_path)
+    cached = _file_cache.get(session_id)
+    if cached is not None and time.monotonic() - cached[0] < FILE_CACHE_TTL:
+        _, files, etag = cached
+    else:
+        files = list(_walk_files(session._repo_path))
+        files.sort()
+        digest = hashlib.blake2b("\n".join(files).encode(), digest_size=8).hexdigest()
+        etag = f'W/"{digest}"'
+        _file_cache[session_id] = (time.monotonic(), files, etag)
     
-    return {"files": sorted(files)}
+    # Unchanged tree: no body at all for the UI's periodic refresh
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=_etag_headers(etag))
+    return JSONResponse({"files": files}, headers=_etag_headers(etag))
+
+# Files at or above this size are streamed as text/plain instead of JSON
+INLINE_PREVIEW_LIMIT = 256 * 1024
+# Files above this size are never sent whole: only the first MAX_PREVIEW
+# bytes are read, and the response is marked truncated
+MAX_PREVIEW = int(os.getenv("AGENT_MAX_PREVIEW", str(2 * 1024 * 1024)))
 
 @app.get("/api/files/content/{session_id}")
-async def get_file_content(session_id: str, path: str):
+def get_file_content(session_id: str, path: str, request: Request):
     """Read content of a file."""
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found.")
+    session = _get_session(session_id)
     
-    session = sessions[session_id]
     full_path = os.path.join(session._repo_path, path)
     
-    if not os.path.exists(full_path) or not os.path.isfile(full_path):
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        raise HTTPException(status_code=404, detail="File not found.")
+    if not stat.S_ISREG(st.st_mode):
         raise HTTPException(status_code=404, detail="File not found.")
+    
+    # mtime + size identify the version; a match skips reading the file
+    etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=_etag_headers(etag))
+    
+    if st.st_size > MAX_PREVIEW:
+        try:
+            with open(full_path, 'r', encoding='utf-8', errors='replace') as f:
+                head = f.read(MAX_PREVIEW)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        return JSONResponse(
+            {"content": head, "path": path, "truncated": True, "size": st.st_size},
+            headers=_etag_headers(etag),
+        )
+    
+    # Large files are streamed from disk in chunks as plain text rather than
+    # read whole and JSON-wrapped (bytes -> str -> escaped str in memory)
+    if st.st_size >= INLINE_PREVIEW_LIMIT:
+        return FileResponse(
+            full_path,
+            media_type="text/plain",
+            headers={"Content-Disposition": "inline", **_etag_headers(etag)},
+            stat_result=st,
+        )
         
     try:
         with open(full_path, 'r', encoding='utf-8') as f:
             content = f.read()
-        return {"content": content, "path": path}
+        return JSONResponse({"content": content, "path": path}, headers=_etag_headers(etag))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/files/{session_id}")
-async def delete_file(session_id: str, path: str):
+def delete_file(session_id: str, path: str):
     """Delete a file from the repository."""
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found.")
+    session = _get_session(session_id)
     
-    session = sessions[session_id]
     full_path = os.path.join(session._repo_path, path)
     
     if not os.path.exists(full_path):
@@ -325,17 +661,15 @@ async def delete_file(session_id: str, path: str):
         else:
             import shutil
             shutil.rmtree(full_path)
+        _invalidate_file_cache(session_id)
         return {"status": "success", "message": f"Deleted {path}"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/diff/{session_id}")
-async def get_diff(session_id: str):
+def get_diff(session_id: str):
     """Get the git diff of the repository."""
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found.")
-    
-    session = sessions[session_id]
+    session = _get_session(session_id)
     
     try:
         import subprocess
@@ -154,6 +154,40 @@ INTENT_ALLOWED_STATES: dict[TaskIntent, set[AgentState]] = {
 }
 
 
+# -- Bitmask tables --
+# validate_transition runs on every FSM step. Each state's allowed targets are
+# packed into one int (bit N = state with value N), so legality is a shift and
+# an AND. Built once at import from the dicts above, which remain the source
+# of truth — rebuild with _build_masks() (and clear _TRANSITION_RESULTS) if
+# they are ever modified.
+
+def _state_mask(states) -> int:
+    mask = 0
+    for state in states:
+        mask |= 1 << state.value
+    return mask
+
+
+def _build_masks() -> tuple[list[int], dict[TaskIntent, int]]:
+    transition_mask = [0] * (max(s.value for s in AgentState) + 1)
+    for source, targets in VALID_TRANSITIONS.items():
+        transition_mask[source.value] = _state_mask(targets)
+    intent_mask = {
+        intent: _state_mask(states)
+        for intent, states in INTENT_ALLOWED_STATES.items()
+    }
+    return transition_mask, intent_mask
+
+
+TRANSITION_MASK, INTENT_ALLOWED_MASK = _build_masks()
+TERMINAL_MASK = _state_mask(TERMINAL_STATES)
+
+# (current, target, intent) -> validate_transition result. There are only
+# states² × (intents + 1) combinations, so each is evaluated (and its reason
+# formatted) once, on first use, rather than all of them at import.
+_TRANSITION_RESULTS: dict[tuple, tuple[bool, str]] = {}
+
+
 @dataclass
 class IntentResult:
     """Result of intent classification with confidence."""
@@ -228,20 +262,55 @@ def validate_transition(
 
     Returns (is_valid, reason).
     """
+    key = (current, target, intent)
+    try:
+        return _TRANSITION_RESULTS[key]
+    except KeyError:
+        result = _TRANSITION_RESULTS[key] = _evaluate_transition(current, target, intent)
+        return result
+
+
+def _evaluate_transition(
+    current: AgentState,
+    target: AgentState,
+    intent: Optional[TaskIntent],
+) -> tuple[bool, str]:
+    # Terminal states never leave
+    if (TERMINAL_MASK >> current.value) & 1:
+        return False, _format_terminal(current, target)
+
     # Check basic transition legality
-    allowed = VALID_TRANSITIONS.get(current, set())
-    if target not in allowed:
-        return False, (
-            f"Illegal transition: {current.name} → {target.name}. "
-            f"Allowed: {[s.name for s in allowed]}"
-        )
+    if not (TRANSITION_MASK[current.value] >> target.value) & 1:
+        return False, _format_illegal(current, target)
 
     # Check intent restrictions
-    if intent and intent in INTENT_ALLOWED_STATES:
-        if target not in INTENT_ALLOWED_STATES[intent]:
-            return False, (
-                f"State {target.name} not allowed for intent {intent.value}. "
-                f"EXPLAIN tasks cannot enter IMPLEMENTING."
-            )
+    if intent is not None:
+        mask = INTENT_ALLOWED_MASK.get(intent)
+        if mask is not None and not (mask >> target.value) & 1:
+            return False, _format_intent_denied(target, intent)
 
     return True, "OK"
+
+
+# Diagnostics are only formatted on the failure path
+
+def _format_illegal(current: AgentState, target: AgentState) -> str:
+    allowed = VALID_TRANSITIONS.get(current, set())
+    return (
+        f"Illegal transition: {current.name} → {target.name}. "
+        f"Allowed: {[s.name for s in allowed]}"
+    )
+
+
+def _format_terminal(current: AgentState, target: AgentState) -> str:
+    return (
+        f"Illegal transition: {current.name} → {target.name}. "
+        f"{current.name} is a terminal state."
+    )
+
+
+def _format_intent_denied(target: AgentState, intent: TaskIntent) -> str:
+    return (
+        f"State {target.name} not allowed for intent {intent.value}. "
+        f"EXPLAIN tasks cannot enter IMPLEMENTING."
+    )
@@ -12,19 +12,25 @@ from __future__ import annotations
 
 import ast
 import re
+import hashlib
 import logging
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Analyses kept for unchanged test files, keyed by content digest + SUT
+ANALYSIS_CACHE_SIZE = 2048
+
 
 class MockingViolation(Exception):
     """Raised when a tautological test is detected."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class MockingAnalysis:
     """Result of anti-mocking analysis on a test file."""
     test_file: str
@@ -51,31 +57,78 @@ class AntiMockingValidator:
         4. Not all assertions are on mock return values
     """
 
+    # Invariant patterns for the line-based fallback, compiled once
+    _ASSERT_RE = re.compile(r"\bself\.assert\w+\(|assert\s+")
+    _MOCK_ASSERT_RE = re.compile(r"\.assert_called|\.assert_any_call|\.assert_not_called")
+    _MOCK_RE = re.compile(r"\bMock\(|MagicMock\(|patch\(|@patch")
+    _SUT_MOCK_TMPL = r"@patch\(['\"]({sut})\.[^'\"]+['\"]\)"
+    # All four as one alternation, each alternative inside a lookahead so
+    # every start position is tried and overlapping hits aren't consumed.
+    # No two alternatives can begin at the same position except a SUT patch
+    # and the generic @patch, so smock comes first and implies mock.
+    _FUSED_TMPL = (
+        "(?=(?P<smock>" + _SUT_MOCK_TMPL + ")"
+        "|(?P<massert>" + _MOCK_ASSERT_RE.pattern + ")"
+        "|(?P<mock>" + _MOCK_RE.pattern + ")"
+        "|(?P<assert>" + _ASSERT_RE.pattern + "))"
+    )
+
+    _MOCK_ASSERT_PREFIXES = ("assert_called", "assert_any_call", "assert_not_called")
+    _MOCK_FACTORIES = frozenset({"Mock", "MagicMock", "patch"})
+
+    _cache: OrderedDict = OrderedDict()
+    _cache_lock = threading.Lock()
+
     @staticmethod
     def analyze(test_content: str, sut_module: str, test_file: str = "<unknown>") -> MockingAnalysis:
         """
         Analyze a test file for tautological patterns.
+
+        Results are cached by content, so re-checking an unchanged test file
+        is a lookup. Each caller gets its own copy.
         
         Args:
             test_content: The source code of the test file
             sut_module: The module being tested (e.g., "agent.intent")
             test_file: Path to the test file for reporting
         """
-        analysis = MockingAnalysis(test_file=test_file)
+        cls = AntiMockingValidator
+        key = (
+            hashlib.blake2b(test_content.encode("utf-8", "surrogatepass"), digest_size=16).digest(),
+            sut_module,
+        )
+        with cls._cache_lock:
+            cached = cls._cache.get(key)
+            if cached is not None:
+                cls._cache.move_to_end(key)
+        if cached is None:
+            cached = cls._analyze(test_content, sut_module)
+            with cls._cache_lock:
+                cls._cache[key] = cached
+                if len(cls._cache) > ANALYSIS_CACHE_SIZE:
+                    cls._cache.popitem(last=False)
+        return replace(
+            cached,
+            test_file=test_file,
+            violations=list(cached.violations),
+            warnings=list(cached.warnings),
+        )
 
-        lines = test_content.split("\n")
+    @staticmethod
+    def _analyze(test_content: str, sut_module: str) -> MockingAnalysis:
+        """Uncached analysis; test_file is filled in by analyze()."""
+        analysis = MockingAnalysis(test_file="<unknown>")
+
+        # Parse once and read imports / asserts / mocks off the tree, which
+        # ignores comments and strings; unparsable tests get the line scan
+        try:
+            tree = ast.parse(test_content)
+        except SyntaxError:
+            mocks_sut = AntiMockingValidator._scan_lines(analysis, test_content, sut_module)
+        else:
+            mocks_sut = AntiMockingValidator._scan_tree(analysis, tree, test_content, sut_module)
 
         # Check 1: Does the test import the SUT?
-        sut_parts = sut_module.split(".")
-        sut_import_patterns = [
-            f"from {sut_module}",
-            f"import {sut_module}",
-            f"from {'.'.join(sut_parts[:-1])}",
-        ]
-        analysis.imports_sut = any(
-            any(pattern in line for pattern in sut_import_patterns)
-            for line in lines
-        )
         if not analysis.imports_sut:
             analysis.violations.append(
                 f"Test does not import SUT module '{sut_module}'. "
@@ -83,22 +136,6 @@ class AntiMockingValidator:
             )
 
         # Check 2: Count real assertions vs mock assertions
-        assert_pattern = re.compile(r"\bself\.assert\w+\(|assert\s+")
-        mock_assert_pattern = re.compile(r"\.assert_called|\.assert_any_call|\.assert_not_called")
-        mock_pattern = re.compile(r"\bMock\(|MagicMock\(|patch\(|@patch")
-
-        for line in lines:
-            stripped = line.strip()
-            if assert_pattern.search(stripped):
-                analysis.assert_count += 1
-            if mock_assert_pattern.search(stripped):
-                analysis.mock_count += 1
-                analysis.warnings.append(
-                    f"Mock assertion found: {stripped[:80]}"
-                )
-            if mock_pattern.search(stripped):
-                analysis.mock_count += 1
-
         analysis.has_real_assertions = analysis.assert_count > 0
 
         if not analysis.has_real_assertions:
@@ -113,19 +150,102 @@ class AntiMockingValidator:
             )
 
         # Check 4: Detect mocking the SUT itself
-        sut_mock_pattern = re.compile(
-            rf"@patch\(['\"]({re.escape(sut_module)})\.[^'\"]+['\"]\)"
-        )
-        for line in lines:
-            if sut_mock_pattern.search(line.strip()):
-                analysis.violations.append(
-                    f"Test mocks the SUT itself ({sut_module}). "
-                    f"Mock dependencies, not the thing being tested."
-                )
-                break
+        if mocks_sut:
+            analysis.violations.append(
+                f"Test mocks the SUT itself ({sut_module}). "
+                f"Mock dependencies, not the thing being tested."
+            )
 
         return analysis
 
+    @staticmethod
+    def _scan_tree(analysis: MockingAnalysis, tree: ast.AST, test_content: str, sut_module: str) -> bool:
+        """Fill analysis from a single AST walk. Returns whether the SUT is patched."""
+        cls = AntiMockingValidator
+        sut_parent = sut_module.rpartition(".")[0]
+        sut_prefix = sut_module + "."
+        lines = test_content.split("\n")
+        mocks_sut = False
+        mock_asserts = []
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                if any(a.name == sut_module or a.name.startswith(sut_prefix) for a in node.names):
+                    analysis.imports_sut = True
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                if module.startswith(sut_module) or (sut_parent and module.startswith(sut_parent)):
+                    analysis.imports_sut = True
+            elif isinstance(node, ast.Assert):
+                analysis.assert_count += 1
+            elif isinstance(node, ast.Call):
+                func = node.func
+                name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "")
+                if isinstance(func, ast.Attribute) and name.startswith(cls._MOCK_ASSERT_PREFIXES):
+                    analysis.mock_count += 1
+                    mock_asserts.append(node.lineno)
+                elif (
+                    isinstance(func, ast.Attribute)
+                    and name.startswith("assert")
+                    and isinstance(func.value, ast.Name)
+                    and func.value.id == "self"
+                ):
+                    analysis.assert_count += 1
+                elif name in cls._MOCK_FACTORIES:
+                    analysis.mock_count += 1
+                    if (
+                        name == "patch"
+                        and node.args
+                        and isinstance(node.args[0], ast.Constant)
+                        and isinstance(node.args[0].value, str)
+                        and node.args[0].value.startswith(sut_prefix)
+                    ):
+                        mocks_sut = True
+
+        # ast.walk is breadth-first; report mock assertions in source order
+        for lineno in sorted(mock_asserts):
+            analysis.warnings.append(
+                f"Mock assertion found: {lines[lineno - 1].strip()[:80]}"
+            )
+        return mocks_sut
+
+    @staticmethod
+    def _scan_lines(analysis: MockingAnalysis, test_content: str, sut_module: str) -> bool:
+        """Fill analysis from a line scan. Returns whether the SUT is patched."""
+        cls = AntiMockingValidator
+        sut_parts = sut_module.split(".")
+        sut_import_patterns = [
+            f"from {sut_module}",
+            f"import {sut_module}",
+            f"from {'.'.join(sut_parts[:-1])}",
+        ]
+        fused = re.compile(cls._FUSED_TMPL.replace("{sut}", re.escape(sut_module)))
+        mocks_sut = False
+
+        # One pass over pre-stripped lines, one regex scan per line. Each
+        # check counts at most once per line, as separate searches would.
+        for stripped in (line.strip() for line in test_content.splitlines()):
+            if not stripped:
+                continue
+            if not analysis.imports_sut and any(p in stripped for p in sut_import_patterns):
+                analysis.imports_sut = True
+            hits = {m.lastgroup for m in fused.finditer(stripped)}
+            if not hits:
+                continue
+            if "smock" in hits:
+                mocks_sut = True
+                hits.add("mock")
+            if "assert" in hits:
+                analysis.assert_count += 1
+            if "massert" in hits:
+                analysis.mock_count += 1
+                analysis.warnings.append(
+                    f"Mock assertion found: {stripped[:80]}"
+                )
+            if "mock" in hits:
+                analysis.mock_count += 1
+        return mocks_sut
+
     @staticmethod
     def validate(test_content: str, sut_module: str, test_file: str = "<unknown>"):
         """
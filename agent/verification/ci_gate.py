@@ -13,13 +13,17 @@ Real implementations would integrate with GitHub Actions, GitLab CI, etc.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
 from typing import Optional, Protocol
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
 
+# Most CI status requests validate_many keeps in flight at once
+CI_MAX_PARALLEL_CHECKS = 16
+
 
 class CIStatus(Enum):
     """CI pipeline status values."""
@@ -31,9 +35,9 @@ class CIStatus(Enum):
     UNKNOWN = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CIResult:
-    """Result from a CI pipeline run."""
+    """Result from a CI pipeline run. Immutable, so instances can be shared."""
     sha: str                         # SHA the CI ran against
     status: CIStatus                 # Pass/Fail/Pending
     is_latest: bool = True           # Is this the latest run for this SHA?
@@ -77,25 +81,33 @@ class MockCIGate(CIGateInterface):
         self._default_status = default_status
         self._overrides: dict[str, CIStatus] = {}
         self._run_counter = 0
+        # sha -> result, built on first lookup and shared until the
+        # configuration or run counter changes
+        self._results: dict[str, CIResult] = {}
 
     def set_status_for_sha(self, sha: str, status: CIStatus):
         """Configure a specific status for a SHA (for testing)."""
         self._overrides[sha] = status
+        self._results.pop(sha, None)
 
     def get_status(self, sha: str) -> CIResult:
         """Get mock CI status."""
-        status = self._overrides.get(sha, self._default_status)
-        return CIResult(
-            sha=sha,
-            status=status,
-            is_latest=True,
-            run_id=f"mock-run-{self._run_counter}",
-            details=f"Mock CI: {status.name}",
-        )
+        result = self._results.get(sha)
+        if result is None:
+            status = self._overrides.get(sha, self._default_status)
+            result = self._results[sha] = CIResult(
+                sha=sha,
+                status=status,
+                is_latest=True,
+                run_id=f"mock-run-{self._run_counter}",
+                details=f"Mock CI: {status.name}",
+            )
+        return result
 
     def trigger_run(self, sha: str) -> str:
         """Trigger a mock CI run."""
         self._run_counter += 1
+        self._results.clear()  # Cached results carry the old run_id
         run_id = f"mock-run-{self._run_counter}"
         logger.info(f"Mock CI triggered: run_id={run_id}, sha={sha[:12]}")
         return run_id
@@ -137,12 +149,24 @@ class CIGate:
 
         if result.sha != sha:
             logger.critical(f"CI gate: SHA mismatch! Expected {sha[:12]}, got {result.sha[:12]}")
-            result.status = CIStatus.FAILURE
-            result.details = "SHA mismatch"
+            result = replace(result, status=CIStatus.FAILURE, details="SHA mismatch")
 
         if not result.is_latest:
             logger.critical(f"CI gate: stale run detected for {sha[:12]}")
-            result.status = CIStatus.FAILURE
-            result.details = "Stale CI run"
+            result = replace(result, status=CIStatus.FAILURE, details="Stale CI run")
 
         return result
+
+    def validate_many(self, pairs: list[tuple[str, str]]) -> list[CIResult]:
+        """
+        Validate several (sha, branch_base_sha) pairs concurrently.
+
+        Status lookups are I/O-bound round-trips to the CI system, so they
+        run in parallel. Results come back in the order of pairs.
+        """
+        if not pairs:
+            return []
+        if len(pairs) == 1:
+            return [self.validate(*pairs[0])]
+        with ThreadPoolExecutor(max_workers=min(CI_MAX_PARALLEL_CHECKS, len(pairs))) as pool:
+            return list(pool.map(lambda pair: self.validate(*pair), pairs))
@@ -14,20 +14,47 @@ This module acts as the agent's "self-diagnostic" — run before any real task.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional
+from pathlib import Path
+from typing import Callable, Optional
 
 from agent.state import AgentState, TaskIntent, validate_transition
-from agent.mechanisms.risk_budget import RiskBudget
-from agent.security.command_safety import classify_command, CommandPolicy, CommandTier
-from agent.security.rbac import UserRole, Permission, check_access
-from agent.planning.intent import IntentClassifier
-from agent.core.controller import StateMachineController
+
+# The subsystems under test are imported inside their checks: importing them
+# (agent.planning pulls in agent.core) costs more than the whole self-test,
+# and most processes that import this package never run it.
 
 logger = logging.getLogger(__name__)
 
+# Passing reports are cached here, keyed by a hash of the modules they check
+SELF_TEST_CACHE_DIR = Path(
+    os.environ.get("GOD_MODE_SELFTEST_CACHE", Path.home() / ".godmode" / "selftest")
+)
+
+# Sources whose behaviour the checks exercise, relative to the agent package.
+# Keep in sync when a check starts depending on another module.
+_DEPENDENCY_FILES = (
+    "state.py",
+    "mechanisms/risk_budget.py",
+    "mechanisms/decision_logger.py",
+    "security/command_safety.py",
+    "security/rule_engine.py",
+    "security/regex_backend.py",
+    "security/governance.py",
+    "security/rbac.py",
+    "security/preconditions.py",
+    "planning/intent.py",
+    "core/controller.py",
+    "verification/governance_self_test.py",
+)
+_AGENT_ROOT = Path(__file__).resolve().parent.parent
+
 
 class TestResult(Enum):
     PASS = auto()
@@ -35,7 +62,7 @@ class TestResult(Enum):
     SKIP = auto()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SelfTestCase:
     """Result of a single self-test check."""
     name: str
@@ -44,18 +71,33 @@ class SelfTestCase:
     details: str = ""
 
 
-@dataclass
+RESULT_ICONS = {TestResult.PASS: "✅", TestResult.FAIL: "❌", TestResult.SKIP: "⏭️"}
+# "  <icon> [" per result, indexed by TestResult.value (auto() counts from 1)
+_ROW_PREFIXES = ("", *(f"  {RESULT_ICONS[result]} [" for result in TestResult))
+_STATUS = {True: "✅ ALL PASSED", False: "❌ FAILURES DETECTED"}
+
+
+@dataclass(slots=True)
 class SelfTestReport:
-    """Aggregate report of all self-test results."""
+    """Aggregate report of all self-test results. Add cases with add_case()."""
     cases: list[SelfTestCase] = field(default_factory=list)
+    _counts: Counter = field(default_factory=Counter, init=False, repr=False)
+
+    def __post_init__(self):
+        self._counts.update(c.result for c in self.cases)
+
+    def add_case(self, case: SelfTestCase):
+        """Record a case, keeping the pass/fail tallies current."""
+        self.cases.append(case)
+        self._counts[case.result] += 1
 
     @property
     def passed(self) -> int:
-        return sum(1 for c in self.cases if c.result == TestResult.PASS)
+        return self._counts[TestResult.PASS]
 
     @property
     def failed(self) -> int:
-        return sum(1 for c in self.cases if c.result == TestResult.FAIL)
+        return self._counts[TestResult.FAIL]
 
     @property
     def total(self) -> int:
@@ -66,12 +108,168 @@ class SelfTestReport:
         return self.failed == 0
 
     def summary(self) -> str:
-        status = "✅ ALL PASSED" if self.all_passed else "❌ FAILURES DETECTED"
-        lines = [f"Governance Self-Test: {status} ({self.passed}/{self.total})"]
-        for case in self.cases:
-            icon = "✅" if case.result == TestResult.PASS else "❌" if case.result == TestResult.FAIL else "⏭️"
-            lines.append(f"  {icon} [{case.category}] {case.name}: {case.details}")
-        return "\n".join(lines)
+        header = f"Governance Self-Test: {_STATUS[self.all_passed]} ({self.passed}/{self.total})"
+        prefixes = _ROW_PREFIXES
+        return "\n".join([header, *[
+            f"{prefixes[case.result.value]}{case.category}] {case.name}: {case.details}"
+            for case in self.cases
+        ]])
+
+
+# ── Checks ──
+# Each check returns (passed, details).
+
+def _transition_check(current, target, expect_valid, ok, bad, intent=None):
+    def check():
+        is_valid, _ = validate_transition(current, target, intent=intent)
+        passed = is_valid == expect_valid
+        return passed, ok if passed else bad
+    return check
+
+
+def _fresh_budget_check():
+    from agent.mechanisms.risk_budget import RiskBudget
+    budget = RiskBudget()
+    budget.start()
+    time_violation = budget.check_time()
+    if time_violation is None:
+        return True, "No violation"
+    return False, f"Unexpected: {time_violation}"
+
+
+def _retry_limit_check():
+    from agent.mechanisms.risk_budget import RiskBudget
+    budget = RiskBudget()
+    budget.start()
+    for i in range(10):
+        if budget.record_retry("TEST") is not None:
+            return True, f"Triggered at attempt {i+1}"
+    return False, "Never triggered!"
+
+
+def _command_check(command, attr, expected):
+    """expected is a CommandPolicy / CommandTier member name, per attr."""
+    def check():
+        from agent.security.command_safety import classify_command
+        value = getattr(classify_command(command), attr)
+        label = "Policy" if attr == "policy" else "Tier"
+        return value.name == expected, f"{label}: {value.name}"
+    return check
+
+
+def _access_check(role, permission, expect_allowed, ok, bad):
+    """role / permission are UserRole / Permission member names."""
+    def check():
+        from agent.security.rbac import UserRole, Permission, check_access
+        passed = check_access(UserRole[role], Permission[permission]) == expect_allowed
+        return passed, ok if passed else bad
+    return check
+
+
+def _fix_intent_check():
+    from agent.planning.intent import IntentClassifier
+    # Use heuristic mode (no LLM) for self-test
+    result = IntentClassifier(provider=None).classify("fix the error in auth")
+    return (
+        result.intent == TaskIntent.FIX,
+        f"Intent: {result.intent.value}, Confidence: {result.confidence:.2f}",
+    )
+
+
+def _ambiguous_intent_check():
+    from agent.planning.intent import IntentClassifier
+    result = IntentClassifier(provider=None).classify("maybe check something")
+    return (
+        not result.is_confident,
+        f"Confidence: {result.confidence:.2f}, Clarification: {result.requires_clarification}",
+    )
+
+
+def _controller_rejects_check():
+    from agent.core.controller import StateMachineController
+    ctrl = StateMachineController(session_id="self_test")
+    # Try illegal transition (IDLE -> COMPLETE)
+    success = ctrl.transition_to(AgentState.COMPLETE, "Self-test illegal transition")
+    return not success, "Correctly rejected" if not success else "Incorrectly allowed!"
+
+
+# (category, name, check), run in order
+SELF_TEST_TABLE: tuple[tuple[str, str, Callable[[], tuple[bool, str]]], ...] = (
+    # State machine: legal transitions succeed, illegal ones fail
+    ("StateMachine", "IDLE→INTENT_ANALYSIS is legal", _transition_check(
+        AgentState.IDLE, AgentState.INTENT_ANALYSIS, True,
+        "Legal transition accepted", "Legal transition rejected!")),
+    ("StateMachine", "IDLE→IMPLEMENTING is illegal", _transition_check(
+        AgentState.IDLE, AgentState.IMPLEMENTING, False,
+        "Illegal transition blocked", "Illegal transition allowed!")),
+    ("StateMachine", "COMPLETE is terminal", _transition_check(
+        AgentState.COMPLETE, AgentState.IDLE, False,
+        "Terminal state enforced", "Terminal state violated!")),
+    ("StateMachine", "EXPLAIN cannot reach IMPLEMENTING", _transition_check(
+        AgentState.PLANNING, AgentState.IMPLEMENTING, False,
+        "Intent restriction enforced", "Intent restriction violated!", intent=TaskIntent.EXPLAIN)),
+    # Risk budget: time and retry limits work
+    ("RiskBudget", "Fresh budget has no time violation", _fresh_budget_check),
+    ("RiskBudget", "Retry limit triggers within 10 attempts", _retry_limit_check),
+    # Command safety: dangerous commands blocked, safe ones allowed
+    ("CommandSafety", "'ls -la' is ALLOWED", _command_check("ls -la", "policy", "ALLOW")),
+    ("CommandSafety", "'rm -rf /' is BLOCKED", _command_check("rm -rf /", "policy", "BLOCK")),
+    ("CommandSafety", "'pip install' is NETWORK tier",
+        _command_check("pip install requests", "tier", "NETWORK")),
+    # RBAC: permission checks work
+    ("RBAC", "DEVELOPER can approve test runs", _access_check(
+        "DEVELOPER", "APPROVE_TEST_RUN", True,
+        "Permission granted", "Permission denied!")),
+    ("RBAC", "DEVELOPER cannot approve arch changes", _access_check(
+        "DEVELOPER", "APPROVE_ARCH_CHANGE", False,
+        "Permission correctly denied", "Permission incorrectly granted!")),
+    # Intent classifier: ambiguous inputs handled correctly
+    ("IntentClassifier", "'fix the error' → FIX intent", _fix_intent_check),
+    ("IntentClassifier", "Ambiguous input triggers low confidence", _ambiguous_intent_check),
+    # Controller: fails safely on invalid transitions
+    ("Controller", "Controller rejects IDLE→COMPLETE", _controller_rejects_check),
+)
+
+
+def _dependency_key() -> str:
+    """Hash of every dependency's source; any edit gives a new key."""
+    digest = hashlib.blake2b(digest_size=20)
+    for rel in _DEPENDENCY_FILES:
+        digest.update(rel.encode())
+        try:
+            digest.update((_AGENT_ROOT / rel).read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def _load_cached_report(path: Path) -> Optional[SelfTestReport]:
+    try:
+        rows = json.loads(path.read_text(encoding="utf-8"))
+        return SelfTestReport(cases=[
+            SelfTestCase(name=r["name"], category=r["category"],
+                         result=TestResult[r["result"]], details=r["details"])
+            for r in rows
+        ])
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Self-test cache: ignoring unreadable {path}: {e}")
+        return None
+
+
+def _store_report(path: Path, report: SelfTestReport):
+    rows = [
+        {"name": c.name, "category": c.category, "result": c.result.name, "details": c.details}
+        for c in report.cases
+    ]
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(rows), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Self-test cache: could not write {path}: {e}")
 
 
 class GovernanceSelfTest:
@@ -83,189 +281,42 @@ class GovernanceSelfTest:
         report = tester.run_all()
         if not report.all_passed:
             raise RuntimeError("Governance self-test failed")
+
+    A passing report is cached on disk under a hash of the checked
+    modules' source, and reused until any of them changes. Pass
+    cache_dir=None to always run the checks.
     """
 
+    def __init__(self, cache_dir: Optional[Path] = SELF_TEST_CACHE_DIR):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+
     def run_all(self) -> SelfTestReport:
         """Run all self-test categories and return aggregate report."""
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = self.cache_dir / f"{_dependency_key()}.json"
+            cached = _load_cached_report(cache_path)
+            if cached is not None and cached.all_passed:
+                logger.info(f"{cached.summary()}\n  (cached: governance modules unchanged)")
+                return cached
+
         report = SelfTestReport()
 
-        self._test_state_machine(report)
-        self._test_risk_budget(report)
-        self._test_command_safety(report)
-        self._test_rbac(report)
-        self._test_intent_classifier(report)
-        self._test_transition_validation(report)
+        for category, name, check in SELF_TEST_TABLE:
+            passed, details = check()
+            report.add_case(SelfTestCase(
+                name=name,
+                category=category,
+                result=TestResult.PASS if passed else TestResult.FAIL,
+                details=details,
+            ))
 
         logger.info(report.summary())
+        # Only passes are cached, so a failure is re-checked on every run
+        if cache_path is not None and report.all_passed:
+            _store_report(cache_path, report)
         return report
 
-    def _test_state_machine(self, report: SelfTestReport):
-        """Verify legal transitions succeed and illegal ones fail."""
-        cat = "StateMachine"
-
-        # Legal: IDLE -> INTENT_ANALYSIS
-        is_valid, _ = validate_transition(AgentState.IDLE, AgentState.INTENT_ANALYSIS)
-        report.cases.append(SelfTestCase(
-            name="IDLE→INTENT_ANALYSIS is legal",
-            category=cat,
-            result=TestResult.PASS if is_valid else TestResult.FAIL,
-            details="Legal transition accepted" if is_valid else "Legal transition rejected!",
-        ))
-
-        # Illegal: IDLE -> IMPLEMENTING (skip states)
-        is_valid, _ = validate_transition(AgentState.IDLE, AgentState.IMPLEMENTING)
-        report.cases.append(SelfTestCase(
-            name="IDLE→IMPLEMENTING is illegal",
-            category=cat,
-            result=TestResult.PASS if not is_valid else TestResult.FAIL,
-            details="Illegal transition blocked" if not is_valid else "Illegal transition allowed!",
-        ))
-
-        # Illegal: COMPLETE -> anything (terminal state)
-        is_valid, _ = validate_transition(AgentState.COMPLETE, AgentState.IDLE)
-        report.cases.append(SelfTestCase(
-            name="COMPLETE is terminal",
-            category=cat,
-            result=TestResult.PASS if not is_valid else TestResult.FAIL,
-            details="Terminal state enforced" if not is_valid else "Terminal state violated!",
-        ))
-
-        # Intent restriction: EXPLAIN cannot enter IMPLEMENTING
-        is_valid, _ = validate_transition(
-            AgentState.PLANNING, AgentState.IMPLEMENTING, intent=TaskIntent.EXPLAIN
-        )
-        report.cases.append(SelfTestCase(
-            name="EXPLAIN cannot reach IMPLEMENTING",
-            category=cat,
-            result=TestResult.PASS if not is_valid else TestResult.FAIL,
-            details="Intent restriction enforced" if not is_valid else "Intent restriction violated!",
-        ))
-
-    def _test_risk_budget(self, report: SelfTestReport):
-        """Verify that risk budget time and retry limits work."""
-        cat = "RiskBudget"
-
-        budget = RiskBudget()
-        budget.start()
-
-        # Fresh budget should have no violations
-        time_violation = budget.check_time()
-        report.cases.append(SelfTestCase(
-            name="Fresh budget has no time violation",
-            category=cat,
-            result=TestResult.PASS if time_violation is None else TestResult.FAIL,
-            details="No violation" if time_violation is None else f"Unexpected: {time_violation}",
-        ))
-
-        # Retry limit should eventually trigger
-        budget2 = RiskBudget()
-        budget2.start()
-        triggered = False
-        for i in range(10):
-            v = budget2.record_retry("TEST")
-            if v is not None:
-                triggered = True
-                break
-        report.cases.append(SelfTestCase(
-            name="Retry limit triggers within 10 attempts",
-            category=cat,
-            result=TestResult.PASS if triggered else TestResult.FAIL,
-            details=f"Triggered at attempt {i+1}" if triggered else "Never triggered!",
-        ))
-
-    def _test_command_safety(self, report: SelfTestReport):
-        """Verify dangerous commands are blocked and safe ones allowed."""
-        cat = "CommandSafety"
-
-        # Safe command
-        result = classify_command("ls -la")
-        report.cases.append(SelfTestCase(
-            name="'ls -la' is ALLOWED",
-            category=cat,
-            result=TestResult.PASS if result.policy == CommandPolicy.ALLOW else TestResult.FAIL,
-            details=f"Policy: {result.policy.name}",
-        ))
-
-        # Blocked command
-        result = classify_command("rm -rf /")
-        report.cases.append(SelfTestCase(
-            name="'rm -rf /' is BLOCKED",
-            category=cat,
-            result=TestResult.PASS if result.policy == CommandPolicy.BLOCK else TestResult.FAIL,
-            details=f"Policy: {result.policy.name}",
-        ))
-
-        # Network command needs approval/rate-limit
-        result = classify_command("pip install requests")
-        report.cases.append(SelfTestCase(
-            name="'pip install' is NETWORK tier",
-            category=cat,
-            result=TestResult.PASS if result.tier == CommandTier.NETWORK else TestResult.FAIL,
-            details=f"Tier: {result.tier.name}",
-        ))
-
-    def _test_rbac(self, report: SelfTestReport):
-        """Verify RBAC permission checks work."""
-        cat = "RBAC"
-
-        # Developer can approve test runs
-        can = check_access(UserRole.DEVELOPER, Permission.APPROVE_TEST_RUN)
-        report.cases.append(SelfTestCase(
-            name="DEVELOPER can approve test runs",
-            category=cat,
-            result=TestResult.PASS if can else TestResult.FAIL,
-            details="Permission granted" if can else "Permission denied!",
-        ))
-
-        # Developer cannot approve arch changes
-        can = check_access(UserRole.DEVELOPER, Permission.APPROVE_ARCH_CHANGE)
-        report.cases.append(SelfTestCase(
-            name="DEVELOPER cannot approve arch changes",
-            category=cat,
-            result=TestResult.PASS if not can else TestResult.FAIL,
-            details="Permission correctly denied" if not can else "Permission incorrectly granted!",
-        ))
-
-    def _test_intent_classifier(self, report: SelfTestReport):
-        """Verify intent classifier handles ambiguous inputs correctly."""
-        cat = "IntentClassifier"
-
-        # Use heuristic mode (no LLM) for self-test
-        classifier = IntentClassifier(provider=None)
-
-        # Clear fix intent
-        result = classifier.classify("fix the error in auth")
-        report.cases.append(SelfTestCase(
-            name="'fix the error' → FIX intent",
-            category=cat,
-            result=TestResult.PASS if result.intent == TaskIntent.FIX else TestResult.FAIL,
-            details=f"Intent: {result.intent.value}, Confidence: {result.confidence:.2f}",
-        ))
-
-        # Ambiguous input triggers fallback
-        result = classifier.classify("maybe check something")
-        report.cases.append(SelfTestCase(
-            name="Ambiguous input triggers low confidence",
-            category=cat,
-            result=TestResult.PASS if not result.is_confident else TestResult.FAIL,
-            details=f"Confidence: {result.confidence:.2f}, Clarification: {result.requires_clarification}",
-        ))
-
-    def _test_transition_validation(self, report: SelfTestReport):
-        """Verify controller fails safely on invalid transitions."""
-        cat = "Controller"
-
-        ctrl = StateMachineController(session_id="self_test")
-
-        # Try illegal transition (IDLE -> COMPLETE)
-        success = ctrl.transition_to(AgentState.COMPLETE, "Self-test illegal transition")
-        report.cases.append(SelfTestCase(
-            name="Controller rejects IDLE→COMPLETE",
-            category=cat,
-            result=TestResult.PASS if not success else TestResult.FAIL,
-            details="Correctly rejected" if not success else "Incorrectly allowed!",
-        ))
-
 
 def run_governance_self_test() -> SelfTestReport:
     """Convenience function to run all governance self-tests."""
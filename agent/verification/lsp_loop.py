@@ -12,10 +12,17 @@ while hard-stopping on logic failures.
 from __future__ import annotations
 
 import subprocess
+import hashlib
 import logging
 import os
+import re
+import shutil
+import threading
+import traceback
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from functools import lru_cache
+from enum import IntEnum
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -24,22 +31,65 @@ logger = logging.getLogger(__name__)
 # Architecture §1: Retries limit, defaults to 7
 MAX_SYNTAX_RETRIES = int(os.environ.get("GOD_MODE_MAX_FIX_ATTEMPTS", "7"))
 
+# Lint results kept across all loops, keyed by file content
+LINT_CACHE_SIZE = 1024
 
-class FailureType(Enum):
-    """Classification of implementation failures."""
-    SYNTAX = auto()      # Parse/syntax errors — retryable
-    LINT = auto()         # Linter warnings/errors — retryable
-    TYPE_ERROR = auto()   # Type check failures — retryable (bounded)
-    LOGIC = auto()        # Test/logic failures — NOT retryable
-    RUNTIME = auto()      # Runtime errors — NOT retryable
-    UNKNOWN = auto()      # Cannot classify — NOT retryable
 
-
-# Retryable failure types
-RETRYABLE_FAILURES = {FailureType.SYNTAX, FailureType.LINT, FailureType.TYPE_ERROR}
+class FailureType(IntEnum):
+    """Classification of implementation failures. One bit each, so sets of
+    types are plain int masks."""
+    SYNTAX = 1 << 0      # Parse/syntax errors — retryable
+    LINT = 1 << 1         # Linter warnings/errors — retryable
+    TYPE_ERROR = 1 << 2   # Type check failures — retryable (bounded)
+    LOGIC = 1 << 3        # Test/logic failures — NOT retryable
+    RUNTIME = 1 << 4      # Runtime errors — NOT retryable
+    UNKNOWN = 1 << 5      # Cannot classify — NOT retryable
 
 
-@dataclass
+# Retryable failure types
+RETRYABLE_FAILURES = frozenset({FailureType.SYNTAX, FailureType.LINT, FailureType.TYPE_ERROR})
+RETRYABLE_MASK = FailureType.SYNTAX | FailureType.LINT | FailureType.TYPE_ERROR
+
+# classify_failure keywords, each with the category it signals. Categories
+# are ranked by the order of the checks in _classify, not by position.
+_FAILURE_KEYWORDS = {
+    "syntaxerror": "syntax", "syntax error": "syntax",
+    "indentationerror": "syntax", "unexpected indent": "syntax",
+    "pylint": "lint", "flake8": "lint", "ruff": "lint", "eslint": "lint", "mypy": "lint",
+    "undefined name": "lint", "unused import": "lint",
+    "typeerror": "typeerror", "argument": "argument",
+    "assertionerror": "logic", "assert": "logic", "failed": "logic", "failures=": "logic",
+    "runtimeerror": "runtime", "segfault": "runtime", "killed": "runtime", "oom": "runtime",
+}
+# One scan finds every keyword: the lookahead tries each position without
+# consuming, so overlapping keywords are all seen (longest first)
+_FAILURE_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_FAILURE_KEYWORDS, key=len, reverse=True)) + "))"
+)
+
+
+@lru_cache(maxsize=512)
+def _classify(error_output: str) -> FailureType:
+    # Identical linter output recurs across retries, hence the cache
+    found = {_FAILURE_KEYWORDS[k] for k in _FAILURE_RE.findall(error_output.lower())}
+    if "syntax" in found:
+        return FailureType.SYNTAX
+    if "lint" in found:
+        return FailureType.LINT
+    if "typeerror" in found and "argument" in found:
+        return FailureType.TYPE_ERROR
+    if "logic" in found:
+        return FailureType.LOGIC
+    if "runtime" in found:
+        return FailureType.RUNTIME
+    return FailureType.UNKNOWN
+
+# ruff is looked up on PATH once; None means not installed
+_RUFF = shutil.which("ruff")
+_RUFF_ARGV = [_RUFF, "check", "--stdin-filename"] if _RUFF else None
+
+
+@dataclass(slots=True, frozen=True)
 class LintResult:
     """Result of a lint/syntax check."""
     passed: bool
@@ -51,7 +101,7 @@ class LintResult:
     def is_retryable(self) -> bool:
         if self.failure_type is None:
             return False
-        return self.failure_type in RETRYABLE_FAILURES
+        return bool(self.failure_type & RETRYABLE_MASK)
 
 
 class BoundedLSPLoop:
@@ -63,6 +113,11 @@ class BoundedLSPLoop:
         - Logic failures: immediate STOP
     """
 
+    # Shared by every loop: retries re-lint the same files, and most of them
+    # are unchanged since the last attempt
+    _lint_cache: OrderedDict = OrderedDict()
+    _lint_cache_lock = threading.Lock()
+
     def __init__(self, max_retries: int = MAX_SYNTAX_RETRIES):
         self.max_retries = max_retries
         self._retry_count = 0
@@ -115,69 +170,25 @@ class BoundedLSPLoop:
         """
         Classify an error output into a failure type.
         
-        Heuristic-based classification of error messages.
+        Heuristic-based classification of error messages: syntax, then
+        lint, then type errors, then logic, then runtime, scanned in one pass.
         """
-        lower = error_output.lower()
-
-        # Syntax errors
-        if "syntaxerror" in lower or "syntax error" in lower:
-            return FailureType.SYNTAX
-        if "indentationerror" in lower or "unexpected indent" in lower:
-            return FailureType.SYNTAX
-
-        # Lint errors
-        if any(kw in lower for kw in ["pylint", "flake8", "ruff", "eslint", "mypy"]):
-            return FailureType.LINT
-        if "undefined name" in lower or "unused import" in lower:
-            return FailureType.LINT
-
-        # Type errors
-        if "typeerror" in lower and "argument" in lower:
-            return FailureType.TYPE_ERROR
-
-        # Logic errors — test failures
-        if any(kw in lower for kw in ["assertionerror", "assert", "failed", "failures="]):
-            return FailureType.LOGIC
-
-        # Runtime errors
-        if any(kw in lower for kw in ["runtimeerror", "segfault", "killed", "oom"]):
-            return FailureType.RUNTIME
+        return _classify(error_output)
 
-        return FailureType.UNKNOWN
-
-    @staticmethod
-    def run_linter(file_path: str, linter: str = "python") -> LintResult:
+    @classmethod
+    def run_linter(cls, file_path: str, linter: str = "python") -> LintResult:
         """
         Run a linter on a file and return structured result.
         
-        Supports: python (py_compile), ruff, flake8
+        Supports: python (compile), ruff. Results are cached by file
+        content, so re-linting an unchanged file does no work.
         """
-        if linter == "python":
-            return BoundedLSPLoop._run_python_check(file_path)
-        elif linter == "ruff":
-            return BoundedLSPLoop._run_ruff(file_path)
-        else:
+        if linter not in ("python", "ruff"):
             return LintResult(passed=True, file_path=file_path)
-
-    @staticmethod
-    def _run_python_check(file_path: str) -> LintResult:
-        """Run Python syntax check via py_compile."""
         try:
-            result = subprocess.run(
-                ["python", "-m", "py_compile", file_path],
-                capture_output=True, text=True, timeout=10,
-            )
-            if result.returncode == 0:
-                return LintResult(passed=True, file_path=file_path)
-            else:
-                error = result.stderr.strip()
-                return LintResult(
-                    passed=False,
-                    failure_type=BoundedLSPLoop.classify_failure(error),
-                    errors=[error],
-                    file_path=file_path,
-                )
-        except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+            with open(file_path, "rb") as f:
+                source = f.read()
+        except OSError as e:
             return LintResult(
                 passed=False,
                 failure_type=FailureType.UNKNOWN,
@@ -185,18 +196,64 @@ class BoundedLSPLoop:
                 file_path=file_path,
             )
 
+        key = (linter, file_path, hashlib.blake2b(source, digest_size=16).digest())
+        with cls._lint_cache_lock:
+            cached = cls._lint_cache.get(key)
+            if cached is not None:
+                cls._lint_cache.move_to_end(key)
+                return cached
+
+        if linter == "ruff":
+            result = cls._run_ruff(file_path, source)
+        else:
+            result = cls._run_python_check(file_path, source)
+        with cls._lint_cache_lock:
+            cls._lint_cache[key] = result
+            if len(cls._lint_cache) > LINT_CACHE_SIZE:
+                cls._lint_cache.popitem(last=False)
+        return result
+
+    @classmethod
+    def clear_lint_cache(cls):
+        """Forget cached lint results (e.g. after changing ruff config)."""
+        with cls._lint_cache_lock:
+            cls._lint_cache.clear()
+
     @staticmethod
-    def _run_ruff(file_path: str) -> LintResult:
-        """Run ruff linter."""
+    def _run_python_check(file_path: str, source: bytes) -> LintResult:
+        """Run Python syntax check by compiling in-process (no interpreter spawn)."""
+        try:
+            # Bytes, so PEP 263 encoding declarations are honoured as py_compile does
+            compile(source, file_path, "exec", dont_inherit=True)
+            return LintResult(passed=True, file_path=file_path)
+        # Too deeply nested to compile is a failure of the file, as it was
+        # under py_compile, not an exception for the caller
+        except (SyntaxError, ValueError, RecursionError, MemoryError) as e:
+            # Same report py_compile prints: File/line, source, caret, message
+            error = "".join(traceback.format_exception_only(type(e), e)).strip()
+            return LintResult(
+                passed=False,
+                failure_type=BoundedLSPLoop.classify_failure(error),
+                errors=[error],
+                file_path=file_path,
+            )
+
+    @staticmethod
+    def _run_ruff(file_path: str, source: bytes) -> LintResult:
+        """Run ruff linter on the already-read source (via stdin)."""
+        if _RUFF_ARGV is None:
+            # ruff not installed, fallback to python check
+            return BoundedLSPLoop._run_python_check(file_path, source)
         try:
+            # Lint exactly the bytes the cache key was computed from
             result = subprocess.run(
-                ["ruff", "check", file_path],
-                capture_output=True, text=True, timeout=10,
+                [*_RUFF_ARGV, file_path, "-"],
+                input=source, capture_output=True, timeout=10,
             )
             if result.returncode == 0:
                 return LintResult(passed=True, file_path=file_path)
             else:
-                errors = result.stdout.strip().split("\n")
+                errors = result.stdout.decode("utf-8", "replace").strip().split("\n")
                 return LintResult(
                     passed=False,
                     failure_type=FailureType.LINT,
@@ -205,4 +262,4 @@ class BoundedLSPLoop:
                 )
         except FileNotFoundError:
             # ruff not installed, fallback to python check
-            return BoundedLSPLoop._run_python_check(file_path)
+            return BoundedLSPLoop._run_python_check(file_path, source)
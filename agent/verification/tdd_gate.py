@@ -16,10 +16,16 @@ from __future__ import annotations
 import hashlib
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import BinaryIO, Optional
 
 logger = logging.getLogger(__name__)
 
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.sha256
+    logger.debug("TDD gate: blake3 not installed, hashing with SHA-256")
+
 
 class TDDViolation(Exception):
     """Raised when TDD integrity is violated."""
@@ -41,7 +47,7 @@ class TestModifiedError(TDDViolation):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class TDDCheckpoint:
     """Snapshot of test file state for integrity verification."""
     test_file: str
@@ -69,20 +75,46 @@ class TDDGate:
         self._checkpoints: dict[str, TDDCheckpoint] = {}
 
     @staticmethod
-    def hash_content(content: str) -> str:
-        """Hash test file content for integrity tracking."""
-        return hashlib.sha256(content.encode()).hexdigest()
+    def hash_content(content: str | bytes) -> str:
+        """
+        Hash test file content for integrity tracking.
+
+        BLAKE3 when installed (SIMD, several GB/s), else SHA-256. Pass bytes
+        read in "rb" mode to skip the UTF-8 encode.
+        """
+        if isinstance(content, str):
+            content = content.encode()
+        return _hasher(content).hexdigest()
+
+    @staticmethod
+    def hash_stream(fileobj: BinaryIO) -> str:
+        """Hash a binary file object in C-level chunks, without building a str."""
+        return hashlib.file_digest(fileobj, _hasher).hexdigest()
+
+    @classmethod
+    def hash_file(cls, path: str) -> str:
+        """Hash a file on disk as bytes (no UTF-8 decode / re-encode)."""
+        with open(path, "rb") as f:
+            return cls.hash_stream(f)
 
-    def register_test(self, test_file: str, content: str) -> TDDCheckpoint:
+    def register_test(self, test_file: str, content: str | bytes) -> TDDCheckpoint:
         """
         Register a newly written test file in the Red phase.
         
         Called during PROVING_GROUND after writing the test.
         """
-        checkpoint = TDDCheckpoint(
-            test_file=test_file,
-            initial_hash=self.hash_content(content),
-        )
+        return self._register(test_file, self.hash_content(content))
+
+    def register_test_stream(self, test_file: str, fileobj: BinaryIO) -> TDDCheckpoint:
+        """register_test for a test already on disk: pass it opened in "rb" mode."""
+        return self._register(test_file, self.hash_stream(fileobj))
+
+    def register_test_file(self, test_file: str, path: Optional[str] = None) -> TDDCheckpoint:
+        """register_test for a test already on disk, read from path (default: test_file)."""
+        return self._register(test_file, self.hash_file(path or test_file))
+
+    def _register(self, test_file: str, initial_hash: str) -> TDDCheckpoint:
+        checkpoint = TDDCheckpoint(test_file=test_file, initial_hash=initial_hash)
         self._checkpoints[test_file] = checkpoint
         logger.info(f"TDD: Registered test {test_file} (hash: {checkpoint.initial_hash[:12]})")
         return checkpoint
@@ -105,20 +137,31 @@ class TDDGate:
         self._checkpoints[test_file].is_red = True
         logger.info(f"TDD: {test_file} correctly FAILED (Red ✅)")
 
-    def assert_green(self, test_file: str, test_passed: bool, current_content: str):
+    def assert_green(self, test_file: str, test_passed: bool, current_content: str | bytes):
         """
         Assert that the test PASSED after implementation (Green phase).
         Also verify test integrity (code wasn't modified).
         
         Architecture §1: VERIFYING → TEST PASSED + TDD Check: Test Code Unmodified
         """
+        self._assert_green(test_file, test_passed, lambda: self.hash_content(current_content))
+
+    def assert_green_stream(self, test_file: str, test_passed: bool, fileobj: BinaryIO):
+        """assert_green reading the current test from a file opened in "rb" mode."""
+        self._assert_green(test_file, test_passed, lambda: self.hash_stream(fileobj))
+
+    def assert_green_file(self, test_file: str, test_passed: bool, path: Optional[str] = None):
+        """assert_green re-hashing the test on disk at path (default: test_file)."""
+        self._assert_green(test_file, test_passed, lambda: self.hash_file(path or test_file))
+
+    def _assert_green(self, test_file: str, test_passed: bool, current_hash):
         if test_file not in self._checkpoints:
             raise TDDViolation(f"Test {test_file} not registered with TDD gate")
 
         checkpoint = self._checkpoints[test_file]
 
         # Check integrity — test code should not have been modified
-        checkpoint.final_hash = self.hash_content(current_content)
+        checkpoint.final_hash = current_hash()
         if not checkpoint.integrity_ok:
             raise TestModifiedError(
                 f"TDD violation: {test_file} was modified after initial writing! "
@@ -11,12 +11,30 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _spec_fields(file_path: str) -> tuple[str, str, str, tuple[str, ...], str]:
+    """(module, test_file, test_class, test_methods, description) for a planned .py file."""
+    # Strip exactly the ".py" suffix (callers only pass .py files)
+    module = file_path[:-3].replace("/", ".").replace("\\", ".")
+    _, _, file_name = file_path.rpartition("/")
+    test_file = f"tests/test_{file_name}"
+    base_name = file_name[:-3]
+    class_name = f"Test{''.join(w.capitalize() for w in base_name.split('_'))}"
+    methods = (
+        f"test_{base_name}_basic",
+        f"test_{base_name}_edge_cases",
+        f"test_{base_name}_error_handling",
+    )
+    return module, test_file, class_name, methods, f"Tests for {module}"
+
+
+@dataclass(slots=True, frozen=True)
 class TestSpec:
     """Specification for a generated test."""
     test_file: str
@@ -88,41 +106,17 @@ class TestGenerator:
         
         Creates one test spec per planned source file.
         """
+        # Don't generate tests for non-Python or test files
         specs = []
-
         for file_path in planned_files:
-            if not file_path.endswith(".py"):
-                continue
-            if "test" in file_path:
-                continue  # Don't generate tests for test files
-
-            # Convert file path to module name
-            module = file_path.replace("/", ".").replace("\\", ".").rstrip(".py")
-            if module.endswith(".py"):
-                module = module[:-3]
-
-            # Generate test file name
-            parts = file_path.rsplit("/", 1)
-            if len(parts) == 2:
-                test_file = f"tests/test_{parts[1]}"
-            else:
-                test_file = f"tests/test_{file_path}"
-
-            # Generate class name
-            base_name = parts[-1].replace(".py", "")
-            class_name = f"Test{''.join(w.capitalize() for w in base_name.split('_'))}"
-
-            spec = TestSpec(
-                test_file=test_file,
-                sut_module=module,
-                test_class=class_name,
-                test_methods=[
-                    f"test_{base_name}_basic",
-                    f"test_{base_name}_edge_cases",
-                    f"test_{base_name}_error_handling",
-                ],
-                description=f"Tests for {module}",
-            )
-            specs.append(spec)
-
+            if file_path.endswith(".py") and "test" not in file_path:
+                # Everything derived from the path is cached per path
+                module, test_file, class_name, methods, description = _spec_fields(file_path)
+                specs.append(TestSpec(
+                    test_file=test_file,
+                    sut_module=module,
+                    test_class=class_name,
+                    test_methods=list(methods),  # fresh list: callers may extend it
+                    description=description,
+                ))
         return specs
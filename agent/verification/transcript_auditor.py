@@ -3,20 +3,39 @@ Transcript Auditor — Final safety check against the entire session history.
 Part of Phase 69.
 """
 
+import asyncio
 import logging
 import json
-from typing import List, Dict, Any
+import sys
+from typing import List, Dict, Any, Iterable, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+def _fenced_block(text: str) -> str:
+    """Body of the first ```json (or plain ```) fence, else the whole text."""
+    for fence in ("```json", "```"):
+        start = text.find(fence)
+        if start != -1:
+            start += len(fence)
+            end = text.find("```", start)
+            return text[start:end if end != -1 else len(text)].strip()
+    return text
+
 AUDIT_PROMPT = """You are a Transcript Auditor. 
 Your goal is to ensure that the final implementation strictly follows all constraints mentioned throughout the entire conversation.
 
 CONVERSATION TRANSCRIPT:
-{transcript}
+$transcript
 
 FINAL TASK SUMMARY: 
-{task_summary}
+$task_summary
 
 Your MISSION:
 1. Scan for specific constraints (Security, Privacy, Technical stack, Naming conventions) mentioned early in the conversation (e.g. Turn 1-5).
@@ -24,15 +43,55 @@ Your MISSION:
 3. If any constraint mentioned earlier was forgotten or violated in later turns, find the gap.
 
 Response Format:
-{{
+{
   "pass": true/false,
   "violations": ["Constraint X was violated by Y in Turn Z"],
   "reasoning": "Detailed analysis of the transcript vs final state"
-}}
+}
 
 Output ONLY the JSON block.
 """
 
+# The prompt is fixed text around two slots: split it once, then each audit
+# is a single join instead of a template scan
+_PROMPT_PREFIX, _rest = AUDIT_PROMPT.split("$transcript")
+_PROMPT_MID, _PROMPT_SUFFIX = _rest.split("$task_summary")
+del _rest
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a senior auditor. Be extremely pedantic about technical constraints.",
+}
+
+class Transcript:
+    """
+    Columnar conversation history: parallel lists of roles and contents.
+
+    Avoids one dict per turn on long sessions. Role strings are interned,
+    so every turn with the same role shares one object.
+    """
+
+    __slots__ = ("roles", "contents")
+
+    def __init__(self):
+        self.roles: list[str] = []
+        self.contents: list[str] = []
+
+    @classmethod
+    def from_messages(cls, messages: Iterable[Dict[str, str]]) -> "Transcript":
+        """Build from the usual [{"role": ..., "content": ...}] message list."""
+        transcript = cls()
+        for msg in messages:
+            transcript.append(msg.get("role", "user"), msg.get("content", ""))
+        return transcript
+
+    def append(self, role: str, content: str):
+        self.roles.append(sys.intern(role))
+        self.contents.append(content)
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
+
 class TranscriptAuditor:
     """
     Analyzes the full conversation transcript to ensure no requirements were 'lost'
@@ -42,36 +101,34 @@ class TranscriptAuditor:
     def __init__(self, provider):
         self.provider = provider
 
-    def audit(self, messages: List[Dict[str, str]], task_summary: str) -> Dict[str, Any]:
+    def audit(
+        self,
+        messages: Union[Transcript, List[Dict[str, str]]],
+        task_summary: str,
+    ) -> Dict[str, Any]:
         """
         Run the final audit against the full message list.
+
+        messages is a Transcript or a list of role/content dicts.
         """
-        # Format transcript for the LLM
-        transcript_text = ""
-        for i, msg in enumerate(messages):
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            transcript_text += f"Turn {i} [{role.upper()}]: {content[:1000]}\n---\n"
-
-        prompt = AUDIT_PROMPT.format(
-            transcript=transcript_text,
-            task_summary=task_summary
-        )
+        transcript = messages if isinstance(messages, Transcript) else Transcript.from_messages(messages)
+
+        # Format transcript for the LLM (one join, not repeated +=)
+        transcript_text = "".join([
+            f"Turn {i} [{role.upper()}]: {content[:1000]}\n---\n"
+            for i, (role, content) in enumerate(zip(transcript.roles, transcript.contents))
+        ])
+
+        prompt = "".join((_PROMPT_PREFIX, transcript_text, _PROMPT_MID, task_summary, _PROMPT_SUFFIX))
 
         try:
             logger.info("Running post-task transcript audit...")
             response = self.provider.complete([
-                {"role": "system", "content": "You are a senior auditor. Be extremely pedantic about technical constraints."},
+                _SYSTEM_MESSAGE,
                 {"role": "user", "content": prompt}
             ])
             
-            text = response.content.strip()
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0].strip()
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0].strip()
-                
-            result = json.loads(text)
+            result = _loads(_fenced_block(response.content.strip()))
             if not result.get("pass"):
                 logger.warning(f"Transcript audit FAILED: {result.get('violations')}")
             else:
@@ -80,3 +137,27 @@ class TranscriptAuditor:
         except Exception as e:
             logger.error(f"Transcript audit failed to run: {e}")
             return {"pass": True, "reasoning": f"Audit failed to execute: {e}. Assuming pass for continuity."}
+
+    async def audit_async(
+        self,
+        messages: Union[Transcript, List[Dict[str, str]]],
+        task_summary: str,
+    ) -> Dict[str, Any]:
+        """
+        audit() for async callers. The provider is synchronous, so the
+        audit runs in a worker thread and the event loop stays free.
+        """
+        return await asyncio.to_thread(self.audit, messages, task_summary)
+
+    async def audit_many(
+        self,
+        batches: List[Tuple[Union[Transcript, List[Dict[str, str]]], str]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Audit several (messages, task_summary) pairs concurrently, so the
+        wall time is the slowest LLM call rather than their sum. Results
+        come back in the same order.
+        """
+        return list(await asyncio.gather(*(
+            self.audit_async(messages, task_summary) for messages, task_summary in batches
+        )))
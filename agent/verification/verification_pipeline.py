@@ -13,15 +13,87 @@ Each tier gates the next — failure at any level stops the pipeline.
 
 from __future__ import annotations
 
+import json
+import os
+import signal
 import subprocess
+import sys
+import threading
 import time
 import logging
+import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional, Callable
 
 logger = logging.getLogger(__name__)
 
+# Syntax checks fan out to worker processes only for larger file sets: below
+# this, starting the pool costs more than compiling serially
+SYNTAX_PARALLEL_MIN_FILES = 64
+# Leave two cores for the agent itself and the user's editor
+SYNTAX_WORKERS = max(1, (os.cpu_count() or 2) - 2)
+
+# Syntax results per file, keyed by (mtime_ns, size), kept in the project's
+# .agent_log so unchanged files are not recompiled across runs or sessions
+SYNTAX_CACHE_FILE = os.path.join(".agent_log", "syntax_cache.json")
+# Grammar differs between Python versions, so results are per interpreter
+_PYTHON_TAG = "%d.%d" % sys.version_info[:2]
+
+# Files per interpreter when syntax checks run out of process (isolate_syntax)
+SYNTAX_BATCH_SIZE = 500
+
+# Run by one child interpreter per batch: reads [[path, name], ...] as JSON on
+# stdin and prints the matching list of error reports (null when it compiles)
+_ISOLATED_COMPILE_SCRIPT = """
+import json, sys, traceback
+out = []
+for path, name in json.load(sys.stdin):
+    try:
+        with open(path, "rb") as f:
+            compile(f.read(), name, "exec", dont_inherit=True)
+        out.append(None)
+    except (SyntaxError, ValueError, RecursionError, MemoryError) as e:
+        out.append("".join(traceback.format_exception_only(type(e), e)).strip())
+    except OSError as e:
+        out.append(str(e))
+json.dump(out, sys.stdout)
+"""
+
+# Directories never searched for Python files (dot-directories are skipped too)
+SKIP_DIRS = frozenset({"__pycache__", "node_modules", "build", "dist", "venv"})
+
+TEST_TIMEOUT = 300  # seconds
+# Test output is streamed to stdout as it arrives; only this much of its end
+# is kept for the report
+TEST_OUTPUT_TAIL_LINES = 200
+
+DEFAULT_TEST_COMMAND = "python -m pytest tests/ -v"
+# pytest-xdist workers for the default test command, same cores - 2 budget
+TEST_WORKERS = SYNTAX_WORKERS
+
+
+def _compile_one(path: str, name: str) -> Optional[str]:
+    """
+    Compile one file in-process; returns the py_compile-style error report,
+    or None if it compiles. name is the path shown in the report.
+    """
+    try:
+        with open(path, "rb") as f:
+            source = f.read()
+        # Bytes, so PEP 263 encoding declarations are honoured as py_compile does
+        compile(source, name, "exec", dont_inherit=True)
+        return None
+    # Source nested too deeply for the compiler parses but can't be compiled;
+    # py_compile reported that as a failure too, so it must not escape
+    except (SyntaxError, ValueError, RecursionError, MemoryError) as e:
+        return "".join(traceback.format_exception_only(type(e), e)).strip()
+    except OSError as e:
+        return str(e)
+
 
 class VerifyTier(Enum):
     SYNTAX = auto()
@@ -83,14 +155,23 @@ class VerificationPipeline:
     def __init__(
         self,
         project_dir: str = ".",
-        test_command: str = "python -m pytest tests/ -v",
+        test_command: str = DEFAULT_TEST_COMMAND,
         lint_command: str = "python -m py_compile",
         skip_tiers: list[VerifyTier] = None,
+        cache_syntax: bool = True,
+        isolate_syntax: bool = False,
     ):
         self._dir = project_dir
         self._test_cmd = test_command
         self._lint_cmd = lint_command
         self._skip = set(skip_tiers or [])
+        # Whether the test interpreter can import xdist; probed on first use
+        self._has_xdist: Optional[bool] = None
+        self._cache_syntax = cache_syntax
+        # Compile in child interpreters, so a crash can't take the agent down
+        self._isolate_syntax = isolate_syntax
+        # name -> [mtime_ns, size, error or None]; loaded on first syntax check
+        self._syntax_memo: Optional[dict[str, list]] = None
 
     def run(self, files: list[str] = None) -> VerificationReport:
         """Run the full verification pipeline."""
@@ -126,17 +207,39 @@ class VerificationPipeline:
         target_files = files or self._find_python_files()
         errors = []
 
+        # Files unchanged since their last check (same mtime and size) reuse
+        # the stored result; only the rest are compiled
+        memo = self._load_syntax_memo() if self._cache_syntax else {}
+        results: dict[str, Optional[str]] = {}
+        stale: dict[str, Optional[tuple[int, int]]] = {}
         for f in target_files:
             try:
-                result = subprocess.run(
-                    ["python", "-m", "py_compile", f],
-                    capture_output=True, text=True, timeout=10,
-                    cwd=self._dir,
-                )
-                if result.returncode != 0:
-                    errors.append(f"{f}: {result.stderr.strip()}")
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
+                st = os.stat(os.path.join(self._dir, f))
+                fingerprint = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                fingerprint = None
+            entry = memo.get(f)
+            if fingerprint is not None and entry is not None and tuple(entry[:2]) == fingerprint:
+                results[f] = entry[2]
+            else:
+                stale[f] = fingerprint
+
+        if stale:
+            # Compiled in-process (no interpreter spawn per file), across worker
+            # processes when there are enough files to be worth it
+            names = list(stale)
+            paths = [os.path.join(self._dir, f) for f in names]
+            compile_all = self._compile_isolated if self._isolate_syntax else self._compile_all
+            for f, error in zip(names, compile_all(paths, names)):
+                results[f] = error
+                if stale[f] is not None:
+                    memo[f] = [*stale[f], error]
+            if self._cache_syntax:
+                self._save_syntax_memo()
+
+        for f in target_files:
+            if results[f] is not None:
+                errors.append(f"{f}: {results[f]}")
 
         return TierResult(
             tier=VerifyTier.SYNTAX,
@@ -146,6 +249,59 @@ class VerificationPipeline:
             errors=errors,
         )
 
+    def _load_syntax_memo(self) -> dict[str, list]:
+        if self._syntax_memo is None:
+            self._syntax_memo = {}
+            try:
+                with open(os.path.join(self._dir, SYNTAX_CACHE_FILE), encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("python") == _PYTHON_TAG:
+                    self._syntax_memo = data["files"]
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, KeyError, AttributeError) as e:
+                logger.debug(f"Syntax tier: ignoring unreadable cache: {e}")
+        return self._syntax_memo
+
+    def _save_syntax_memo(self):
+        path = os.path.join(self._dir, SYNTAX_CACHE_FILE)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"python": _PYTHON_TAG, "files": self._syntax_memo}, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"Syntax tier: could not write cache: {e}")
+
+    @staticmethod
+    def _compile_all(paths: list[str], names: list[str]) -> list[Optional[str]]:
+        """_compile_one for every file, in order."""
+        if SYNTAX_WORKERS > 1 and len(paths) >= SYNTAX_PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=SYNTAX_WORKERS) as pool:
+                    return list(pool.map(_compile_one, paths, names, chunksize=32))
+            except (OSError, BrokenProcessPool) as e:
+                logger.debug(f"Syntax tier: process pool unavailable ({e}); compiling serially")
+        return [_compile_one(path, name) for path, name in zip(paths, names)]
+
+    @staticmethod
+    def _compile_isolated(paths: list[str], names: list[str]) -> list[Optional[str]]:
+        """_compile_all in child interpreters: one per SYNTAX_BATCH_SIZE files, not per file."""
+        errors: list[Optional[str]] = []
+        for i in range(0, len(paths), SYNTAX_BATCH_SIZE):
+            batch = list(zip(paths[i:i + SYNTAX_BATCH_SIZE], names[i:i + SYNTAX_BATCH_SIZE]))
+            try:
+                result = subprocess.run(
+                    [sys.executable, "-c", _ISOLATED_COMPILE_SCRIPT],
+                    input=json.dumps(batch), capture_output=True, text=True, timeout=60,
+                )
+                errors.extend(json.loads(result.stdout))
+            except (OSError, ValueError, subprocess.TimeoutExpired) as e:
+                # The child crashed or hung: none of its files count as checked
+                errors.extend([f"Syntax check process failed: {e}"] * len(batch))
+        return errors
+
     def _check_lint(self, files: list[str] = None) -> TierResult:
         """Tier 2: Lint check."""
         start = time.time()
@@ -173,19 +329,52 @@ class VerificationPipeline:
     def _check_tests(self, files: list[str] = None) -> TierResult:
         """Tier 3: Unit test check."""
         start = time.time()
+        argv = self._test_argv()
         try:
-            result = subprocess.run(
-                self._test_cmd.split(),
-                capture_output=True, text=True, timeout=300,
-                cwd=self._dir,
+            proc = subprocess.Popen(
+                argv,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                bufsize=1, cwd=self._dir,
+                # Own process group, so a timeout also kills xdist workers
+                # (which hold the stdout pipe open) and not just pytest
+                start_new_session=os.name == "posix",
             )
-            passed = result.returncode == 0
+            # Lines are echoed as they arrive (the web UI captures stdout), so
+            # failures show up live and memory stays flat however much is printed
+            timed_out = threading.Event()
+
+            def kill():
+                timed_out.set()
+                try:
+                    if os.name == "posix":
+                        os.killpg(proc.pid, signal.SIGKILL)
+                    else:
+                        proc.kill()
+                except OSError:
+                    pass  # Already gone
+
+            timer = threading.Timer(TEST_TIMEOUT, kill)
+            timer.start()
+            tail = deque(maxlen=TEST_OUTPUT_TAIL_LINES)
+            try:
+                with proc.stdout:
+                    for line in proc.stdout:
+                        if timed_out.is_set():
+                            break
+                        tail.append(line)
+                        print(line, end="")
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(argv, TEST_TIMEOUT)
+            passed = returncode == 0
             return TierResult(
                 tier=VerifyTier.UNIT_TEST,
                 passed=passed,
                 duration_ms=(time.time() - start) * 1000,
                 details="Tests passed" if passed else "Tests FAILED",
-                errors=[result.stdout] if not passed else [],
+                errors=["".join(tail)] if not passed else [],
             )
         except (FileNotFoundError, subprocess.TimeoutExpired) as e:
             return TierResult(
@@ -196,6 +385,39 @@ class VerificationPipeline:
                 errors=[str(e)],
             )
 
+    def _test_argv(self) -> list[str]:
+        """
+        The test command as argv. The default pytest command is sharded
+        across cores when pytest-xdist is installed; --dist=loadfile keeps
+        each file on one worker so module fixtures are set up once.
+        Commands passed in by the caller are run as given.
+        """
+        argv = self._test_cmd.split()
+        if (
+            self._test_cmd == DEFAULT_TEST_COMMAND
+            and TEST_WORKERS > 1
+            and self._xdist_available(argv[0])
+        ):
+            argv += ["-n", str(TEST_WORKERS), "--dist=loadfile"]
+        return argv
+
+    def _xdist_available(self, python: str) -> bool:
+        """
+        Whether the interpreter that runs the tests (the project's python,
+        not necessarily the agent's) can import xdist. Without it pytest
+        rejects -n as a usage error and a healthy suite would fail.
+        """
+        if self._has_xdist is None:
+            try:
+                result = subprocess.run(
+                    [python, "-c", "import xdist"],
+                    capture_output=True, timeout=30, cwd=self._dir,
+                )
+                self._has_xdist = result.returncode == 0
+            except (OSError, subprocess.TimeoutExpired):
+                self._has_xdist = False
+        return self._has_xdist
+
     def _check_integration(self, files: list[str] = None) -> TierResult:
         """Tier 4: Integration tests (placeholder)."""
         return TierResult(
@@ -213,11 +435,28 @@ class VerificationPipeline:
         )
 
     def _find_python_files(self) -> list[str]:
-        """Find all Python files in the project."""
-        from pathlib import Path
-        root = Path(self._dir)
-        return [
-            str(f.relative_to(root))
-            for f in root.rglob("*.py")
-            if "__pycache__" not in str(f) and ".venv" not in str(f)
-        ]
+        """
+        Find all Python files in the project.
+
+        An explicit os.scandir stack that prunes virtualenvs, caches and
+        build output before descending into them; DirEntry.is_dir uses the
+        d_type readdir already returned, so there is no stat per entry.
+        """
+        # Entry paths all start with the project dir, so relative paths are a slice
+        base_len = len(self._dir.rstrip(os.sep) + os.sep)
+        found = []
+        stack = [self._dir]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name[0] != "." and name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif name.endswith(".py") and entry.is_file():
+                        found.append(entry.path[base_len:])
+        return found
@@ -3,13 +3,219 @@ Browser Tester Tool.
 Provides capabilities to verifying web applications running locally.
 Now matches 'Devin-like' capabilities with interaction (click, type, wait).
 """
+import atexit
+import json
 import logging
+import os
+import re
+import shutil
+import socket
+import stat
+import subprocess
+import tempfile
 import time
 import base64
+import threading
+import urllib.request
+from contextlib import contextmanager
 from typing import Dict, Optional, Any, List
 
 logger = logging.getLogger(__name__)
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+    logger.debug("BrowserTester: requests not installed, using urllib for URL checks")
+
+# Bodies up to this size are read to the end so the connection goes back to
+# the pool; anything larger is dropped with its connection.
+_DRAIN_LIMIT = 64 * 1024
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def _get_http_session():
+    """Process-wide keep-alive session, so repeated checks of the same dev
+    server reuse one TCP connection instead of reconnecting every time."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=10,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            atexit.register(session.close)
+            _http_session = session
+        return _http_session
+
+# -- Shared browser process --
+# Tools attach to one long-lived headless Chromium instead of each launching
+# their own, when configured:
+#   PW_WS_ENDPOINT     an existing Playwright server (chromium.connect)
+#   PW_CDP_ENDPOINT    an existing Chromium with remote debugging (connect_over_cdp)
+#   PW_SHARED_BROWSER=1  start one on first use; its endpoint is exported as
+#                        PW_CDP_ENDPOINT for every tool in this process
+# Closing a connected browser only disconnects; the process stays warm.
+SHARED_BROWSER_STARTUP_TIMEOUT = 10.0
+
+_shared_lock = threading.Lock()
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _stop_shared_browser(proc, profile_dir: str):
+    """Stop the shared Chromium and delete its throwaway profile."""
+    try:
+        proc.terminate()
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    except OSError:
+        pass
+    shutil.rmtree(profile_dir, ignore_errors=True)
+
+def _start_shared_browser(executable: str) -> Optional[str]:
+    """Start the shared headless Chromium once; returns its CDP endpoint."""
+    with _shared_lock:
+        endpoint = os.environ.get("PW_CDP_ENDPOINT")
+        if endpoint:
+            return endpoint
+        port = _free_port()
+        profile_dir = tempfile.mkdtemp(prefix="pw-shared-")
+        proc = subprocess.Popen(
+            [
+                executable, "--headless=new",
+                f"--remote-debugging-port={port}", "--remote-debugging-address=127.0.0.1",
+                f"--user-data-dir={profile_dir}",
+                "--no-first-run", "--no-default-browser-check",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        endpoint = f"http://127.0.0.1:{port}"
+        deadline = time.monotonic() + SHARED_BROWSER_STARTUP_TIMEOUT
+        while True:
+            try:
+                urllib.request.urlopen(f"{endpoint}/json/version", timeout=1).close()
+                break
+            except OSError:
+                if proc.poll() is not None or time.monotonic() > deadline:
+                    proc.kill()
+                    proc.wait()
+                    shutil.rmtree(profile_dir, ignore_errors=True)
+                    return None
+                time.sleep(0.1)
+        atexit.register(_stop_shared_browser, proc, profile_dir)
+        os.environ["PW_CDP_ENDPOINT"] = endpoint
+        return endpoint
+
+def _launch_or_connect(pw) -> tuple:
+    """
+    Attach to the shared browser when one is configured, else launch a
+    private one. Returns (browser, connected): connected is True when the
+    browser is a remote process that closing only disconnects from.
+    """
+    try:
+        ws_endpoint = os.environ.get("PW_WS_ENDPOINT")
+        if ws_endpoint:
+            return pw.chromium.connect(ws_endpoint), True
+        cdp_endpoint = os.environ.get("PW_CDP_ENDPOINT")
+        if not cdp_endpoint and os.environ.get("PW_SHARED_BROWSER") == "1":
+            cdp_endpoint = _start_shared_browser(pw.chromium.executable_path)
+        if cdp_endpoint:
+            return pw.chromium.connect_over_cdp(cdp_endpoint), True
+    except Exception as e:
+        logger.warning(f"Shared browser unavailable ({e}); launching a private one")
+    return pw.chromium.launch(), False
+
+# A privately launched browser is relaunched after serving this many
+# contexts, so native memory drift in a long-lived Chromium stays bounded.
+# A connected (shared) browser is not: closing it would only disconnect,
+# leaving the same process running.
+BROWSER_POOL_RECYCLE_AFTER = 100
+# Most Chromium instances alive at once (shared + one-off), so parallel
+# probes can't fork a browser each and exhaust the process table
+BROWSER_MAX_CONCURRENCY = int(os.getenv("BROWSER_MAX_CONCURRENCY", "4"))
+# Default navigation / action timeout for every page, so a dead URL fails a
+# probe in seconds rather than Playwright's 30s default
+PLAYWRIGHT_TIMEOUT_MS = int(os.getenv("PLAYWRIGHT_TIMEOUT_MS", "5000"))
+
+# Cookies / local storage of perform_interaction sessions are saved here
+# (Playwright storage_state JSON), so a session outlives its browser. They
+# hold auth state: the directory is private to this user (0700), each file 0600.
+BROWSER_SESSION_DIR = os.getenv(
+    "BROWSER_SESSION_DIR", os.path.join(os.path.expanduser("~"), ".godmode", "browser_sessions")
+)
+
+def _private_session_dir() -> Optional[str]:
+    """BROWSER_SESSION_DIR, created if missing; None when it can't be trusted
+    (a symlink, owned by another user, or writable by group/others)."""
+    try:
+        os.makedirs(BROWSER_SESSION_DIR, mode=0o700, exist_ok=True)
+        st = os.lstat(BROWSER_SESSION_DIR)
+    except OSError as e:
+        logger.debug(f"Browser session dir unavailable: {e}")
+        return None
+    if not stat.S_ISDIR(st.st_mode):
+        reason = "not a directory"
+    elif hasattr(os, "getuid") and st.st_uid != os.getuid():
+        reason = "owned by another user"
+    elif st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        reason = "writable by other users"
+    else:
+        return BROWSER_SESSION_DIR
+    logger.warning(f"Not saving browser sessions in {BROWSER_SESSION_DIR}: {reason}")
+    return None
+
+# Agents re-probe the same dev URL many times per task; successful results
+# are reused for this many seconds (failures are never cached)
+CHECK_CACHE_TTL = 5.0
+SCREENSHOT_CACHE_TTL = 15.0
+PROBE_CACHE_SIZE = 256
+
+# Navigations return at DOMContentLoaded instead of waiting for every
+# subresource; screenshots then wait at most this long for the network
+# to settle so the capture still shows rendered content
+SCREENSHOT_IDLE_WAIT_MS = 1500
+
+def _settle(page):
+    try:
+        page.wait_for_load_state("networkidle", timeout=SCREENSHOT_IDLE_WAIT_MS)
+    except Exception:
+        pass  # Capture whatever has rendered
+
+# First 500 characters of the DOM, cut in the page so only the snippet
+# crosses the wire instead of the whole serialized document
+_SNIPPET_JS = "() => document.documentElement ? document.documentElement.outerHTML.slice(0, 500) : ''"
+
+def _resource_types(env: str, default: str) -> frozenset:
+    return frozenset(t.strip() for t in os.getenv(env, default).split(",") if t.strip())
+
+# Resource types aborted while loading a page, comma-separated. Status/title
+# probes need none of them; screenshots keep images and styles so the
+# capture still looks like the page.
+PROBE_BLOCKED_RESOURCES = _resource_types("PW_PROBE_BLOCK", "font,image,media,stylesheet")
+SCREENSHOT_BLOCKED_RESOURCES = _resource_types("PW_SCREENSHOT_BLOCK", "font,media")
+
+def _block_resources(page, blocked: frozenset):
+    """Abort requests for the given resource types on this page."""
+    def handle(route, request):
+        if request.resource_type in blocked:
+            route.abort()
+        else:
+            route.continue_()
+    page.route("**/*", handle)
+
 class BrowserTester:
     def __init__(self):
         self.has_playwright = False
@@ -19,14 +225,260 @@ class BrowserTester:
         except ImportError:
             pass
 
-    def check_url(self, url: str) -> Dict[str, Any]:
-        """Check if a URL is accessible and return basic info."""
-        if self.has_playwright:
-             return self._check_playwright(url)
-        else:
-             return self._check_requests(url)
+        # Shared Chromium, launched on first use instead of once per call.
+        # Playwright's sync API is bound to the thread that started it, so
+        # the browser belongs to that thread (see _page).
+        self._pw = None
+        self._browser = None
+        # Whether _browser is a connected shared process (never recycled)
+        self._connected = False
+        self._owner: Optional[int] = None
+        self._contexts_served = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(BROWSER_MAX_CONCURRENCY)
+        # key -> (timestamp, result) for recent successful probes
+        self._probe_cache: Dict[tuple, tuple] = {}
+        # session_id -> (browser, context, page) kept open on the owner thread
+        self._sessions: Dict[str, tuple] = {}
+        # Every session used through this tester, so close() can delete their state
+        self._session_ids: set = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _get_browser(self):
+        """Shared browser: launched once, relaunched if it died or is due for recycling."""
+        if self._browser is not None:
+            if self._browser.is_connected() and (
+                self._connected or self._contexts_served < BROWSER_POOL_RECYCLE_AFTER
+            ):
+                return self._browser
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+        if self._pw is None:
+            from playwright.sync_api import sync_playwright
+            self._pw = sync_playwright().start()
+        self._browser, self._connected = _launch_or_connect(self._pw)
+        self._contexts_served = 0
+        return self._browser
+
+    def _on_owner_thread(self) -> bool:
+        """Whether this thread owns the shared browser (claiming it if unowned)."""
+        with self._lock:
+            if self._owner is None:
+                self._owner = threading.get_ident()
+            return self._owner == threading.get_ident()
+
+    @staticmethod
+    def _set_timeouts(page, timeout_ms: Optional[int]):
+        timeout = timeout_ms or PLAYWRIGHT_TIMEOUT_MS
+        page.set_default_timeout(timeout)
+        page.set_default_navigation_timeout(timeout)
+
+    @contextmanager
+    def _page(self, timeout_ms: Optional[int] = None, block: frozenset = frozenset(), **context_options):
+        """
+        Yield a page in a fresh BrowserContext and close the context after.
+
+        On the owning thread the shared browser is reused; other threads get
+        a one-off browser, as Playwright objects can't cross threads.
+        timeout_ms overrides PLAYWRIGHT_TIMEOUT_MS for this page; requests
+        for resource types in block are aborted.
+        """
+        with self._context(**context_options) as context:
+            page = context.new_page()
+            self._set_timeouts(page, timeout_ms)
+            if block:
+                _block_resources(page, block)
+            yield page
+
+    @contextmanager
+    def _context(self, **context_options):
+        """Yield a fresh BrowserContext (see _page for browser selection)."""
+        shared = self._on_owner_thread()
+
+        with self._slots:
+            if not shared:
+                from playwright.sync_api import sync_playwright
+                with sync_playwright() as p:
+                    browser, _ = _launch_or_connect(p)
+                    try:
+                        yield browser.new_context(**context_options)
+                    finally:
+                        browser.close()
+                return
+
+            with self._lock:
+                context = self._get_browser().new_context(**context_options)
+                self._contexts_served += 1
+            try:
+                yield context
+            finally:
+                context.close()
+
+    @staticmethod
+    def _session_state_path(session_id: str) -> Optional[str]:
+        """Where a session's state is saved; None if sessions can't be saved."""
+        directory = _private_session_dir()
+        if directory is None:
+            return None
+        safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", session_id)
+        return os.path.join(directory, f"{safe_id}.json")
+
+    @contextmanager
+    def _session_page(self, session_id: str, timeout_ms: Optional[int] = None):
+        """
+        Yield the page of a named session, keeping cookies between calls.
+
+        On the owner thread the session's context stays open in the shared
+        browser. Its storage state is also saved to BROWSER_SESSION_DIR after
+        every use, which restores the session on other threads, after the
+        browser is recycled, and in other processes.
+        """
+        with self._lock:
+            self._session_ids.add(session_id)
+        state_path = self._session_state_path(session_id)
+        restore = {"storage_state": state_path} if state_path and os.path.exists(state_path) else {}
+
+        if not self._on_owner_thread():
+            with self._page(timeout_ms, **restore) as page:
+                try:
+                    yield page
+                finally:
+                    self._save_session_state(page.context, state_path)
+            return
+
+        with self._lock:
+            browser = self._get_browser()
+            entry = self._sessions.get(session_id)
+            if entry is None or entry[0] is not browser:
+                context = browser.new_context(**restore)
+                self._contexts_served += 1
+                entry = self._sessions[session_id] = (browser, context, context.new_page())
+        _, context, page = entry
+        self._set_timeouts(page, timeout_ms)
+        try:
+            yield page
+        finally:
+            self._save_session_state(context, state_path)
+
+    @staticmethod
+    def _save_session_state(context, state_path: Optional[str]):
+        if state_path is None:
+            return
+        tmp = f"{state_path}.{os.getpid()}.tmp"
+        try:
+            state = context.storage_state()
+            # Created 0600 (not via Playwright, which uses the umask), then
+            # swapped in so readers never see a partial file
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp, state_path)
+        except Exception as e:
+            logger.debug(f"Could not save browser session state: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    @classmethod
+    def _remove_session_state(cls, session_id: str):
+        state_path = cls._session_state_path(session_id)
+        if state_path is None:
+            return
+        try:
+            os.remove(state_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Could not remove browser session state: {e}")
+
+    def close_session(self, session_id: str):
+        """Close a perform_interaction session and forget its saved state."""
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+            self._session_ids.discard(session_id)
+        if entry is not None:
+            try:
+                entry[1].close()
+            except Exception as e:
+                logger.debug(f"Browser session close failed: {e}")
+        self._remove_session_state(session_id)
+
+    def _ttl_get_or_compute(self, key: tuple, ttl: float, compute, keep, fresh: bool = False):
+        """Return a cached result younger than ttl, else compute it and
+        cache it when keep(result) is true. fresh skips the lookup but
+        still caches the new result."""
+        now = time.monotonic()
+        with self._lock:
+            cached = None if fresh else self._probe_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        result = compute()
+        with self._lock:
+            if keep(result):
+                if key not in self._probe_cache and len(self._probe_cache) >= PROBE_CACHE_SIZE:
+                    self._probe_cache.pop(next(iter(self._probe_cache)))
+                self._probe_cache[key] = (time.monotonic(), result)
+            else:
+                self._probe_cache.pop(key, None)
+        return result
+
+    def clear_cache(self):
+        """Forget cached probe results, e.g. right after the app changed."""
+        with self._lock:
+            self._probe_cache.clear()
+
+    def close(self):
+        """Shut down the shared browser. Must run on the thread that launched it."""
+        with self._lock:
+            browser, pw = self._browser, self._pw
+            self._browser = self._pw = self._owner = None
+            # Session contexts close with the browser, and so do the sessions
+            self._sessions.clear()
+            session_ids, self._session_ids = self._session_ids, set()
+        for session_id in session_ids:
+            self._remove_session_state(session_id)
+        try:
+            if browser is not None:
+                browser.close()
+            if pw is not None:
+                pw.stop()
+        except Exception as e:
+            logger.debug(f"Browser shutdown failed: {e}")
+
+    def check_url(
+        self, url: str, render: bool = False, timeout_ms: Optional[int] = None,
+        fresh: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Check if a URL is accessible and return basic info.
+
+        A plain HTTP request answers liveness; pass render=True to load the
+        page in the browser when the title / rendered DOM is needed.
+        Successful results are reused for CHECK_CACHE_TTL seconds unless
+        fresh is set (e.g. right after the app was changed).
+        """
+        render = render and self.has_playwright
+        result = self._ttl_get_or_compute(
+            ("check", url, render),
+            CHECK_CACHE_TTL,
+            lambda: self._check_playwright(url, timeout_ms) if render else self._check_requests(url),
+            keep=lambda result: result.get("ok"),
+            fresh=fresh,
+        )
+        # A copy, so callers can't alter the cached result
+        return dict(result)
 
     def _check_requests(self, url: str) -> Dict[str, Any]:
+        if requests is not None:
+            return self._check_pooled(url)
         import urllib.request
         try:
             with urllib.request.urlopen(url, timeout=5) as response:
@@ -40,72 +492,145 @@ class BrowserTester:
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    def _check_playwright(self, url: str) -> Dict[str, Any]:
-        from playwright.sync_api import sync_playwright
+    def _check_pooled(self, url: str) -> Dict[str, Any]:
+        session = _get_http_session()
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                page = browser.new_page()
-                response = page.goto(url, timeout=10000)
+            # HEAD first: no body at all. Dev servers that don't route HEAD
+            # answer 4xx/5xx, so those get a real GET before being reported.
+            response = session.head(url, timeout=5, allow_redirects=True)
+            if response.status_code < 400:
+                return {
+                    "status": response.status_code,
+                    "url": response.url,
+                    "content_length": response.headers.get("Content-Length"),
+                    "title": "(Install playwright for title extraction)",
+                    "ok": 200 <= response.status_code < 300
+                }
+        except (requests.ConnectionError, requests.Timeout) as e:
+            # Unreachable: a GET would only fail the same way
+            return {"ok": False, "error": str(e)}
+        except Exception:
+            pass
+        try:
+            # stream=True: only status and headers are needed, not the body
+            with session.get(url, timeout=5, stream=True) as response:
+                drained = 0
+                for chunk in response.iter_content(16 * 1024):
+                    drained += len(chunk)
+                    if drained > _DRAIN_LIMIT:
+                        break
+                return {
+                    "status": response.status_code,
+                    "url": response.url,
+                    "content_length": response.headers.get("Content-Length"),
+                    "title": "(Install playwright for title extraction)",
+                    "ok": 200 <= response.status_code < 300
+                }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def _check_playwright(self, url: str, timeout_ms: Optional[int] = None) -> Dict[str, Any]:
+        try:
+            with self._page(timeout_ms, PROBE_BLOCKED_RESOURCES) as page:
+                response = page.goto(url, wait_until="domcontentloaded")
                 title = page.title()
-                content = page.content()
+                snippet = page.evaluate(_SNIPPET_JS)
                 status = response.status if response else 0
-                browser.close()
                 return {
                     "status": status,
                     "url": url,
                     "title": title,
                     "ok": 200 <= status < 300,
-                    "content_snippet": content[:500]
+                    "content_snippet": snippet
                 }
         except Exception as e:
              logger.warning(f"Playwright check failed: {e}")
              return self._check_requests(url) # Fallback
 
-    def take_screenshot(self, url: str, code_path: str) -> Optional[str]:
-        """Take a screenshot if playwright is available."""
+    def take_screenshot(
+        self, url: str, code_path: str, settle_ms: int = 0, timeout_ms: Optional[int] = None,
+        fresh: bool = False,
+    ) -> Optional[str]:
+        """Take a screenshot if playwright is available.
+
+        settle_ms waits that long after load, for client-side rendering.
+        fresh captures the page again instead of reusing a recent capture.
+        """
         if not self.has_playwright:
             return None
-            
-        from playwright.sync_api import sync_playwright
+
+        screenshot = self._snapshot(url, settle_ms, timeout_ms, fresh)
+        if screenshot is None:
+            return None
         try:
             screenshot_path = f"{code_path}_screenshot.png"
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                page = browser.new_page()
-                page.goto(url)
-                page.screenshot(path=screenshot_path)
-                browser.close()
+            with open(screenshot_path, "wb") as f:
+                f.write(screenshot)
             return screenshot_path
-        except Exception:
+        except OSError:
             return None
 
-    def take_screenshot_base64(self, url: str) -> Optional[str]:
-        """Take a screenshot and return as base64 string (for LLM analysis)."""
+    def take_screenshot_base64(
+        self, url: str, timeout_ms: Optional[int] = None, fresh: bool = False
+    ) -> Optional[str]:
+        """Take a screenshot and return as base64 string (for LLM analysis).
+
+        fresh captures the page again instead of reusing a recent capture.
+        """
         if not self.has_playwright:
             return None
+        screenshot = self._snapshot(url, timeout_ms=timeout_ms, fresh=fresh)
+        if screenshot is None:
+            return None
+        return base64.b64encode(screenshot).decode('utf-8')
 
-        from playwright.sync_api import sync_playwright
-        
+    def _snapshot(
+        self, url: str, settle_ms: int = 0, timeout_ms: Optional[int] = None, fresh: bool = False
+    ) -> Optional[bytes]:
+        """
+        PNG bytes of the page, or None if the capture failed.
+
+        Both screenshot methods go through here, and captures are reused for
+        SCREENSHOT_CACHE_TTL seconds, so asking for the file and the base64
+        form of the same page costs one browser round-trip. fresh always
+        captures anew.
+        """
+        return self._ttl_get_or_compute(
+            ("screenshot", url, settle_ms),
+            SCREENSHOT_CACHE_TTL,
+            lambda: self._capture(url, settle_ms, timeout_ms),
+            keep=lambda result: result is not None,
+            fresh=fresh,
+        )
+
+    def _capture(self, url: str, settle_ms: int, timeout_ms: Optional[int]) -> Optional[bytes]:
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                page = browser.new_page()
+            with self._page(timeout_ms, SCREENSHOT_BLOCKED_RESOURCES) as page:
                 try:
-                    page.goto(url, timeout=10000)
+                    page.goto(url, wait_until="domcontentloaded")
                 except Exception:
                     pass # Try to capture anyway
-                
-                screenshot_bytes = page.screenshot()
-                browser.close()
-                return base64.b64encode(screenshot_bytes).decode('utf-8')
+                _settle(page)
+                if settle_ms:
+                    page.wait_for_timeout(settle_ms)
+                return page.screenshot()
         except Exception as e:
             logger.warning(f"Screenshot failed: {e}")
             return None
 
-    def perform_interaction(self, url: str, actions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def perform_interaction(
+        self,
+        url: str,
+        actions: List[Dict[str, Any]],
+        timeout_ms: Optional[int] = None,
+        session_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Execute a sequence of actions on a page.
+
+        With a session_id, cookies and storage carry over between calls with
+        the same id (e.g. log in once, then navigate), and the page is not
+        reloaded if it is already at url. close_session() ends it.
         Actions schema:
         [
             {"type": "fill", "selector": "#user", "value": "admin"},
@@ -117,20 +642,18 @@ class BrowserTester:
         if not self.has_playwright:
             return {"error": "Playwright not installed."}
 
-        from playwright.sync_api import sync_playwright
         logs = []
         result = {"success": True, "logs": logs, "final_url": None, "title": None}
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                # Create context to hold cookies/session if needed (default is incognito-like)
-                context = browser.new_context()
-                page = context.new_page()
-                
-                logger.info(f"Navigating to {url}...")
-                page.goto(url, timeout=15000)
-                logs.append(f"Navigated to {url}")
+            # Without a session each call gets a fresh context (incognito-like)
+            page_cm = self._session_page(session_id, timeout_ms) if session_id else self._page(timeout_ms)
+            with page_cm as page:
+
+                if page.url != url:
+                    logger.info(f"Navigating to {url}...")
+                    page.goto(url, wait_until="domcontentloaded")
+                    logs.append(f"Navigated to {url}")
 
                 for i, action in enumerate(actions):
                     act_type = action.get("type")
@@ -176,11 +699,12 @@ class BrowserTester:
                 # Capture final state
                 result["final_url"] = page.url
                 result["title"] = page.title()
-                result["content_snippet"] = page.content()[:500]
-                
-                browser.close()
+                result["content_snippet"] = page.evaluate(_SNIPPET_JS)
 
         except Exception as e:
             return {"error": str(e), "logs": logs}
+        finally:
+            # The actions may have changed what the app serves
+            self.clear_cache()
         
         return result
@@ -6,25 +6,30 @@ to determine if a specific dependency is a legitimate risk or a false positive
 (e.g., a standard library or a well-known internal package).
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
+from string import Template
+from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
 logger = logging.getLogger(__name__)
 
 class SecurityAdvice(BaseModel):
+    # Frozen: cached verdicts are handed to every caller
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     decision: str = Field(description="One of: SAFE, SUSPICIOUS, DANGEROUS")
     reasoning: str = Field(description="Explanation for the decision")
-    reconciliation_steps: Optional[str] = Field(description="How to fix if suspicious/dangerous")
+    reconciliation_steps: Optional[str] = Field(default=None, description="How to fix if suspicious/dangerous")
 
 ADVISOR_PROMPT = """You are a Security Operations Center (SOC) Analyst.
 Your goal is to analyze a security alert for a software dependency.
 
 CONTEXT:
-- Task: {task}
-- Stack: {stack}
-- Flagged Package: {package}
-- Heuristic reasoning: {reasoning}
+- Task: $task
+- Stack: $stack
+- Flagged Package: $package
+- Heuristic reasoning: $reasoning
 
 DECISION CRITERIA:
 1. SAFE: The package is clearly a standard library (e.g., 'os', 'sys', 'json' in Python) or a highly-trusted, well-known package that the heuristic simply missed.
@@ -33,6 +38,10 @@ DECISION CRITERIA:
 
 Analyze the package name carefully. Respond using the provide tool."""
 
+_ADVISOR_TEMPLATE = Template(ADVISOR_PROMPT)
+# Shared by every consultation; never mutated
+_SYSTEM_MESSAGE = {"role": "system", "content": "You are an expert Security Advisor."}
+
 ADVISOR_TOOL = {
     "type": "function",
     "function": {
@@ -61,16 +70,28 @@ ADVISOR_TOOL = {
 }
 
 class SecurityAdvisor:
-    def __init__(self, provider: Any):
+    def __init__(self, provider: Any = None):
+        # The TaskExecutor injects its provider when loaded as a plugin
         self.provider = provider
+        # (package, stack) -> verdict. Standard-library and popular names
+        # get flagged over and over; each is only worth one LLM call.
+        self._cache: Dict[tuple, SecurityAdvice] = {}
 
     def advise(self, package: str, heuristic_reason: str, task: str, stack: str) -> SecurityAdvice:
         """
         Consult the LLM for a security opinion on a flagged package.
+
+        Verdicts are cached per (package, stack), except when the heuristic
+        cites a CVE, which always gets a fresh opinion.
         """
+        key = (package.lower(), stack.lower())
+        use_cache = "cve" not in heuristic_reason.lower()
+        if use_cache and key in self._cache:
+            return self._cache[key]
+
         logger.info(f"🛡️ Consulting Security Advisor for: {package}")
         
-        prompt = ADVISOR_PROMPT.format(
+        prompt = _ADVISOR_TEMPLATE.substitute(
             task=task,
             stack=stack,
             package=package,
@@ -78,7 +99,7 @@ class SecurityAdvisor:
         )
         
         messages = [
-            {"role": "system", "content": "You are an expert Security Advisor."},
+            _SYSTEM_MESSAGE,
             {"role": "user", "content": prompt}
         ]
         
@@ -91,15 +112,38 @@ class SecurityAdvisor:
             )
             
             args = res.arguments
-            return SecurityAdvice(
+            advice = SecurityAdvice(
                 decision=args.get("decision", "SUSPICIOUS").upper(),
                 reasoning=args.get("reasoning", "No reasoning provided"),
                 reconciliation_steps=args.get("reconciliation_steps")
             )
+            if use_cache:
+                self._cache[key] = advice
+            return advice
         except Exception as e:
             logger.error(f"Security Advisor failed: {e}")
-            # Fallback to suspicious on failure for safety
+            # Fallback to suspicious on failure for safety (not cached)
             return SecurityAdvice(
                 decision="SUSPICIOUS",
                 reasoning=f"Advisor failed to respond: {e}",
             )
+
+    async def advise_many(self, items: List[Dict[str, str]]) -> List[SecurityAdvice]:
+        """
+        Consult the LLM about several flagged packages concurrently.
+
+        items are advise() keyword arguments; results come back in the same
+        order. Providers are synchronous, so each consultation runs in a
+        worker thread, and a package flagged twice for the same stack is
+        only asked about once.
+        """
+        pending: Dict[tuple, asyncio.Future] = {}
+        for item in items:
+            key = (item["package"].lower(), item["stack"].lower())
+            if key not in pending:
+                pending[key] = asyncio.ensure_future(asyncio.to_thread(self.advise, **item))
+        await asyncio.gather(*pending.values())
+        return [
+            pending[(item["package"].lower(), item["stack"].lower())].result()
+            for item in items
+        ]
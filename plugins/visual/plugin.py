@@ -1,8 +1,25 @@
 import os
 import time
-import subprocess
+import importlib.util
 from typing import Dict, Any, Optional
 
+TAIL_BLOCK_SIZE = 8192
+
+def _tail(path: str, n: int) -> str:
+    """Last n lines of a file, read backwards in blocks from the end
+    (like tail -n), so cost doesn't grow with the size of the log."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        # n lines need n+1 newlines before the first one, unless the file
+        # ends in a newline, in which case the last one terminates line n
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(TAIL_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    return b"".join(data.splitlines(keepends=True)[-n:]).decode("utf-8", errors="replace")
+
 class VisualTool:
     """
     A tool that provides 'Visual Feedback' similar to Replit.
@@ -10,6 +27,24 @@ class VisualTool:
     This gives the agent immediate context on 'what the user sees' and 'what the server says'.
     """
 
+    def __init__(self, browser=None):
+        # BrowserTester to take screenshots with; the TaskExecutor injects its
+        # own so both tools share one warm browser
+        self.browser = browser
+
+    def _get_browser(self):
+        if self.browser is None:
+            # Standalone use: load the sibling browser_tester plugin
+            path = os.path.join(
+                os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                "browser_tester", "plugin.py",
+            )
+            spec = importlib.util.spec_from_file_location("plugin_browser_tester", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self.browser = module.BrowserTester()
+        return self.browser
+
     def quick_visual_check(self, url: str, log_file_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Captures a screenshot of the URL and reads the tail of the log file.
@@ -22,37 +57,21 @@ class VisualTool:
             "error": None
         }
 
-        # 1. Capture Screenshot using Playwright (via CLI for simplicity or python api)
-        # We will use the existing BrowserTester logic if available, or a simple subprocess wrapper
-        # For simplicity in this tool, let's assume we can run a python one-liner or simple script.
-        
-        screenshot_filename = f"screenshot_{int(time.time())}.png"
-        screenshot_path = os.path.abspath(screenshot_filename)
-        
-        try:
-            # We prefer using the python API directly if possible, but let's write a temporary script
-            # to avoid complex import issues if playwright isn't fully set up in this process.
-            # Actually, let's try to import playwright here.
-            from playwright.sync_api import sync_playwright
-            
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                page = browser.new_page()
-                try:
-                    page.goto(url, timeout=10000) # 10s timeout
-                    # Wait a bit for rendering
-                    page.wait_for_timeout(2000) 
-                    page.screenshot(path=screenshot_path)
-                    result["screenshot_path"] = screenshot_path
-                except Exception as e:
-                    result["error"] = f"Screenshot failed: {str(e)}"
-                finally:
-                    browser.close()
-
-        except ImportError:
+        # 1. Capture Screenshot through the BrowserTester, so a single warm
+        #    browser serves both tools
+        browser = self._get_browser()
+        if not browser.has_playwright:
             result["error"] = "Playwright not installed. Cannot take screenshot."
-        except Exception as e:
-            result["error"] = f"Unexpected error: {str(e)}"
+        else:
+            screenshot_path = browser.take_screenshot(
+                url,
+                code_path=os.path.abspath(f"screenshot_{int(time.time())}"),
+                settle_ms=2000,  # Wait a bit for rendering
+            )
+            if screenshot_path:
+                result["screenshot_path"] = screenshot_path
+            else:
+                result["error"] = "Screenshot failed."
 
         # 2. Read Log File
         if log_file_path:
@@ -60,9 +79,7 @@ class VisualTool:
                 try:
                     # Read last 50 lines
                     # Equivalent to tail -n 50
-                    with open(log_file_path, "r") as f:
-                        lines = f.readlines()
-                        result["logs"] = "".join(lines[-50:])
+                    result["logs"] = _tail(log_file_path, 50)
                 except Exception as e:
                     result["logs"] = f"Error reading log file: {str(e)}"
             else:
@@ -0,0 +1,77 @@
+import unittest
+from agent.verification.anti_mocking import (
+    AntiMockingValidator,
+    MockingViolation,
+)
+
+GOOD_TEST = """
+import unittest
+from agent.intent import classify
+
+class TestClassify(unittest.TestCase):
+    def test_classify(self):
+        self.assertEqual(classify("fix bug"), "fix")
+        assert classify("") is None
+"""
+
+TAUTOLOGICAL_TEST = """
+from unittest.mock import patch, MagicMock
+import agent.intent
+
+@patch("agent.intent.classify")
+def test_classify(mock_classify):
+    mock_classify.assert_called_once()
+"""
+
+class TestAntiMockingValidator(unittest.TestCase):
+
+    def test_valid_test(self):
+        analysis = AntiMockingValidator.analyze(GOOD_TEST, "agent.intent")
+        self.assertTrue(analysis.is_valid)
+        self.assertTrue(analysis.imports_sut)
+        self.assertEqual(analysis.assert_count, 2)
+        self.assertEqual(analysis.mock_count, 0)
+
+    def test_missing_sut_import(self):
+        analysis = AntiMockingValidator.analyze(
+            "def test_x():\n    assert 1 + 1 == 2\n", "agent.intent"
+        )
+        self.assertFalse(analysis.imports_sut)
+        self.assertIn("does not import SUT", analysis.violations[0])
+
+    def test_tautological_test(self):
+        analysis = AntiMockingValidator.analyze(TAUTOLOGICAL_TEST, "agent.intent")
+        self.assertTrue(analysis.imports_sut)
+        self.assertFalse(analysis.has_real_assertions)
+        self.assertEqual(analysis.violations, [
+            "Test has no real assertions. Every test must assert something.",
+            "Test mocks the SUT itself (agent.intent). "
+            "Mock dependencies, not the thing being tested.",
+        ])
+        self.assertEqual(analysis.mock_count, 2)
+        self.assertIn("Mock assertion found", analysis.warnings[0])
+
+    def test_commented_import_does_not_count(self):
+        content = "# from agent.intent import classify\ndef test_x():\n    assert True\n"
+        analysis = AntiMockingValidator.analyze(content, "agent.intent")
+        self.assertFalse(analysis.imports_sut)
+
+    def test_unparsable_test_falls_back_to_line_scan(self):
+        analysis = AntiMockingValidator.analyze(TAUTOLOGICAL_TEST + "def (:\n", "agent.intent")
+        self.assertTrue(analysis.imports_sut)
+        self.assertEqual(analysis.mock_count, 2)
+        self.assertEqual(len(analysis.violations), 2)
+
+    def test_cached_results_are_independent_copies(self):
+        first = AntiMockingValidator.analyze(TAUTOLOGICAL_TEST, "agent.intent", "a.py")
+        first.violations.clear()
+        second = AntiMockingValidator.analyze(TAUTOLOGICAL_TEST, "agent.intent", "b.py")
+        self.assertEqual(second.test_file, "b.py")
+        self.assertEqual(len(second.violations), 2)
+
+    def test_validate_raises(self):
+        with self.assertRaises(MockingViolation):
+            AntiMockingValidator.validate(TAUTOLOGICAL_TEST, "agent.intent", "t.py")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from agent.verification.ci_gate import CIGate, CIResult, CIStatus, MockCIGate
+
+class TestCIGate(unittest.TestCase):
+
+    def setUp(self):
+        self.ci = MockCIGate()
+        self.ci.set_status_for_sha("bad", CIStatus.FAILURE)
+        self.gate = CIGate(ci=self.ci)
+
+    def test_validate(self):
+        self.assertEqual(self.gate.validate("good").status, CIStatus.SUCCESS)
+        self.assertEqual(self.gate.validate("bad").status, CIStatus.FAILURE)
+
+    def test_mock_results_are_shared_until_reconfigured(self):
+        first = self.ci.get_status("good")
+        self.assertIs(self.ci.get_status("good"), first)
+        self.ci.set_status_for_sha("good", CIStatus.PENDING)
+        self.assertEqual(self.ci.get_status("good").status, CIStatus.PENDING)
+        run_id = self.ci.trigger_run("good")
+        self.assertEqual(self.ci.get_status("good").run_id, run_id)
+
+    def test_stale_run_fails_without_mutating_ci_result(self):
+        class StaleCI(MockCIGate):
+            def get_status(self, sha):
+                result = super().get_status(sha)
+                return CIResult(sha=sha, status=result.status, is_latest=False)
+        result = CIGate(ci=StaleCI()).validate("abc")
+        self.assertEqual(result.status, CIStatus.FAILURE)
+        self.assertEqual(result.details, "Stale CI run")
+
+    def test_validate_many_keeps_order(self):
+        pairs = [(sha, "base") for sha in ("good", "bad", "other", "bad")]
+        results = self.gate.validate_many(pairs)
+        self.assertEqual([r.sha for r in results], ["good", "bad", "other", "bad"])
+        self.assertEqual(
+            [r.status for r in results],
+            [CIStatus.SUCCESS, CIStatus.FAILURE, CIStatus.SUCCESS, CIStatus.FAILURE],
+        )
+
+    def test_validate_many_empty(self):
+        self.assertEqual(self.gate.validate_many([]), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from agent.verification import governance_self_test as gst
+
+class TestSelfTestReport(unittest.TestCase):
+
+    def test_counts_and_summary(self):
+        report = gst.SelfTestReport()
+        report.add_case(gst.SelfTestCase("a", "Cat", gst.TestResult.PASS, "ok"))
+        report.add_case(gst.SelfTestCase("b", "Cat", gst.TestResult.FAIL, "bad"))
+        report.add_case(gst.SelfTestCase("c", "Cat", gst.TestResult.SKIP))
+        self.assertEqual((report.passed, report.failed, report.total), (1, 1, 3))
+        self.assertFalse(report.all_passed)
+        self.assertEqual(report.summary().splitlines(), [
+            "Governance Self-Test: ❌ FAILURES DETECTED (1/3)",
+            "  ✅ [Cat] a: ok",
+            "  ❌ [Cat] b: bad",
+            "  ⏭️ [Cat] c: ",
+        ])
+
+    def test_counts_cases_passed_to_constructor(self):
+        report = gst.SelfTestReport(cases=[gst.SelfTestCase("a", "Cat", gst.TestResult.PASS)])
+        self.assertEqual(report.passed, 1)
+        self.assertTrue(report.all_passed)
+
+    def test_self_test_passes(self):
+        # The controller check writes decision logs under ./.agent_log; keep
+        # them out of the repo
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp.name)
+        report = gst.GovernanceSelfTest(cache_dir=None).run_all()
+        self.assertTrue(report.all_passed, report.summary())
+
+class TestSelfTestCache(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = tmp.name
+        self.calls = 0
+
+    def _table(self, passed):
+        def check():
+            self.calls += 1
+            return passed, "checked"
+        return (("Cat", "case", check),)
+
+    def _run(self, passed=True):
+        with patch.object(gst, "SELF_TEST_TABLE", self._table(passed)):
+            return gst.GovernanceSelfTest(cache_dir=self.cache_dir).run_all()
+
+    def test_passing_report_is_reused(self):
+        first = self._run()
+        second = self._run()
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(second.summary(), first.summary())
+
+    def test_failures_are_not_cached(self):
+        self._run(passed=False)
+        self.assertFalse(self._run(passed=False).all_passed)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_dependency_change_invalidates(self):
+        self._run()
+        with patch.object(gst, "_dependency_key", return_value="changed"):
+            self._run()
+        self.assertEqual(self.calls, 2)
+
+if __name__ == '__main__':
+    unittest.main()
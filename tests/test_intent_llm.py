@@ -212,6 +212,14 @@ class TestIntentClassifierFallback(unittest.TestCase):
         self.assertFalse(result.is_confident)
         self.assertTrue(result.requires_clarification)
 
+    def test_heuristic_overlapping_keywords(self):
+        """Keywords nested in others still count: "bug" inside "debug" is FIX."""
+        classifier = IntentClassifier(provider=None)
+        self.assertEqual(classifier.classify("debug the login").intent, TaskIntent.FIX)
+        # FIX outranks DEVELOP wherever the keywords appear
+        result = classifier.classify("add handling for the error case")
+        self.assertEqual(result.intent, TaskIntent.FIX)
+
     def test_heuristic_default(self):
         """Unknown input defaults to EXPLAIN with low confidence."""
         classifier = IntentClassifier(provider=None)
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from agent.verification.lsp_loop import BoundedLSPLoop, FailureType, LintResult
+
+class TestClassifyFailure(unittest.TestCase):
+
+    def test_categories(self):
+        cases = {
+            "SyntaxError: invalid syntax": FailureType.SYNTAX,
+            "IndentationError: unexpected indent": FailureType.SYNTAX,
+            "ruff: F401 unused import": FailureType.LINT,
+            "TypeError: f() missing 1 required positional argument": FailureType.TYPE_ERROR,
+            "TypeError: unsupported operand": FailureType.UNKNOWN,
+            "AssertionError: 1 != 2": FailureType.LOGIC,
+            "Killed": FailureType.RUNTIME,
+            "": FailureType.UNKNOWN,
+        }
+        for output, expected in cases.items():
+            self.assertEqual(BoundedLSPLoop.classify_failure(output), expected, output)
+
+    def test_precedence_follows_check_order(self):
+        # Lint outranks logic even when the logic keyword comes first
+        self.assertEqual(
+            BoundedLSPLoop.classify_failure("FAILED: mypy found errors"), FailureType.LINT
+        )
+
+class TestLintResult(unittest.TestCase):
+
+    def test_is_retryable(self):
+        retryable = {FailureType.SYNTAX, FailureType.LINT, FailureType.TYPE_ERROR}
+        for failure_type in FailureType:
+            result = LintResult(passed=False, failure_type=failure_type)
+            self.assertEqual(result.is_retryable, failure_type in retryable)
+        self.assertFalse(LintResult(passed=True).is_retryable)
+
+class TestPythonCheck(unittest.TestCase):
+
+    def _check(self, source: str) -> LintResult:
+        with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+            f.write(source)
+        self.addCleanup(os.remove, f.name)
+        return BoundedLSPLoop.run_linter(f.name)
+
+    def test_valid_file(self):
+        self.assertTrue(self._check("x = 1\n").passed)
+
+    def test_syntax_error(self):
+        result = self._check("def f(:\n    pass\n")
+        self.assertFalse(result.passed)
+        self.assertEqual(result.failure_type, FailureType.SYNTAX)
+        self.assertIn("line 1", result.errors[0])
+
+    def test_too_deeply_nested(self):
+        result = self._check("a" + ".b" * 300000 + "\n")
+        self.assertFalse(result.passed)
+        self.assertFalse(result.is_retryable)
+        self.assertIn("RecursionError", result.errors[0])
+        result = self._check("x = " + "-" * 200000 + "1\n")
+        self.assertFalse(result.passed)
+        self.assertIn("MemoryError", result.errors[0])
+
+    def test_missing_file(self):
+        result = BoundedLSPLoop.run_linter("/nonexistent/file.py")
+        self.assertEqual(result.failure_type, FailureType.UNKNOWN)
+
+    def test_cached_by_content(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+            f.write("x = 1\n")
+        self.addCleanup(os.remove, f.name)
+        BoundedLSPLoop.clear_lint_cache()
+        check = BoundedLSPLoop._run_python_check
+        with patch.object(BoundedLSPLoop, "_run_python_check", side_effect=check) as spy:
+            self.assertTrue(BoundedLSPLoop.run_linter(f.name).passed)
+            self.assertTrue(BoundedLSPLoop().run_linter(f.name).passed)
+            self.assertEqual(spy.call_count, 1)
+            with open(f.name, "w") as out:
+                out.write("x = (\n")
+            self.assertFalse(BoundedLSPLoop.run_linter(f.name).passed)
+            self.assertEqual(spy.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,18 @@ import unittest
 from unittest.mock import patch, MagicMock
 import tempfile
 import os
-from agent.security.preconditions import PreconditionChecker, PreconditionViolation
+from agent.security.preconditions import (
+    PreconditionChecker,
+    PreconditionViolation,
+    get_git_head,
+    check_git_consistency,
+)
 
 class TestPreconditions(unittest.TestCase):
 
+    def setUp(self):
+        get_git_head.cache_clear()
+
     @patch("agent.security.preconditions.subprocess.run")
     def test_git_head_capture(self, mock_run):
         # Setup mock
@@ -17,7 +25,30 @@ class TestPreconditions(unittest.TestCase):
         head = PreconditionChecker.get_git_head()
         self.assertEqual(head, "abcdef123456")
 
-    @patch("agent.security.preconditions.PreconditionChecker.get_git_head")
+    @patch("agent.security.preconditions.subprocess.run")
+    def test_git_head_is_memoized(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="abcdef123456\n")
+
+        self.assertEqual(get_git_head("."), "abcdef123456")
+        self.assertEqual(get_git_head("."), "abcdef123456")
+        self.assertEqual(mock_run.call_count, 1)
+
+        get_git_head.cache_clear()
+        get_git_head(".")
+        self.assertEqual(mock_run.call_count, 2)
+
+    @patch("agent.security.preconditions.subprocess.run")
+    def test_git_consistency_bypasses_cache(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="hash1\n")
+        self.assertEqual(get_git_head("."), "hash1")
+
+        # HEAD moves after it was memoized
+        mock_run.return_value = MagicMock(stdout="hash2\n")
+        violation = check_git_consistency("hash1")
+        self.assertIsNotNone(violation)
+        self.assertEqual(violation.check_type, "GIT_HEAD")
+
+    @patch("agent.security.preconditions.get_git_head")
     def test_git_consistency_check(self, mock_get_head):
         # Scenario 1: Match
         mock_get_head.return_value = "hash1"
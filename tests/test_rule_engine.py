@@ -29,6 +29,30 @@ class TestRuleEngine(unittest.TestCase):
             res = rule_engine.check(cmd)
             self.assertTrue(res.is_blocked, f"Should have blocked: {cmd}")
 
+    def test_blocked_match_reports_original_pattern(self):
+        """The fused blocked scan still reports which rule fired."""
+        originals = {p.pattern for p in rule_engine._blocked_patterns}
+        for cmd in ["sudo ls", "pbcopy < .env", "mkfs.ext4 /dev/sda1"]:
+            res = rule_engine.check(cmd)
+            self.assertIn(res.matched_pattern, originals)
+            self.assertIn(res.matched_pattern, res.reason)
+
+    def test_repeat_checks_hit_cache(self):
+        """Repeated commands are served from the LRU cache."""
+        first = rule_engine.check("  git reset --hard HEAD~1 ")
+        second = rule_engine.check("git reset --hard HEAD~1")
+        self.assertIs(first, second)
+        self.assertEqual(first.tier, RuleTier.GIT_REWRITE)
+
+    def test_gate_anchors_cover_every_rule(self):
+        """Every rule must mention a prefilter anchor, or the gate could skip it."""
+        rules = list(rule_engine._blocked_patterns) + [p for p, _ in rule_engine._tiers]
+        for pattern in rules:
+            self.assertTrue(
+                any(a in pattern.pattern for a in rule_engine.GATE_ANCHORS),
+                f"No gate anchor for rule: {pattern.pattern}",
+            )
+
     def test_safe_commands(self):
         """Test that safe commands are allowed."""
         cmds = [
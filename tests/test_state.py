@@ -0,0 +1,51 @@
+import unittest
+from agent.state import (
+    AgentState,
+    TaskIntent,
+    TERMINAL_STATES,
+    VALID_TRANSITIONS,
+    INTENT_ALLOWED_STATES,
+    validate_transition,
+)
+
+class TestValidateTransition(unittest.TestCase):
+
+    def test_matches_transition_tables(self):
+        # The bitmask tables must agree with the dicts for every combination
+        for current in AgentState:
+            for target in AgentState:
+                for intent in (None, *TaskIntent):
+                    expected = target in VALID_TRANSITIONS.get(current, set())
+                    if intent in INTENT_ALLOWED_STATES:
+                        expected = expected and target in INTENT_ALLOWED_STATES[intent]
+                    is_valid, _ = validate_transition(current, target, intent)
+                    self.assertEqual(is_valid, expected, (current, target, intent))
+
+    def test_illegal_transition_reason(self):
+        is_valid, reason = validate_transition(AgentState.IDLE, AgentState.COMPLETE)
+        self.assertFalse(is_valid)
+        self.assertIn("IDLE → COMPLETE", reason)
+        self.assertIn("INTENT_ANALYSIS", reason)
+
+    def test_terminal_states_have_no_exits(self):
+        for current in TERMINAL_STATES:
+            for target in AgentState:
+                is_valid, reason = validate_transition(current, target)
+                self.assertFalse(is_valid)
+                self.assertIn("terminal state", reason)
+
+    def test_intent_restriction_reason(self):
+        is_valid, reason = validate_transition(
+            AgentState.PLANNING, AgentState.IMPLEMENTING, TaskIntent.EXPLAIN
+        )
+        self.assertFalse(is_valid)
+        self.assertIn("not allowed for intent explain", reason)
+
+    def test_valid_transition(self):
+        self.assertEqual(
+            validate_transition(AgentState.IDLE, AgentState.INTENT_ANALYSIS),
+            (True, "OK"),
+        )
+
+if __name__ == '__main__':
+    unittest.main()
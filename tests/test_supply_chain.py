@@ -0,0 +1,61 @@
+import unittest
+from agent.security.supply_chain import SupplyChainChecker, _edit_distance
+
+class TestEditDistance(unittest.TestCase):
+    def test_known_distances(self):
+        cases = [
+            ("", "", 0),
+            ("abc", "", 3),
+            ("", "abc", 3),
+            ("requests", "requests", 0),
+            ("reqeusts", "requests", 2),
+            ("numpy2", "numpy", 1),
+            ("kitten", "sitting", 3),
+            ("flaw", "lawn", 2),
+        ]
+        for a, b, expected in cases:
+            self.assertEqual(_edit_distance(a, b), expected, f"{a!r} vs {b!r}")
+            self.assertEqual(_edit_distance(b, a), expected, f"{b!r} vs {a!r}")
+
+    def test_bounded_distance(self):
+        self.assertEqual(_edit_distance("abcdefgh", "zyxwvuts", max_dist=2), 3)
+        self.assertEqual(_edit_distance("reqeusts", "requests", max_dist=2), 2)
+        self.assertEqual(_edit_distance("kitten", "sitting", max_dist=5), 3)
+
+class TestSupplyChainChecker(unittest.TestCase):
+    def setUp(self):
+        self.checker = SupplyChainChecker()
+
+    def test_known_package_passes(self):
+        self.assertFalse(self.checker.check_dependency("Requests").is_suspicious)
+
+    def test_typosquat_flagged(self):
+        res = self.checker.check_dependency("reqeusts")
+        self.assertTrue(res.is_suspicious)
+        self.assertEqual(res.similar_to, "requests")
+        self.assertEqual(res.edit_distance, 2)
+
+    def test_suspicious_prefix_flagged(self):
+        res = self.checker.check_dependency("python-flask")
+        self.assertTrue(res.is_suspicious)
+        self.assertEqual(res.similar_to, "flask")
+
+    def test_result_keeps_original_name(self):
+        self.assertEqual(self.checker.check_dependency(" Reqeusts ").name, " Reqeusts ")
+
+    def test_custom_known_packages_are_normalized(self):
+        checker = SupplyChainChecker(known_packages={"MyInternalLib"})
+        self.assertFalse(checker.check_dependency("myinternallib").is_suspicious)
+        self.assertTrue(checker.check_dependency("myinternalib").is_suspicious)
+
+    def test_repeat_checks_are_cached(self):
+        self.checker.check_dependency("reqeusts")
+        self.checker.check_dependency("REQEUSTS")
+        info = self.checker._check_normalized.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_unrelated_name_passes(self):
+        self.assertFalse(self.checker.check_dependency("zzzzzzzz").is_suspicious)
+
+if __name__ == "__main__":
+    unittest.main()
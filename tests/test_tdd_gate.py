@@ -0,0 +1,65 @@
+import io
+import os
+import tempfile
+import unittest
+from agent.verification import tdd_gate
+from agent.verification.tdd_gate import TDDGate, TDDViolation
+
+TEST_CODE = "def test_add():\n    assert add(1, 2) == 3\n"
+
+class TestTDDGate(unittest.TestCase):
+
+    def setUp(self):
+        self.gate = TDDGate()
+        self.gate.register_test("test_add.py", TEST_CODE)
+
+    def test_red_then_green(self):
+        self.gate.assert_red("test_add.py", test_passed=False)
+        self.gate.assert_green("test_add.py", test_passed=True, current_content=TEST_CODE)
+        checkpoint = self.gate.get_checkpoint("test_add.py")
+        self.assertTrue(checkpoint.is_red and checkpoint.is_green)
+        self.assertTrue(checkpoint.integrity_ok)
+
+    def test_str_and_bytes_hash_alike(self):
+        self.assertEqual(TDDGate.hash_content(TEST_CODE), TDDGate.hash_content(TEST_CODE.encode()))
+        self.gate.assert_green("test_add.py", test_passed=True, current_content=TEST_CODE.encode())
+
+    def test_stream_api_matches_content_api(self):
+        gate = TDDGate()
+        checkpoint = gate.register_test_stream("t.py", io.BytesIO(TEST_CODE.encode()))
+        self.assertEqual(checkpoint.initial_hash, TDDGate.hash_content(TEST_CODE))
+        gate.assert_green_stream("t.py", True, io.BytesIO(TEST_CODE.encode()))
+        with self.assertRaises(tdd_gate.TestModifiedError):
+            gate.assert_green_stream("t.py", True, io.BytesIO(b"changed"))
+
+    def test_file_api_matches_content_api(self):
+        with tempfile.NamedTemporaryFile("wb", suffix=".py", delete=False) as f:
+            f.write(TEST_CODE.encode())
+        self.addCleanup(os.remove, f.name)
+        gate = TDDGate()
+        checkpoint = gate.register_test_file(f.name)
+        self.assertEqual(checkpoint.initial_hash, TDDGate.hash_content(TEST_CODE))
+        gate.assert_green_file(f.name, True)
+        with open(f.name, "a") as out:
+            out.write("    assert True\n")
+        with self.assertRaises(tdd_gate.TestModifiedError):
+            gate.assert_green_file(f.name, True)
+
+    def test_passing_red_test_rejected(self):
+        with self.assertRaises(tdd_gate.TestNotRedError):
+            self.gate.assert_red("test_add.py", test_passed=True)
+
+    def test_modified_test_rejected(self):
+        with self.assertRaises(tdd_gate.TestModifiedError):
+            self.gate.assert_green("test_add.py", True, TEST_CODE + "    assert True\n")
+
+    def test_failing_green_test_rejected(self):
+        with self.assertRaises(tdd_gate.TestNotGreenError):
+            self.gate.assert_green("test_add.py", False, TEST_CODE)
+
+    def test_unregistered_test(self):
+        with self.assertRaises(TDDViolation):
+            self.gate.assert_red("other.py", test_passed=False)
+
+if __name__ == '__main__':
+    unittest.main()
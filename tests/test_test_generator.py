@@ -0,0 +1,22 @@
+import unittest
+from agent.verification import test_generator
+
+class TestSpecsFromPlan(unittest.TestCase):
+
+    def test_names_derived_from_path(self):
+        [spec] = test_generator.TestGenerator.specs_from_plan(["agent/core/chat_session.py"])
+        self.assertEqual(spec.sut_module, "agent.core.chat_session")
+        self.assertEqual(spec.test_file, "tests/test_chat_session.py")
+        self.assertEqual(spec.test_class, "TestChatSession")
+        self.assertEqual(spec.test_methods[0], "test_chat_session_basic")
+
+    def test_only_py_suffix_is_stripped(self):
+        specs = test_generator.TestGenerator.specs_from_plan(["agent/pop.py", "happy.py"])
+        self.assertEqual([s.sut_module for s in specs], ["agent.pop", "happy"])
+
+    def test_skips_non_python_and_test_files(self):
+        specs = test_generator.TestGenerator.specs_from_plan(["README.md", "tests/test_x.py"])
+        self.assertEqual(specs, [])
+
+if __name__ == '__main__':
+    unittest.main()
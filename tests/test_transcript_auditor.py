@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from agent.verification.transcript_auditor import Transcript, TranscriptAuditor
+
+
+def _provider(content='```json\n{"pass": true, "violations": []}\n```'):
+    provider = MagicMock()
+    provider.complete.return_value = SimpleNamespace(content=content)
+    return provider
+
+
+class TestTranscript(unittest.TestCase):
+
+    def test_from_messages_defaults_role(self):
+        transcript = Transcript.from_messages([
+            {"role": "assistant", "content": "a"},
+            {"content": "b"},
+        ])
+        self.assertEqual(transcript.roles, ["assistant", "user"])
+        self.assertEqual(transcript.contents, ["a", "b"])
+        self.assertEqual(len(transcript), 2)
+
+
+class TestTranscriptAuditor(unittest.TestCase):
+
+    def test_transcript_and_dicts_give_same_prompt(self):
+        messages = [{"role": "user", "content": "use $HOME {x}"}, {"role": "assistant", "content": "ok"}]
+        from_dicts, from_columns = _provider(), _provider()
+        TranscriptAuditor(from_dicts).audit(messages, "done")
+        TranscriptAuditor(from_columns).audit(Transcript.from_messages(messages), "done")
+        self.assertEqual(from_dicts.complete.call_args, from_columns.complete.call_args)
+        prompt = from_dicts.complete.call_args[0][0][1]["content"]
+        self.assertIn("Turn 0 [USER]: use $HOME {x}\n---\nTurn 1 [ASSISTANT]: ok", prompt)
+
+    def test_parses_fenced_verdict(self):
+        provider = _provider('note\n```json\n{"pass": false, "violations": ["x"]}\n```')
+        result = TranscriptAuditor(provider).audit([{"role": "user", "content": "hi"}], "s")
+        self.assertEqual(result, {"pass": False, "violations": ["x"]})
+
+    def test_provider_failure_passes(self):
+        provider = MagicMock()
+        provider.complete.side_effect = RuntimeError("down")
+        result = TranscriptAuditor(provider).audit([], "s")
+        self.assertTrue(result["pass"])
+
+    def test_audit_many_keeps_order(self):
+        provider = MagicMock()
+        provider.complete.side_effect = lambda msgs: SimpleNamespace(
+            content='{"pass": %s}' % ("true" if "summary-pass" in msgs[1]["content"] else "false")
+        )
+        auditor = TranscriptAuditor(provider)
+        results = asyncio.run(auditor.audit_many([
+            ([{"role": "user", "content": "hi"}], "summary-pass"),
+            ([{"role": "user", "content": "hi"}], "summary-fail"),
+        ]))
+        self.assertEqual(results, [{"pass": True}, {"pass": False}])
+
+
+if __name__ == "__main__":
+    unittest.main()
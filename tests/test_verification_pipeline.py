@@ -0,0 +1,193 @@
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from agent.verification import verification_pipeline
+from agent.verification.verification_pipeline import VerificationPipeline, VerifyTier
+
+class TestSyntaxTier(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.pipeline = VerificationPipeline(project_dir=self.dir)
+
+    def _write(self, name: str, source: str):
+        path = os.path.join(self.dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(source)
+
+    def test_valid_files_pass(self):
+        self._write("ok.py", "x = 1\n")
+        self._write("pkg/mod.py", "def f():\n    return 1\n")
+        result = self.pipeline._check_syntax(["ok.py", "pkg/mod.py"])
+        self.assertEqual(result.tier, VerifyTier.SYNTAX)
+        self.assertTrue(result.passed)
+        self.assertEqual(result.details, "2 files checked")
+
+    def test_syntax_error_reported_relative_to_project(self):
+        self._write("ok.py", "x = 1\n")
+        self._write("bad.py", "def f(:\n    pass\n")
+        result = self.pipeline._check_syntax(["ok.py", "bad.py"])
+        self.assertFalse(result.passed)
+        self.assertEqual(len(result.errors), 1)
+        self.assertTrue(result.errors[0].startswith('bad.py: File "bad.py", line 1'))
+        self.assertIn("SyntaxError", result.errors[0])
+
+    def test_missing_file_is_an_error(self):
+        result = self.pipeline._check_syntax(["missing.py"])
+        self.assertFalse(result.passed)
+        self.assertIn("No such file", result.errors[0])
+
+    def test_process_pool_matches_serial(self):
+        names = []
+        for i in range(6):
+            names.append(f"m{i}.py")
+            self._write(names[-1], "def f(:\n" if i % 3 == 0 else "x = 1\n")
+        pipeline = VerificationPipeline(project_dir=self.dir, cache_syntax=False)
+        serial = pipeline._check_syntax(names)
+        with patch.object(verification_pipeline, "SYNTAX_WORKERS", 2), \
+                patch.object(verification_pipeline, "SYNTAX_PARALLEL_MIN_FILES", 1):
+            parallel = pipeline._check_syntax(names)
+        self.assertEqual(parallel.errors, serial.errors)
+        self.assertEqual(len(parallel.errors), 2)
+
+    def test_isolated_matches_in_process(self):
+        self._write("ok.py", "x = 1\n")
+        self._write("bad.py", "def f(:\n")
+        names = ["ok.py", "bad.py", "missing.py"]
+        in_process = VerificationPipeline(project_dir=self.dir, cache_syntax=False)
+        isolated = VerificationPipeline(project_dir=self.dir, cache_syntax=False, isolate_syntax=True)
+        with patch.object(verification_pipeline, "SYNTAX_BATCH_SIZE", 2):
+            self.assertEqual(isolated._check_syntax(names).errors, in_process._check_syntax(names).errors)
+
+    def test_too_deeply_nested_is_an_error(self):
+        self._write("deep.py", "a" + ".b" * 300000 + "\n")
+        self._write("minus.py", "x = " + "-" * 200000 + "1\n")
+        names = ["deep.py", "minus.py"]
+        pipeline = VerificationPipeline(project_dir=self.dir, cache_syntax=False)
+        serial = pipeline._check_syntax(names)
+        self.assertFalse(serial.passed)
+        self.assertIn("RecursionError", serial.errors[0])
+        self.assertIn("MemoryError", serial.errors[1])
+        with patch.object(verification_pipeline, "SYNTAX_WORKERS", 2), \
+                patch.object(verification_pipeline, "SYNTAX_PARALLEL_MIN_FILES", 1):
+            self.assertEqual(pipeline._check_syntax(names).errors, serial.errors)
+        isolated = VerificationPipeline(project_dir=self.dir, cache_syntax=False, isolate_syntax=True)
+        self.assertEqual(isolated._check_syntax(names).errors, serial.errors)
+
+    def _compile_count(self, pipeline, names):
+        compile_one = verification_pipeline._compile_one
+        with patch.object(verification_pipeline, "_compile_one", side_effect=compile_one) as spy:
+            result = pipeline._check_syntax(names)
+        return result, spy.call_count
+
+    def test_unchanged_files_not_recompiled(self):
+        self._write("ok.py", "x = 1\n")
+        self._write("bad.py", "def f(:\n")
+        first, compiled = self._compile_count(self.pipeline, ["ok.py", "bad.py"])
+        self.assertEqual(compiled, 2)
+        # A fresh pipeline reads the results persisted by the first one
+        again, compiled = self._compile_count(
+            VerificationPipeline(project_dir=self.dir), ["ok.py", "bad.py"]
+        )
+        self.assertEqual(compiled, 0)
+        self.assertEqual(again.errors, first.errors)
+
+    def test_changed_file_rechecked(self):
+        self._write("mod.py", "x = 1\n")
+        self.assertTrue(self.pipeline._check_syntax(["mod.py"]).passed)
+        self._write("mod.py", "def f(:\n    pass\n")
+        result, compiled = self._compile_count(self.pipeline, ["mod.py"])
+        self.assertEqual(compiled, 1)
+        self.assertFalse(result.passed)
+
+    def test_find_python_files_prunes_tool_dirs(self):
+        for name in ("a.py", "pkg/b.py", "pkg/notes.txt", ".venv/lib/c.py",
+                     "pkg/__pycache__/d.py", "node_modules/e.py", ".git/f.py"):
+            self._write(name, "x = 1\n")
+        found = sorted(self.pipeline._find_python_files())
+        self.assertEqual(found, ["a.py", os.path.join("pkg", "b.py")])
+
+class TestTestTier(unittest.TestCase):
+
+    def test_default_command_sharded_when_xdist_installed(self):
+        pipeline = VerificationPipeline()
+        with patch.object(verification_pipeline, "TEST_WORKERS", 4), \
+                patch.object(pipeline, "_xdist_available", return_value=True):
+            self.assertEqual(
+                pipeline._test_argv(),
+                ["python", "-m", "pytest", "tests/", "-v", "-n", "4", "--dist=loadfile"],
+            )
+        with patch.object(verification_pipeline, "TEST_WORKERS", 4), \
+                patch.object(pipeline, "_xdist_available", return_value=False):
+            self.assertEqual(pipeline._test_argv(), ["python", "-m", "pytest", "tests/", "-v"])
+
+    def test_xdist_probed_with_test_interpreter(self):
+        pipeline = VerificationPipeline()
+        with patch("subprocess.run") as run:
+            run.return_value.returncode = 1
+            self.assertFalse(pipeline._xdist_available("python"))
+            self.assertFalse(pipeline._xdist_available("python"))
+        run.assert_called_once()
+        self.assertEqual(run.call_args[0][0], ["python", "-c", "import xdist"])
+        self.assertFalse(VerificationPipeline()._xdist_available("/nonexistent/python"))
+
+    def test_custom_command_left_alone(self):
+        pipeline = VerificationPipeline(test_command="npm test")
+        with patch.object(verification_pipeline, "TEST_WORKERS", 4), \
+                patch.object(pipeline, "_xdist_available", return_value=True):
+            self.assertEqual(pipeline._test_argv(), ["npm", "test"])
+
+    def _run_tests(self, source: str):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        script = os.path.join(tmp.name, "fake_tests.py")
+        with open(script, "w") as f:
+            f.write(source)
+        pipeline = VerificationPipeline(test_command=f"{sys.executable} {script}")
+        with patch("sys.stdout", new_callable=io.StringIO) as out:
+            result = pipeline._check_tests()
+        return result, out.getvalue()
+
+    def test_output_streamed_and_tail_kept_on_failure(self):
+        source = "import sys\nfor i in range(500):\n    print(i)\nsys.exit(1)\n"
+        with patch.object(verification_pipeline, "TEST_OUTPUT_TAIL_LINES", 3):
+            result, printed = self._run_tests(source)
+        self.assertFalse(result.passed)
+        self.assertEqual(result.errors, ["497\n498\n499\n"])
+        self.assertEqual(printed.splitlines(), [str(i) for i in range(500)])
+
+    def test_passing_run(self):
+        result, printed = self._run_tests("print('1 passed')\n")
+        self.assertTrue(result.passed)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(printed, "1 passed\n")
+
+    def test_timeout_kills_run(self):
+        with patch.object(verification_pipeline, "TEST_TIMEOUT", 0.5):
+            result, _ = self._run_tests("import time\ntime.sleep(30)\n")
+        self.assertFalse(result.passed)
+        self.assertIn("timed out", result.details)
+
+    @unittest.skipUnless(os.name == "posix", "process groups are POSIX only")
+    def test_timeout_kills_workers_holding_the_pipe(self):
+        # Like an xdist worker: a child that inherits stdout and outlives a kill of its parent
+        source = (
+            "import subprocess, sys, time\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "time.sleep(30)\n"
+        )
+        start = time.monotonic()
+        with patch.object(verification_pipeline, "TEST_TIMEOUT", 0.5):
+            result, _ = self._run_tests(source)
+        self.assertLess(time.monotonic() - start, 10)
+        self.assertIn("timed out", result.details)
+
+if __name__ == '__main__':
+    unittest.main()
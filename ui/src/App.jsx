@@ -3,6 +3,9 @@ import { Prism as SyntaxHighlighter } from 'react-syntax-highlighter'
 import { oneLight } from 'react-syntax-highlighter/dist/esm/styles/prism'
 import './App.css'
 
+// A turn with no stream activity for this long is treated as lost
+const RUN_IDLE_TIMEOUT_MS = 10 * 60 * 1000
+
 function App() {
   const [theme, setTheme] = useState(() => localStorage.getItem('theme') || 'dark')
   const [session, setSession] = useState(null)
@@ -159,10 +162,51 @@ function App() {
 
     setMessages(prev => [...prev, tempMsg]);
 
+    // The turn runs in the background: /api/chat only returns a run_id and
+    // the final result (or error) arrives on the stream, tagged with it.
+    let runId = null
+    const outcomes = {}
+    let settleRun, failRun
+    const runDone = new Promise((resolve, reject) => { settleRun = resolve; failRun = reject })
+    runDone.catch(() => {}) // Reported where it is awaited, if it still is
+
+    // If the stream errors, closes or goes quiet, the outcome may still be
+    // buffered on the server: fetch it once, else fail the run.
+    let lostReason = null
+    let idleTimer = null
+    const abandonStream = async (reason) => {
+      eventSource.close()
+      clearTimeout(idleTimer)
+      lostReason = reason
+      if (!runId) return // Recovered once /api/chat returns the run_id
+      try {
+        const res = await fetch(`/api/run/${session.session_id}/${runId}`)
+        if (res.status === 200) return settleRun(await res.json())
+      } catch (e) {
+        console.error("Run result fetch failed", e)
+      }
+      failRun(new Error(reason))
+    }
+    const resetIdle = () => {
+      clearTimeout(idleTimer)
+      idleTimer = setTimeout(() => abandonStream('No response from the agent (timed out)'), RUN_IDLE_TIMEOUT_MS)
+    }
+    resetIdle()
+
+    eventSource.onerror = () => {
+      // EventSource fires this when the connection drops or the server ends
+      // the stream; don't let it reconnect and miss the outcome
+      if (!lostReason) abandonStream('Lost connection to the agent stream')
+    }
+
     eventSource.onmessage = (event) => {
+      resetIdle()
       try {
         const data = JSON.parse(event.data);
-        if (data.status) {
+        if (data.run_id) {
+          outcomes[data.run_id] = data
+          if (data.run_id === runId) settleRun(data)
+        } else if (data.status) {
           setMessages(prev => prev.map(msg => {
             if (msg.id === tempMsgId) {
               const prevPhases = msg.phases || [];
@@ -175,10 +219,11 @@ function App() {
             }
             return msg;
           }));
-        } else if (data.log) {
+        } else if (data.logs) {
+          // Log lines arrive batched, several per event
           setMessages(prev => prev.map(msg => {
             if (msg.id === tempMsgId) {
-              return { ...msg, logs: [...(msg.logs || []), data.log] };
+              return { ...msg, logs: [...(msg.logs || []), ...data.logs] };
             }
             return msg;
           }));
@@ -196,14 +241,21 @@ function App() {
       })
 
       if (res.status === 404) {
+        clearTimeout(idleTimer)
         eventSource.close()
         return handleDisconnect()
       }
 
       if (!res.ok) throw new Error(await res.text())
 
-      const data = await res.json()
+      runId = (await res.json()).run_id
+      if (outcomes[runId]) settleRun(outcomes[runId])
+      else if (lostReason) abandonStream(lostReason)
+      const outcome = await runDone
+      clearTimeout(idleTimer)
       eventSource.close()
+      if (outcome.error) throw new Error(outcome.error)
+      const data = outcome.result
 
       // Fetch diff after successful chat turn
       fetchDiff(session.session_id)
@@ -224,6 +276,7 @@ function App() {
       }));
 
     } catch (err) {
+      clearTimeout(idleTimer)
       eventSource.close()
       setMessages(prev => prev.map(msg => msg.id === tempMsgId ? {
         role: 'assistant',
@@ -323,7 +376,9 @@ function App() {
     try {
       const res = await fetch(`/api/files/content/${session.session_id}?path=${encodeURIComponent(path)}`)
       if (res.ok) {
-        const data = await res.json()
+        // Large files are streamed back as plain text instead of JSON
+        const isJson = (res.headers.get('content-type') || '').includes('application/json')
+        const data = isJson ? await res.json() : { content: await res.text(), path }
         setSelectedFile(data)
         setActiveTab('code')
       }
@@ -532,7 +587,7 @@ function App() {
         {/* ── Right Pane: Code Viewer & Diff ── */}
         <div className="code-display-pane">
           <div className="code-display-header">
-            <span>{selectedFile ? selectedFile.path.split('/').pop() : 'Workspace Changes'}</span>
+            <span>{selectedFile ? selectedFile.path.split('/').pop() + (selectedFile.truncated ? ' (truncated preview)' : '') : 'Workspace Changes'}</span>
             <div style={{ display: 'flex', gap: '0.5rem' }}>
               <button style={{ background: 'var(--bg-color)', border: '1px solid var(--glass-border)', color: 'var(--text-color)', padding: '0.2rem 0.6rem', borderRadius: '4px', fontSize: '0.75rem', cursor: 'pointer', fontWeight: 600 }}>Open</button>
               <button style={{ background: 'transparent', border: '1px solid var(--glass-border)', color: 'var(--text-color)', padding: '0.2rem 0.6rem', borderRadius: '4px', fontSize: '0.75rem', cursor: 'pointer', display: 'flex', alignItems: 'center', gap: '0.3rem' }}><span style={{ fontSize: '0.9rem' }}>⎇</span> Commit</button>